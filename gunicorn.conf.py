@@ -0,0 +1,14 @@
+import os
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(os.getenv("GUNICORN_WORKERS", "2"))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "120"))
+
+# В режиме asgi каждый воркер uvicorn обслуживает много соединений в
+# event loop, поэтому медленная загрузка или скачивание не занимает
+# воркер целиком. Режим требует группу зависимостей asgi.
+if os.getenv("DJANGO_SERVER_MODE", "wsgi") == "asgi":
+    wsgi_app = "src.config.asgi:application"
+    worker_class = "uvicorn_worker.UvicornWorker"
+else:
+    wsgi_app = "src.config.wsgi:application"
@@ -1,6 +1,7 @@
 from django.contrib import admin
 
 from src.apps.courses.models import Course, Module, Subject
+from src.apps.courses.paginator import EstimatedCountPaginator
 
 
 @admin.register(Subject)
@@ -9,9 +10,12 @@ class SubjectAdmin(admin.ModelAdmin):
         Subject.title.field.name,
         Subject.slug.field.name,
     ]
+    search_fields = [Subject.title.field.name]
     prepopulated_fields = {
         Subject.slug.field.name: (Subject.title.field.name,),
     }
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
 
 
 class ModuleInline(admin.StackedInline):
@@ -37,3 +41,7 @@ class CourseAdmin(admin.ModelAdmin):
         Course.slug.field.name: (Course.title.field.name,),
     }
     inlines = [ModuleInline]
+    # Поиск icontains использует триграммные индексы course_*_trgm_idx,
+    # а число строк без фильтров оценивается, а не считается.
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
@@ -5,3 +5,16 @@ class CoursesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "src.apps.courses"
     verbose_name = "Курсы"
+
+    def ready(self) -> None:
+        from src.apps.courses import registry
+        from src.apps.courses.models import File, Image, Text, Video
+
+        for model in (Text, Video, Image, File):
+            registry.register(model)
+
+        from src.apps.courses import signals  # noqa: F401
+
+        # Задачи регистрируются при импорте модуля; воркер без системных
+        # проверок (run_tasks --skip-checks) иначе не знал бы их.
+        from src.apps.courses import deletion, ordering  # noqa: F401
@@ -0,0 +1,52 @@
+import time
+
+from django.core.cache import cache
+
+FRAGMENT_TIMEOUT = 60 * 60 * 24
+
+
+def course_version_key(course_id: int) -> str:
+    return f"courses:course:{course_id}:version"
+
+
+def module_version_key(module_id: int) -> str:
+    return f"courses:module:{module_id}:version"
+
+
+def get_versions(*keys: str) -> dict[str, int]:
+    """
+    Возвращает счётчики версий для ключей фрагментного кэша.
+
+    Отсутствующий счётчик инициализируется текущим временем, а не
+    единицей, чтобы после вытеснения счётчика из кэша не совпасть с
+    версией уже закэшированного устаревшего фрагмента.
+    """
+    versions = cache.get_many(keys)
+    missing = {key: time.time_ns() for key in keys if key not in versions}
+    if missing:
+        cache.set_many(missing, timeout=None)
+        versions.update(missing)
+    return versions
+
+
+async def aget_versions(*keys: str) -> dict[str, int]:
+    """
+    Async-версия get_versions.
+    """
+    versions = await cache.aget_many(keys)
+    missing = {key: time.time_ns() for key in keys if key not in versions}
+    if missing:
+        await cache.aset_many(missing, timeout=None)
+        versions.update(missing)
+    return versions
+
+
+def bump_version(key: str) -> None:
+    """
+    Увеличивает счётчик версии, делая закэшированные фрагменты устаревшими.
+    """
+    cache.add(key, time.time_ns(), timeout=None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), timeout=None)
@@ -0,0 +1,138 @@
+from collections import defaultdict
+from datetime import datetime
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+from src.apps.courses.models import Content, Course, ItemBase, Module
+from src.apps.tasks.queue import task
+
+
+def mark_deleted(course: Course) -> None:
+    """
+    Помечает курс удалённым и ставит удаление его содержимого в очередь.
+    Курс сразу пропадает из Course.objects, а запрос не ждёт каскада.
+    """
+    with transaction.atomic():
+        course.deleted = timezone.now()
+        course.save(update_fields=["deleted"])
+        purge_course.enqueue(course_id=course.pk)
+
+
+def delete_contents(content_ids: list[int]) -> None:
+    """
+    Удаляет Content и их элементы. Content.item - GenericForeignKey,
+    поэтому CASCADE элементы не удаляет; элементы, на которые ещё
+    ссылается другой Content, остаются. Файлы File и Image освобождает
+    django_cleanup через фоновые задачи хранилища.
+    """
+    rows = Content.objects.filter(pk__in=content_ids).values_list(
+        "content_type_id",
+        "object_id",
+    )
+    items: dict[int, list[int]] = defaultdict(list)
+    for content_type_id, object_id in rows:
+        items[content_type_id].append(object_id)
+    Content.objects.filter(pk__in=content_ids).delete()
+
+    for content_type_id, object_ids in items.items():
+        model = ContentType.objects.get_for_id(content_type_id).model_class()
+        if model is None:
+            continue
+        referenced = Content.objects.filter(
+            content_type_id=content_type_id,
+            object_id__in=object_ids,
+        ).values("object_id")
+        model._default_manager.filter(pk__in=object_ids).exclude(
+            pk__in=referenced,
+        ).delete()
+
+
+def delete_orphans(
+    model: type[ItemBase],
+    *,
+    created_before: datetime,
+    batch_size: int,
+) -> int:
+    """
+    Удаляет элементы model, на которые не ссылается ни один Content, и
+    возвращает их число.
+
+    Сироты ищутся через NOT EXISTS по индексу content_item_idx, пачки
+    выбираются по возрастанию pk от последнего просмотренного, так что
+    каждая пачка - короткая транзакция с блокировкой только своих строк.
+    Элементы новее created_before не трогаются: их Content мог ещё не
+    быть создан.
+    """
+    content_type = ContentType.objects.get_for_model(model)
+    orphans = model._default_manager.filter(
+        ~Exists(
+            Content.objects.filter(
+                content_type=content_type,
+                object_id=OuterRef("pk"),
+            ),
+        ),
+        created__lt=created_before,
+    )
+    deleted = 0
+    last_pk = 0
+    while True:
+        with transaction.atomic():
+            pks = list(
+                orphans.filter(pk__gt=last_pk)
+                .order_by("pk")
+                .values_list("pk", flat=True)[:batch_size],
+            )
+            if not pks:
+                return deleted
+            last_pk = pks[-1]
+            # Условие проверяется ещё раз при удалении: Content мог
+            # появиться после выборки.
+            _, counts = orphans.filter(pk__in=pks).delete()
+            deleted += counts.get(model._meta.label, 0)
+
+
+@task()
+def purge_course(course_id: int) -> None:
+    """
+    Удаляет помеченный курс: контент, модули и сам курс пачками по
+    COURSE_DELETE_BATCH_SIZE, каждая в своей транзакции, чтобы не
+    держать долгих блокировок. Задача идемпотентна: после сбоя повтор
+    продолжает с оставшихся строк.
+    """
+    batch_size = settings.COURSE_DELETE_BATCH_SIZE
+    # Чтение внутри транзакции идёт с основной БД, а не с реплики,
+    # которая может ещё не видеть удаление предыдущей пачки.
+    with transaction.atomic():
+        if not Course.all_objects.filter(
+            pk=course_id,
+            deleted__isnull=False,
+        ).exists():
+            return
+
+    while True:
+        with transaction.atomic():
+            content_ids = list(
+                Content.objects.filter(module__course_id=course_id)
+                .order_by("pk")
+                .values_list("pk", flat=True)[:batch_size],
+            )
+            if not content_ids:
+                break
+            delete_contents(content_ids)
+
+    while True:
+        with transaction.atomic():
+            module_ids = list(
+                Module.objects.filter(course_id=course_id)
+                .order_by("pk")
+                .values_list("pk", flat=True)[:batch_size],
+            )
+            if not module_ids:
+                break
+            Module.objects.filter(pk__in=module_ids).delete()
+
+    Course.all_objects.filter(pk=course_id).delete()
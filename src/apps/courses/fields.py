@@ -1,41 +1,196 @@
+import zlib
 from typing import Any
 
-from django.core.exceptions import ObjectDoesNotExist
-from django.db import models
+from django.db import connection, models
+from django.db.models import Max, Subquery, Value
+from django.db.models.functions import Coalesce
 
 
 class OrderField(models.PositiveIntegerField):
     """
     Поле для автоматического определения порядка объектов.
+
+    Следующее значение вычисляется подзапросом MAX(order) + 1 прямо
+    внутри INSERT, поэтому создание объекта стоит один запрос. Внутри
+    транзакции на PostgreSQL перед вставкой берётся advisory-блокировка
+    на родителя (значения for_fields), что исключает одинаковые order
+    при параллельных вставках.
+
+    При step > 1 ключи разрежены: первый объект получает step, следующие
+    MAX(order) + step, а вставка в середину (place) берёт значение между
+    соседями и меняет только одну строку. Когда зазор между соседями
+    почти исчерпан, группа перенумеровывается фоновой задачей; в запросе
+    перенумерация нужна, только если задача ещё не успела выполниться.
     """
 
     def __init__(
         self,
         for_fields: Any = None,
         *args: Any,
+        step: int = 1,
         **kwargs: Any,
     ) -> None:
         self.for_fields = for_fields
+        self.step = step
         super().__init__(*args, **kwargs)
 
-    def pre_save(self, model_instance: models.Model, add: bool) -> int:
+    def deconstruct(self) -> Any:
+        name, path, args, kwargs = super().deconstruct()
+        if self.step != 1:
+            kwargs["step"] = self.step
+        return name, path, args, kwargs
+
+    @property
+    def db_returning(self) -> bool:
+        return connection.features.can_return_columns_from_insert
+
+    def pre_save(self, model_instance: models.Model, add: bool) -> Any:
         if getattr(model_instance, self.attname) is None:
-            try:
-                qs = self.model._default_manager.all()
-                if self.for_fields:
-                    query = {
-                        field: getattr(model_instance, field)
-                        for field in self.for_fields
-                    }
-                    qs = qs.filter(**query)
-                last_item = qs.latest(self.attname) if qs.exists() else None
-                if last_item:
-                    value = getattr(last_item, self.attname) + 1
-                else:
-                    value = 0
-            except ObjectDoesNotExist:
-                value = 0
+            self.lock_siblings(model_instance)
+            if add and self.db_returning:
+                value = self.next_value_expression(model_instance)
+            else:
+                value = self.siblings(model_instance).aggregate(
+                    value=Coalesce(
+                        Max(self.attname) + self.step,
+                        self.first_key,
+                    ),
+                )["value"]
             setattr(model_instance, self.attname, value)
             return value
         else:
             return super().pre_save(model_instance, add)
+
+    def parent_lookup(self, model_instance: models.Model) -> dict[str, Any]:
+        """
+        Значения полей for_fields экземпляра. Для внешних ключей берётся
+        attname, чтобы не загружать связанный объект.
+        """
+        lookup = {}
+        for name in self.for_fields or []:
+            field = self.model._meta.get_field(name)
+            attname = getattr(field, "attname", name)
+            lookup[attname] = getattr(model_instance, attname)
+        return lookup
+
+    def siblings(self, model_instance: models.Model) -> models.QuerySet:
+        return self.model._default_manager.filter(
+            **self.parent_lookup(model_instance),
+        ).order_by()
+
+    def next_value_expression(
+        self,
+        model_instance: models.Model,
+    ) -> Coalesce:
+        last = self.siblings(model_instance).order_by(f"-{self.attname}")
+        return Coalesce(
+            Subquery(last.values(self.attname)[:1]) + Value(self.step),
+            Value(self.first_key),
+            output_field=models.PositiveIntegerField(),
+        )
+
+    def place(self, model_instance: models.Model, position: int) -> int:
+        """
+        Устанавливает экземпляру ключ, ставящий его на позицию position
+        среди соседей. Ключ берётся между соседними, поэтому сохранять
+        нужно только сам экземпляр. Вызывать внутри транзакции.
+        """
+        self.lock_siblings(model_instance)
+        siblings = self.siblings(model_instance)
+        if model_instance.pk is not None:
+            siblings = siblings.exclude(pk=model_instance.pk)
+        keys = list(
+            siblings.order_by(self.attname).values_list(
+                self.attname,
+                flat=True,
+            )[max(position - 1, 0) : position + 1],
+        )
+        if position == 0:
+            lower, upper = None, keys[0] if keys else None
+        elif keys:
+            lower, upper = keys[0], keys[1] if len(keys) > 1 else None
+        else:
+            lower = siblings.aggregate(value=Max(self.attname))["value"]
+            upper = None
+
+        floor = -1 if lower is None else lower
+        if upper is None:
+            value = self.first_key if lower is None else lower + self.step
+        elif upper - floor > 1:
+            value = (floor + upper + 1) // 2
+            if min(value - floor, upper - value) <= 1:
+                self.schedule_rebalance(model_instance)
+        else:
+            value = self.rebalance(siblings, hole=position)
+        setattr(model_instance, self.attname, value)
+        return value
+
+    def schedule_rebalance(self, model_instance: models.Model) -> None:
+        """
+        Ставит в очередь перенумерацию группы экземпляра, чтобы следующие
+        вставки рядом снова меняли одну строку.
+        """
+        from src.apps.courses.ordering import rebalance_order
+
+        rebalance_order.enqueue(
+            model=self.model._meta.label_lower,
+            field=self.name,
+            lookup=self.parent_lookup(model_instance),
+        )
+
+    @property
+    def first_key(self) -> int:
+        """
+        Ключ первого объекта группы. Разреженные ключи начинаются со step,
+        а не с нуля, чтобы перед первым объектом оставался зазор.
+        """
+        return 0 if self.step == 1 else self.step
+
+    def key(self, index: int) -> int:
+        """
+        Ключ index-го объекта при сплошной нумерации.
+        """
+        return self.first_key + index * self.step
+
+    def rebalance(
+        self,
+        siblings: models.QuerySet,
+        hole: int | None = None,
+    ) -> int:
+        """
+        Перенумеровывает группу с шагом step одним UPDATE. Если передан
+        hole, позиция hole остаётся свободной, и возвращается её ключ.
+        """
+        objects = list(siblings.order_by(self.attname, "pk").only("pk"))
+        if hole is not None:
+            hole = min(hole, len(objects))
+        for index, obj in enumerate(objects):
+            slot = index + 1 if hole is not None and index >= hole else index
+            setattr(obj, self.attname, self.key(slot))
+        self.model._default_manager.bulk_update(objects, [self.attname])
+        return self.key(hole or 0)
+
+    def lock_siblings(self, model_instance: models.Model) -> None:
+        self.lock_group(self.parent_lookup(model_instance))
+
+    def lock_group(self, lookup: dict[str, Any]) -> None:
+        """
+        Берёт транзакционную advisory-блокировку на группу объектов
+        с одинаковыми for_fields. Вне транзакции блокировка бессмысленна
+        (снимается сразу после запроса), поэтому не берётся.
+        """
+        if connection.vendor != "postgresql" or not connection.in_atomic_block:
+            return
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT pg_advisory_xact_lock(%s, %s)",
+                [
+                    self._lock_key(self.model._meta.db_table),
+                    self._lock_key(repr(sorted(lookup.items()))),
+                ],
+            )
+
+    @staticmethod
+    def _lock_key(value: str) -> int:
+        key = zlib.crc32(value.encode())
+        return key - 2**32 if key >= 2**31 else key
@@ -0,0 +1,127 @@
+import logging
+import os
+from io import BytesIO
+from typing import Any
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import transaction
+from PIL import Image as PILImage
+from PIL import ImageOps, UnidentifiedImageError
+
+from src.apps.courses.models import Image
+from src.apps.courses.storage import blob_storage
+from src.apps.tasks.queue import task
+
+logger = logging.getLogger(__name__)
+
+
+def variant_formats() -> list[str]:
+    """
+    Форматы из IMAGE_VARIANT_FORMATS, которые умеет сохранять Pillow.
+    """
+    PILImage.init()
+    return [
+        fmt
+        for fmt in settings.IMAGE_VARIANT_FORMATS
+        if fmt.upper() in PILImage.SAVE
+    ]
+
+
+def variant_widths(width: int) -> list[int]:
+    """
+    Ширины вариантов для изображения шириной width: все заданные ширины
+    меньше исходной и сама исходная, если она не больше наибольшей.
+    Изображение никогда не увеличивается.
+    """
+    widths = [w for w in settings.IMAGE_VARIANT_WIDTHS if w < width]
+    if width <= max(settings.IMAGE_VARIANT_WIDTHS):
+        widths.append(width)
+    return widths
+
+
+def generate_variants(image: Image) -> list[dict[str, Any]]:
+    """
+    Создаёт уменьшенные копии изображения во всех форматах и сохраняет
+    их в хранилище blobs. Для файла, который Pillow не может открыть,
+    вариантов нет.
+    """
+    storage = blob_storage()
+    stem, _ = os.path.splitext(os.path.basename(image.file.name or ""))
+    variants: list[dict[str, Any]] = []
+    try:
+        with image.file.open("rb"), PILImage.open(image.file) as original:
+            source = ImageOps.exif_transpose(original)
+            if source.mode not in ("RGB", "RGBA"):
+                source = source.convert(
+                    "RGBA" if source.has_transparency_data else "RGB",
+                )
+            for width in variant_widths(source.width):
+                height = max(1, round(source.height * width / source.width))
+                resized = source.resize(
+                    (width, height),
+                    PILImage.Resampling.LANCZOS,
+                )
+                for fmt in variant_formats():
+                    buffer = BytesIO()
+                    resized.save(
+                        buffer,
+                        fmt.upper(),
+                        quality=settings.IMAGE_VARIANT_QUALITY,
+                    )
+                    name = storage.save(
+                        f"{stem}-{width}.{fmt}",
+                        ContentFile(buffer.getvalue()),
+                    )
+                    variants.append(
+                        {
+                            "name": name,
+                            "format": fmt,
+                            "width": width,
+                            "height": height,
+                        },
+                    )
+    except (
+        FileNotFoundError,
+        UnidentifiedImageError,
+        PILImage.DecompressionBombError,
+    ):
+        logger.warning("Cannot generate variants for image %s", image.pk)
+        release_variants(variants)
+        return []
+    except Exception:
+        release_variants(variants)
+        raise
+    return variants
+
+
+def release_variants(variants: list[dict[str, Any]] | None) -> None:
+    storage = blob_storage()
+    for variant in variants or []:
+        storage.delete(variant["name"])
+
+
+@task(queue="images")
+def process_image(pk: int) -> None:
+    """
+    Создаёт варианты изображения, если они ещё не созданы. Если файл
+    успели заменить, пока варианты создавались, они отбрасываются: для
+    нового файла уже поставлена своя задача.
+    """
+    with transaction.atomic():
+        image = Image.objects.filter(pk=pk, variants__isnull=True).first()
+    if image is None or not image.file:
+        return
+    variants = generate_variants(image)
+
+    with transaction.atomic():
+        current = (
+            Image.objects.select_for_update()
+            .filter(pk=pk, file=image.file.name, variants__isnull=True)
+            .first()
+        )
+        if current is None:
+            release_variants(variants)
+            return
+        current.variants = variants
+        current.save(update_fields=["variants"])
@@ -0,0 +1,162 @@
+import statistics
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from django.conf import settings
+from django.contrib.auth import (
+    BACKEND_SESSION_KEY,
+    HASH_SESSION_KEY,
+    SESSION_KEY,
+)
+from django.contrib.auth.models import User
+from django.contrib.sessions.backends.db import SessionStore
+from django.core.management.base import (
+    BaseCommand,
+    CommandError,
+    CommandParser,
+)
+from django.urls import reverse
+
+from src.apps.courses.models import Module
+
+
+class NoRedirectHandler(urllib.request.HTTPRedirectHandler):
+    """
+    Не следует редиректам: ответ 3xx (например, на страницу входа при
+    устаревшей сессии) считается ошибкой, а не успешным запросом.
+    """
+
+    def redirect_request(self, *args: Any, **kwargs: Any) -> None:
+        return None
+
+
+class Command(BaseCommand):
+    help = (
+        "Сравнивает пропускную способность запущенных развёртываний "
+        "(например, WSGI и ASGI на одной базе после seed_courses) при "
+        "параллельных запросах к представлениям чтения."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--target",
+            action="append",
+            required=True,
+            help="Имя и адрес развёртывания: wsgi=http://localhost:8000.",
+        )
+        parser.add_argument(
+            "--username",
+            required=True,
+            help="Владелец курсов, от имени которого идут запросы.",
+        )
+        parser.add_argument(
+            "--path",
+            action="append",
+            help="Путь для замера; по умолчанию главная, список курсов "
+            "и контент первого модуля пользователя.",
+        )
+        parser.add_argument("--concurrency", type=int, default=32)
+        parser.add_argument("--requests", type=int, default=500)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        try:
+            user = User.objects.get(username=options["username"])
+        except User.DoesNotExist:
+            raise CommandError(f"User {options['username']} not found")
+        cookie = f"{settings.SESSION_COOKIE_NAME}={self.login(user)}"
+        paths = options["path"] or self.default_paths(user)
+
+        self.stdout.write(
+            f"{'target':<10} {'path':<40} {'ok/s':>8} {'p50 ms':>8} "
+            f"{'p95 ms':>8} {'p99 ms':>8} {'errors':>7}",
+        )
+        for target in options["target"]:
+            name, _, base_url = target.partition("=")
+            for path in paths:
+                result = self.run(
+                    base_url.rstrip("/") + path,
+                    cookie,
+                    options["concurrency"],
+                    options["requests"],
+                )
+                self.stdout.write(
+                    f"{name:<10} {path:<40} {result['rps']:>8.1f} "
+                    f"{result['p50']:>8.1f} {result['p95']:>8.1f} "
+                    f"{result['p99']:>8.1f} {result['errors']:>7}",
+                )
+
+    def login(self, user: User) -> str:
+        """
+        Создаёт сессию пользователя напрямую в БД, чтобы оба развёртывания
+        получали одинаковый аутентифицированный запрос.
+        """
+        session = SessionStore()
+        session[SESSION_KEY] = str(user.pk)
+        session[BACKEND_SESSION_KEY] = settings.AUTHENTICATION_BACKENDS[0]
+        session[HASH_SESSION_KEY] = user.get_session_auth_hash()
+        session.create()
+        return str(session.session_key)
+
+    def default_paths(self, user: User) -> list[str]:
+        paths = [
+            reverse("homepage:homepage"),
+            reverse("courses:manage_course_list"),
+        ]
+        module = (
+            Module.objects.filter(course__owner=user)
+            .order_by("course_id", "order")
+            .first()
+        )
+        if module is not None:
+            paths.append(
+                reverse("courses:module_content_list", args=[module.pk]),
+            )
+        return paths
+
+    def run(
+        self,
+        url: str,
+        cookie: str,
+        concurrency: int,
+        requests: int,
+    ) -> dict[str, Any]:
+        opener = urllib.request.build_opener(NoRedirectHandler)
+
+        def fetch(_: int) -> float | None:
+            """
+            Время успешного (2xx) ответа; None для ошибок и прочих
+            статусов, urllib поднимает для них HTTPError.
+            """
+            request = urllib.request.Request(url, headers={"Cookie": cookie})
+            start = time.perf_counter()
+            try:
+                with opener.open(request, timeout=60) as response:
+                    response.read()
+            except (urllib.error.URLError, TimeoutError):
+                return None
+            return time.perf_counter() - start
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = list(executor.map(fetch, range(requests)))
+        elapsed = time.perf_counter() - start
+
+        latencies = sorted(
+            result * 1000 for result in results if result is not None
+        )
+        # Пропускная способность считается только по успешным ответам:
+        # быстрые ошибки не должны выглядеть как производительность.
+        rps = len(latencies) / elapsed
+        if len(latencies) < 2:
+            latencies = [0.0, 0.0]
+        quantiles = statistics.quantiles(latencies, n=100)
+        return {
+            "rps": rps,
+            "p50": statistics.median(latencies),
+            "p95": quantiles[94],
+            "p99": quantiles[98],
+            "errors": results.count(None),
+        }
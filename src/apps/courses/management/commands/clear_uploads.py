@@ -0,0 +1,57 @@
+import time
+from datetime import timedelta
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+from django.db.models import Q
+from django.utils import timezone
+
+from src.apps.courses.models import Upload
+from src.apps.courses.uploads import staging_dir
+
+
+class Command(BaseCommand):
+    help = (
+        "Удаляет брошенные возобновляемые загрузки старше --max-age часов "
+        "и оставшиеся от них или от прерванных запросов файлы в "
+        "UPLOAD_STAGING_DIR. Запускается по расписанию."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--max-age",
+            type=int,
+            default=settings.UPLOAD_EXPIRE_HOURS,
+            help="Возраст загрузки в часах, после которого она удаляется.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        max_age = timedelta(hours=options["max_age"])
+        now = timezone.now()
+        expired = Upload.objects.filter(created__lt=now - max_age).filter(
+            Q(locked_until__isnull=True) | Q(locked_until__lt=now),
+        )
+        uploads = 0
+        for upload in expired.only("pk"):
+            upload.path.unlink(missing_ok=True)
+            upload.delete()
+            uploads += 1
+
+        # Файлы без строки Upload: загрузки, удалённые вместе с
+        # пользователем, и временные файлы процессов, убитых во время
+        # приёма запроса.
+        known = {
+            f"{pk}.part" for pk in Upload.objects.values_list("pk", flat=True)
+        }
+        deadline = time.time() - max_age.total_seconds()
+        files = 0
+        for path in staging_dir().iterdir():
+            if (
+                path.is_file()
+                and path.name not in known
+                and path.stat().st_mtime < deadline
+            ):
+                path.unlink(missing_ok=True)
+                files += 1
+        self.stdout.write(f"Deleted {uploads} uploads and {files} files")
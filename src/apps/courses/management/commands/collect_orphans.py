@@ -0,0 +1,49 @@
+from datetime import timedelta
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+from django.utils import timezone
+
+from src.apps.courses import registry
+from src.apps.courses.deletion import delete_orphans
+from src.apps.courses.models import ItemBase
+
+
+class Command(BaseCommand):
+    help = (
+        "Удаляет элементы контента (Text, File, Image, Video и другие "
+        "зарегистрированные типы), не привязанные ни к одному модулю, "
+        "вместе с их файлами. Можно запускать по расписанию на рабочей "
+        "базе: строки удаляются короткими пачками."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--min-age",
+            type=int,
+            default=60,
+            help="Не трогать элементы, созданные меньше указанного числа "
+            "минут назад.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.COURSE_DELETE_BATCH_SIZE,
+            help="Сколько элементов удаляется за одну транзакцию.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        created_before = timezone.now() - timedelta(
+            minutes=options["min_age"],
+        )
+        for model_name in registry.model_names():
+            entry = registry.get(model_name)
+            if entry is None or not issubclass(entry.model, ItemBase):
+                continue
+            deleted = delete_orphans(
+                entry.model,
+                created_before=created_before,
+                batch_size=options["batch_size"],
+            )
+            self.stdout.write(f"{model_name}: deleted {deleted}")
@@ -0,0 +1,61 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Sum
+
+from src.apps.courses.models import Blob, File, FileItemBase, Image
+from src.apps.courses.storage import release_blob
+from src.apps.courses.uploads import file_checksum
+
+FILE_MODELS: tuple[type[FileItemBase], ...] = (File, Image)
+
+
+class Command(BaseCommand):
+    help = (
+        "Переносит файлы File и Image, загруженные до перехода на "
+        "контентно-адресуемое хранилище, в blobs/: одинаковые файлы "
+        "остаются в одном экземпляре, прежние копии удаляются."
+    )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        for model in FILE_MODELS:
+            moved = missing = 0
+            pks = list(
+                model._default_manager.exclude(file="")
+                .exclude(file__startswith="blobs/")
+                .values_list("pk", flat=True),
+            )
+            for pk in pks:
+                if self.move(model, pk):
+                    moved += 1
+                else:
+                    missing += 1
+            self.stdout.write(
+                f"{model._meta.model_name}: moved {moved}, missing {missing}",
+            )
+
+        totals = Blob.objects.aggregate(size=Sum("size"), refs=Sum("refs"))
+        self.stdout.write(
+            f"{Blob.objects.count()} blobs, {totals['size'] or 0} bytes, "
+            f"{totals['refs'] or 0} references",
+        )
+
+    def move(self, model: type[FileItemBase], pk: int) -> bool:
+        item = model._default_manager.only("file").get(pk=pk)
+        storage = item.file.storage
+        old_name = item.file.name
+        if not old_name or not storage.exists(old_name):
+            return False
+
+        with storage.open(old_name) as content, transaction.atomic():
+            name = storage.save(old_name, content)
+            model._default_manager.filter(pk=pk).update(
+                file=name,
+                checksum=file_checksum(content),
+            )
+        # storage.delete только ставит release_blob в очередь; команда
+        # выполняет его сразу, и у прежнего файла нет строки Blob,
+        # поэтому он удаляется с диска, не дожидаясь воркера.
+        release_blob(name=old_name)
+        return True
@@ -0,0 +1,38 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from src.apps.courses.images import process_image, release_variants
+from src.apps.courses.models import Image
+
+
+class Command(BaseCommand):
+    help = (
+        "Создаёт уменьшенные копии изображений, для которых они ещё не "
+        "созданы, например загруженных до появления вариантов, не "
+        "дожидаясь воркера очереди."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Пересоздать варианты всех изображений, например после "
+            "изменения IMAGE_VARIANT_WIDTHS.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if options["force"]:
+            processed = Image.objects.filter(variants__isnull=False)
+            for image in processed.only("variants"):
+                release_variants(image.variants)
+                Image.objects.filter(pk=image.pk).update(variants=None)
+
+        pks = list(
+            Image.objects.filter(variants__isnull=True)
+            .exclude(file="")
+            .values_list("pk", flat=True),
+        )
+        for pk in pks:
+            process_image(pk=pk)
+        self.stdout.write(f"Processed {len(pks)} images")
@@ -0,0 +1,247 @@
+import itertools
+import uuid
+from collections.abc import Iterable, Iterator
+from typing import Any, TypeVar
+
+from django.contrib.auth.models import Permission, User
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import models, transaction
+
+from src.apps.courses.models import (
+    Content,
+    Course,
+    File,
+    Image,
+    ItemBase,
+    Module,
+    Subject,
+    Text,
+    Video,
+)
+
+T = TypeVar("T")
+
+ITEM_MODELS: tuple[type[ItemBase], ...] = (Text, File, Image, Video)
+
+TEXT = (
+    "Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do "
+    "eiusmod tempor incididunt ut labore et dolore magna aliqua. "
+) * 8
+
+
+def batched(iterable: Iterable[T], size: int) -> Iterator[list[T]]:
+    iterator = iter(iterable)
+    while batch := list(itertools.islice(iterator, size)):
+        yield batch
+
+
+class Command(BaseCommand):
+    help = (
+        "Создаёт большой объём тестовых данных через bulk_create: "
+        "пользователей, предметы, курсы, модули и контент всех типов."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--users", type=int, default=10)
+        parser.add_argument("--subjects", type=int, default=10)
+        parser.add_argument(
+            "--courses",
+            type=int,
+            default=10,
+            help="Курсов на каждого пользователя.",
+        )
+        parser.add_argument(
+            "--modules",
+            type=int,
+            default=10,
+            help="Модулей в каждом курсе.",
+        )
+        parser.add_argument(
+            "--contents",
+            type=int,
+            default=10,
+            help="Элементов контента в каждом модуле.",
+        )
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        self.batch_size = options["batch_size"]
+        self.tag = uuid.uuid4().hex[:8]
+        self.content_types = {
+            model: ContentType.objects.get_for_model(model)
+            for model in ITEM_MODELS
+        }
+
+        users = self.create_users(options["users"])
+        subjects = self.create_subjects(options["subjects"])
+        courses = (
+            Course(
+                owner=user,
+                subject=subjects[index % len(subjects)],
+                title=f"Course {index}",
+                slug=f"seed-{self.tag}-course-{index}",
+                overview=TEXT,
+            )
+            for index, user in enumerate(
+                user
+                for user in users
+                for _ in range(options["courses"])
+            )
+        )
+
+        totals = {"courses": 0, "modules": 0, "contents": 0}
+        for batch in batched(courses, self.batch_size):
+            with transaction.atomic():
+                Course.objects.bulk_create(batch)
+                modules = self.create_modules(batch, options["modules"])
+                contents = self.create_contents(modules, options["contents"])
+            totals["courses"] += len(batch)
+            totals["modules"] += len(modules)
+            totals["contents"] += contents
+            self.stdout.write(
+                f"Courses: {totals['courses']}, "
+                f"modules: {totals['modules']}, "
+                f"contents: {totals['contents']}",
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Created {len(users)} users, {len(subjects)} subjects, "
+                f"{totals['courses']} courses, {totals['modules']} modules "
+                f"and {totals['contents']} contents.",
+            ),
+        )
+
+    def bulk_create(
+        self,
+        model: type[models.Model],
+        objects: Iterable[Any],
+    ) -> list[Any]:
+        created: list[Any] = []
+        for batch in batched(objects, self.batch_size):
+            created += model._default_manager.bulk_create(batch)
+        return created
+
+    def create_users(self, count: int) -> list[User]:
+        """
+        Создаёт преподавателей с правами на управление курсами, чтобы
+        от их имени можно было нагружать страницы управления.
+        """
+        users = self.bulk_create(
+            User,
+            (
+                User(
+                    username=f"seed-{self.tag}-{index}",
+                    email=f"seed-{self.tag}-{index}@example.com",
+                    password="!",
+                )
+                for index in range(count)
+            ),
+        )
+        permissions = Permission.objects.filter(
+            content_type__app_label="courses",
+            codename__in=[
+                "view_course",
+                "add_course",
+                "change_course",
+                "delete_course",
+            ],
+        )
+        through = User.user_permissions.through
+        self.bulk_create(
+            through,
+            (
+                through(user_id=user.pk, permission_id=permission.pk)
+                for user in users
+                for permission in permissions
+            ),
+        )
+        return users
+
+    def create_subjects(self, count: int) -> list[Subject]:
+        return self.bulk_create(
+            Subject,
+            (
+                Subject(
+                    title=f"Subject {index}",
+                    slug=f"seed-{self.tag}-subject-{index}",
+                )
+                for index in range(count)
+            ),
+        )
+
+    def create_modules(
+        self,
+        courses: list[Course],
+        count: int,
+    ) -> list[Module]:
+        return self.bulk_create(
+            Module,
+            (
+                Module(
+                    course=course,
+                    title=f"Module {order}",
+                    description=TEXT,
+                    order=order,
+                )
+                for course in courses
+                for order in range(count)
+            ),
+        )
+
+    def create_contents(self, modules: list[Module], count: int) -> int:
+        """
+        Создаёт по count элементов на модуль, чередуя типы, и строки
+        Content к ним. order задаётся сразу, минуя OrderField.pre_save.
+        """
+        step = Content._meta.get_field("order").step  # type: ignore
+        placements = [
+            (module, order) for module in modules for order in range(count)
+        ]
+        items: list[tuple[Module, int, ItemBase]] = []
+        for offset, model in enumerate(ITEM_MODELS):
+            slots = placements[offset :: len(ITEM_MODELS)]
+            created = self.bulk_create(
+                model,
+                (
+                    self.build_item(model, module.course.owner, order)
+                    for module, order in slots
+                ),
+            )
+            items += [
+                (module, order, item)
+                for (module, order), item in zip(slots, created)
+            ]
+        self.bulk_create(
+            Content,
+            (
+                Content(
+                    module=module,
+                    content_type=self.content_types[type(item)],
+                    object_id=item.pk,
+                    order=order * step,
+                )
+                for module, order, item in items
+            ),
+        )
+        return len(items)
+
+    def build_item(
+        self,
+        model: type[ItemBase],
+        owner: User,
+        order: int,
+    ) -> ItemBase:
+        title = f"{model.__name__} {order}"
+        if model is Text:
+            return Text(owner=owner, title=title, content=TEXT)
+        if model is File:
+            return File(owner=owner, title=title, file="files/seed.pdf")
+        if model is Image:
+            return Image(owner=owner, title=title, file="images/seed.png")
+        return Video(
+            owner=owner,
+            title=title,
+            url="https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+        )
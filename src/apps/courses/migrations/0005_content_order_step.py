@@ -0,0 +1,35 @@
+# Generated by Django 5.1.5 on 2026-10-18 14:21
+
+from typing import Any
+
+import src.apps.courses.fields
+from django.db import migrations
+from django.db.models import F
+
+ORDER_STEP = 1024
+
+
+def spread_content_order(apps: Any, schema_editor: Any) -> None:
+    Content = apps.get_model("courses", "Content")
+    Content.objects.update(order=F("order") * ORDER_STEP)
+
+
+def compact_content_order(apps: Any, schema_editor: Any) -> None:
+    Content = apps.get_model("courses", "Content")
+    Content.objects.update(order=F("order") / ORDER_STEP)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("courses", "0004_alter_content_options_alter_module_options_and_more"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="content",
+            name="order",
+            field=src.apps.courses.fields.OrderField(blank=True, step=1024),
+        ),
+        migrations.RunPython(spread_content_order, compact_content_order),
+    ]
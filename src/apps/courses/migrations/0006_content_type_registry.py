@@ -0,0 +1,25 @@
+# Generated by Django 5.1.5 on 2026-10-18 14:23
+
+import django.db.models.deletion
+import src.apps.courses.registry
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("courses", "0005_content_order_step"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="content",
+            name="content_type",
+            field=models.ForeignKey(
+                limit_choices_to=src.apps.courses.registry.content_type_choices,
+                on_delete=django.db.models.deletion.CASCADE,
+                to="contenttypes.contenttype",
+            ),
+        ),
+    ]
@@ -0,0 +1,85 @@
+# Generated by Django 5.1.5 on 2026-10-18 14:29
+
+from typing import Any
+
+import django.db.models.constraints
+from django.conf import settings
+from django.db import migrations, models
+
+ORDER_STEP = 1024
+
+
+def renumber_duplicate_content_order(apps: Any, schema_editor: Any) -> None:
+    Content = apps.get_model("courses", "Content")
+    duplicated_modules = (
+        Content.objects.values("module_id", "order")
+        .annotate(count=models.Count("id"))
+        .filter(count__gt=1)
+        .values_list("module_id", flat=True)
+        .distinct()
+    )
+    for module_id in duplicated_modules:
+        contents = list(
+            Content.objects.filter(module_id=module_id).order_by("order", "id"),
+        )
+        for index, content in enumerate(contents):
+            content.order = index * ORDER_STEP
+        Content.objects.bulk_update(contents, ["order"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("courses", "0006_content_type_registry"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="content",
+            index=models.Index(
+                fields=["content_type", "object_id"], name="content_item_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="course",
+            index=models.Index(
+                fields=["owner", "-created", "id"], name="course_owner_created_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="file",
+            index=models.Index(fields=["owner", "id"], name="courses_file_owner_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="image",
+            index=models.Index(fields=["owner", "id"], name="courses_image_owner_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="module",
+            index=models.Index(
+                fields=["course", "order"], name="module_course_order_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="text",
+            index=models.Index(fields=["owner", "id"], name="courses_text_owner_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="video",
+            index=models.Index(fields=["owner", "id"], name="courses_video_owner_idx"),
+        ),
+        migrations.RunPython(
+            renumber_duplicate_content_order,
+            migrations.RunPython.noop,
+        ),
+        migrations.AddConstraint(
+            model_name="content",
+            constraint=models.UniqueConstraint(
+                deferrable=django.db.models.constraints.Deferrable["DEFERRED"],
+                fields=("module", "order"),
+                name="content_module_order_unique",
+            ),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.1.5 on 2026-10-18 14:49
+
+import src.apps.courses.models.itembase
+import src.apps.courses.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("courses", "0008_upload_checksum"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Blob",
+            fields=[
+                (
+                    "name",
+                    models.CharField(max_length=255, primary_key=True, serialize=False),
+                ),
+                ("size", models.PositiveBigIntegerField()),
+                ("refs", models.PositiveIntegerField(default=0)),
+                ("created", models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AlterField(
+            model_name="file",
+            name="file",
+            field=models.FileField(
+                storage=src.apps.courses.storage.blob_storage,
+                upload_to=src.apps.courses.models.itembase.item_upload_to,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="image",
+            name="file",
+            field=models.FileField(
+                storage=src.apps.courses.storage.blob_storage,
+                upload_to=src.apps.courses.models.itembase.item_upload_to,
+            ),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.5 on 2026-10-18 14:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("courses", "0009_blob_storage"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="image",
+            name="variants",
+            field=models.JSONField(blank=True, editable=False, null=True),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.5 on 2026-10-18 15:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("courses", "0010_image_variants"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="course",
+            name="deleted",
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+    ]
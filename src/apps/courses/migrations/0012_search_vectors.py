@@ -0,0 +1,93 @@
+# Generated by Django 5.1.5 on 2026-10-18 15:05
+
+import django.contrib.postgres.search
+import django.db.models.functions.text
+import src.apps.courses.models.indexes
+import src.apps.courses.models.vectors
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("courses", "0011_course_deleted"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="course",
+            name="search_vector",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.contrib.postgres.search.CombinedSearchVector(
+                    src.apps.courses.models.vectors.SearchVector(
+                        "title", config="russian", weight="A"
+                    ),
+                    "||",
+                    src.apps.courses.models.vectors.SearchVector(
+                        "overview", config="russian", weight="B"
+                    ),
+                    django.contrib.postgres.search.SearchConfig("russian"),
+                ),
+                output_field=django.contrib.postgres.search.SearchVectorField(),
+            ),
+        ),
+        migrations.AddField(
+            model_name="module",
+            name="search_vector",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.contrib.postgres.search.CombinedSearchVector(
+                    src.apps.courses.models.vectors.SearchVector(
+                        "title", config="russian", weight="A"
+                    ),
+                    "||",
+                    src.apps.courses.models.vectors.SearchVector(
+                        "description", config="russian", weight="B"
+                    ),
+                    django.contrib.postgres.search.SearchConfig("russian"),
+                ),
+                output_field=django.contrib.postgres.search.SearchVectorField(),
+            ),
+        ),
+        migrations.AddField(
+            model_name="text",
+            name="search_vector",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.contrib.postgres.search.CombinedSearchVector(
+                    src.apps.courses.models.vectors.SearchVector(
+                        "title", config="russian", weight="A"
+                    ),
+                    "||",
+                    src.apps.courses.models.vectors.SearchVector(
+                        django.db.models.functions.text.Left("content", 100000),
+                        config="russian",
+                        weight="B",
+                    ),
+                    django.contrib.postgres.search.SearchConfig("russian"),
+                ),
+                output_field=django.contrib.postgres.search.SearchVectorField(),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="course",
+            index=src.apps.courses.models.indexes.GinIndex(
+                fields=["search_vector"], name="course_search_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="module",
+            index=src.apps.courses.models.indexes.GinIndex(
+                fields=["search_vector"], name="module_search_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="text",
+            index=src.apps.courses.models.indexes.GinIndex(
+                fields=["search_vector"], name="text_search_idx"
+            ),
+        ),
+    ]
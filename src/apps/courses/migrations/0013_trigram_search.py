@@ -0,0 +1,66 @@
+# Generated by Django 5.1.5 on 2026-10-18 15:07
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.operations
+import django.db.models.functions.comparison
+import django.db.models.functions.text
+import src.apps.courses.models.indexes
+import src.apps.courses.operations
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Индексы строятся CONCURRENTLY, без блокировки записи в таблицы.
+    atomic = False
+
+    dependencies = [
+        ("courses", "0012_search_vectors"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        django.contrib.postgres.operations.TrigramExtension(),
+        src.apps.courses.operations.AddIndexConcurrently(
+            model_name="course",
+            index=src.apps.courses.models.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper(
+                        django.db.models.functions.comparison.Cast(
+                            "title", models.TextField()
+                        )
+                    ),
+                    name="gin_trgm_ops",
+                ),
+                name="course_title_trgm_idx",
+            ),
+        ),
+        src.apps.courses.operations.AddIndexConcurrently(
+            model_name="course",
+            index=src.apps.courses.models.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper(
+                        django.db.models.functions.comparison.Cast(
+                            "overview", models.TextField()
+                        )
+                    ),
+                    name="gin_trgm_ops",
+                ),
+                name="course_overview_trgm_idx",
+            ),
+        ),
+        src.apps.courses.operations.AddIndexConcurrently(
+            model_name="subject",
+            index=src.apps.courses.models.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper(
+                        django.db.models.functions.comparison.Cast(
+                            "title", models.TextField()
+                        )
+                    ),
+                    name="gin_trgm_ops",
+                ),
+                name="subject_title_trgm_idx",
+            ),
+        ),
+    ]
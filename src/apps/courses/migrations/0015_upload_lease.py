@@ -0,0 +1,18 @@
+# Generated by Django 5.1.5 on 2026-10-18 15:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("courses", "0014_course_active_slug"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="upload",
+            name="locked_until",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
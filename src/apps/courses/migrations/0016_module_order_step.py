@@ -0,0 +1,43 @@
+# Generated by Django 5.1.5 on 2026-10-18 15:44
+
+from typing import Any
+
+import src.apps.courses.fields
+from django.db import migrations
+from django.db.models import F
+
+ORDER_STEP = 1024
+
+
+def spread_module_order(apps: Any, schema_editor: Any) -> None:
+    Module = apps.get_model("courses", "Module")
+    Module.objects.update(order=(F("order") + 1) * ORDER_STEP)
+
+
+def compact_module_order(apps: Any, schema_editor: Any) -> None:
+    # После перемещений ключи не кратны шагу, поэтому модули каждого
+    # курса нумеруются заново подряд с нуля.
+    Module = apps.get_model("courses", "Module")
+    modules = list(Module.objects.order_by("course_id", "order", "pk"))
+    course_id, index = None, 0
+    for module in modules:
+        index = index + 1 if module.course_id == course_id else 0
+        course_id = module.course_id
+        module.order = index
+    Module.objects.bulk_update(modules, ["order"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("courses", "0015_upload_lease"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="module",
+            name="order",
+            field=src.apps.courses.fields.OrderField(blank=True, step=1024),
+        ),
+        migrations.RunPython(spread_module_order, compact_module_order),
+    ]
@@ -2,7 +2,16 @@ from src.apps.courses.models.course import Course
 from src.apps.courses.models.module import Module
 from src.apps.courses.models.subject import Subject
 from src.apps.courses.models.content import Content
-from src.apps.courses.models.itembase import ItemBase, File, Image, Video, Text
+from src.apps.courses.models.itembase import (
+    ItemBase,
+    FileItemBase,
+    File,
+    Image,
+    Video,
+    Text,
+)
+from src.apps.courses.models.upload import Upload
+from src.apps.courses.models.blob import Blob
 
 
 __all__ = [
@@ -15,4 +24,7 @@ __all__ = [
     "Video",
     "Text",
     "ItemBase",
+    "FileItemBase",
+    "Upload",
+    "Blob",
 ]
@@ -0,0 +1,27 @@
+from django.db import models
+
+
+class Blob(models.Model):
+    """
+    Файл контентно-адресуемого хранилища.
+
+    Имя файла строится из sha256 содержимого, поэтому одинаковые файлы
+    хранятся один раз. refs - число полей File/Image, ссылающихся на
+    файл; физически он удаляется вместе с последней ссылкой.
+    """
+
+    name = models.CharField(max_length=255, primary_key=True)
+    size = models.PositiveBigIntegerField()
+    refs = models.PositiveIntegerField(default=0)
+    created = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self) -> str:
+        return self.name
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}("
+            f"name={self.name!r}, "
+            f"size={self.size!r}, "
+            f"refs={self.refs!r})"
+        )
@@ -2,6 +2,7 @@ from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.db import models
 
+from src.apps.courses import registry
 from src.apps.courses.fields import OrderField
 from src.apps.courses.models.module import Module
 
@@ -15,21 +16,27 @@ class Content(models.Model):
     content_type = models.ForeignKey(
         ContentType,
         on_delete=models.CASCADE,
-        limit_choices_to={
-            "model__in": (
-                "text",
-                "video",
-                "image",
-                "file",
-            ),
-        },
+        limit_choices_to=registry.content_type_choices,
     )
     object_id = models.PositiveIntegerField()
     item = GenericForeignKey("content_type", "object_id")
-    order = OrderField(for_fields=["module"], blank=True)
+    order = OrderField(for_fields=["module"], step=1024, blank=True)
 
     class Meta:
         ordering = ["order"]
+        indexes = [
+            models.Index(
+                fields=["content_type", "object_id"],
+                name="content_item_idx",
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["module", "order"],
+                name="content_module_order_unique",
+                deferrable=models.Deferrable.DEFERRED,
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"{self.object_id} - {self.item}"
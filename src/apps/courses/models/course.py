@@ -1,7 +1,22 @@
+from collections.abc import Collection
+
+from django.conf import settings
 from django.contrib.auth.models import User
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 
+from src.apps.courses.models.indexes import GinIndex, trigram_index
 from src.apps.courses.models.subject import Subject
+from src.apps.courses.models.vectors import SearchVector
+
+
+class ActiveCourseManager(models.Manager["Course"]):
+    """
+    Курсы без пометки об удалении.
+    """
+
+    def get_queryset(self) -> models.QuerySet["Course"]:
+        return super().get_queryset().filter(deleted__isnull=True)
 
 
 class Course(models.Model):
@@ -16,12 +31,54 @@ class Course(models.Model):
         on_delete=models.CASCADE,
     )
     title = models.CharField(max_length=200)
-    slug = models.SlugField(max_length=200, unique=True)
+    slug = models.SlugField(max_length=200)
     overview = models.TextField()
     created = models.DateTimeField(auto_now_add=True)
+    deleted = models.DateTimeField(null=True, blank=True, editable=False)
+    search_vector = models.GeneratedField(
+        expression=SearchVector(
+            "title",
+            weight="A",
+            config=settings.SEARCH_CONFIG,
+        )
+        + SearchVector("overview", weight="B", config=settings.SEARCH_CONFIG),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
+    objects = ActiveCourseManager()
+    all_objects = models.Manager()
 
     class Meta:
         ordering = ["-created"]
+        indexes = [
+            models.Index(
+                fields=["owner", "-created", "id"],
+                name="course_owner_created_idx",
+            ),
+            GinIndex(fields=["search_vector"], name="course_search_idx"),
+            trigram_index("title", "course_title_trgm_idx"),
+            trigram_index("overview", "course_overview_trgm_idx"),
+        ]
+        constraints = [
+            # Удалённый курс ждёт purge_course и не должен занимать slug.
+            models.UniqueConstraint(
+                fields=["slug"],
+                condition=models.Q(deleted__isnull=True),
+                name="course_active_slug_unique",
+            ),
+        ]
+
+    def validate_constraints(
+        self,
+        exclude: Collection[str] | None = None,
+    ) -> None:
+        # Формы исключают нередактируемое поле deleted, а без него Django
+        # пропускает проверку условного ограничения slug, и дубликат
+        # доходил до базы данных.
+        super().validate_constraints(
+            exclude=set(exclude or ()) - {"deleted"},
+        )
 
     def __str__(self) -> str:
         return self.title
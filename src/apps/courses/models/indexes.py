@@ -0,0 +1,51 @@
+from typing import Any
+
+from django.contrib.postgres import indexes
+from django.contrib.postgres.indexes import OpClass
+from django.db import models
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.db.backends.ddl_references import Statement
+from django.db.models.functions import Cast, Upper
+
+
+class GinIndex(indexes.GinIndex):
+    """
+    GIN-индекс PostgreSQL. В других базах, например в SQLite для
+    тестов, вместо него строится обычный индекс по тем же выражениям без
+    классов операторов: SQLite пересоздаёт индексы при каждом
+    изменении таблицы, и пропустить их нельзя.
+    """
+
+    def create_sql(
+        self,
+        model: type[models.Model],
+        schema_editor: BaseDatabaseSchemaEditor,
+        using: str = "",
+        **kwargs: Any,
+    ) -> Statement:
+        if schema_editor.connection.vendor == "postgresql":
+            return super().create_sql(model, schema_editor, using, **kwargs)
+        index = models.Index(
+            *(
+                expression.get_source_expressions()[0]
+                if isinstance(expression, OpClass)
+                else expression
+                for expression in self.expressions
+            ),
+            fields=self.fields,
+            name=self.name,
+        )
+        return index.create_sql(model, schema_editor, **kwargs)
+
+
+def trigram_index(field: str, name: str) -> GinIndex:
+    """
+    Триграммный GIN-индекс для поиска подстроки через icontains.
+    Выражение повторяет SQL этого лукапа в PostgreSQL -
+    UPPER(field::text) LIKE UPPER(%s) - иначе планировщик индекс не
+    использует.
+    """
+    return GinIndex(
+        OpClass(Upper(Cast(field, models.TextField())), name="gin_trgm_ops"),
+        name=name,
+    )
@@ -1,5 +1,16 @@
+from typing import Any
+
+from django.conf import settings
 from django.contrib.auth.models import User
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.db.models.functions import Left
+from django.urls import reverse
+
+from src.apps.courses.models.indexes import GinIndex
+from src.apps.courses.models.vectors import SearchVector
+from src.apps.courses.storage import blob_storage
+from src.apps.courses.uploads import file_checksum
 
 
 class ItemBase(models.Model):
@@ -14,6 +25,12 @@ class ItemBase(models.Model):
 
     class Meta:
         abstract = True
+        indexes = [
+            models.Index(
+                fields=["owner", "id"],
+                name="%(app_label)s_%(class)s_owner_idx",
+            ),
+        ]
 
     def __str__(self) -> str:
         return self.title
@@ -30,28 +47,86 @@ class ItemBase(models.Model):
 
 class Text(ItemBase):
     content = models.TextField()
+    # tsvector ограничен 1 МБ, поэтому индексируется начало текста: без
+    # ограничения очень длинный текст нельзя было бы сохранить.
+    search_vector = models.GeneratedField(
+        expression=SearchVector(
+            "title",
+            weight="A",
+            config=settings.SEARCH_CONFIG,
+        )
+        + SearchVector(
+            Left("content", 100_000),
+            weight="B",
+            config=settings.SEARCH_CONFIG,
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
+    class Meta(ItemBase.Meta):
+        indexes = [
+            *ItemBase.Meta.indexes,
+            GinIndex(fields=["search_vector"], name="text_search_idx"),
+        ]
 
     def __repr__(self) -> str:
         base_repr = super().__repr__()
         return f"{base_repr}, content={self.content!r})"
 
 
-class File(ItemBase):
-    file = models.FileField(upload_to="files")
+def item_upload_to(instance: "FileItemBase", filename: str) -> str:
+    return f"{instance._meta.model_name}s/{filename}"
 
-    def __repr__(self) -> str:
-        base_repr = super().__repr__()
-        return f"{base_repr}, file={self.file!r})"
 
+class FileItemBase(ItemBase):
+    """
+    Элемент с файлом. sha256 файла сохраняется при загрузке: его считает
+    StreamingUploadHandler на лету, для прочих файлов он считается здесь.
+    Файлы лежат в контентно-адресуемом хранилище, где одинаковые файлы
+    разных элементов хранятся один раз.
+    """
+
+    file = models.FileField(upload_to=item_upload_to, storage=blob_storage)
+    checksum = models.CharField(max_length=64, blank=True, editable=False)
 
-class Image(ItemBase):
-    file = models.FileField(upload_to="images")
+    class Meta(ItemBase.Meta):
+        abstract = True
+
+    def file_url(self, name: str | None = None) -> str:
+        """
+        Адрес файла элемента (или его варианта name) через
+        ContentFileView, который проверяет доступ.
+        """
+        return reverse(
+            "courses:content_file",
+            args=[self._meta.model_name, self.pk, name or self.file.name],
+        )
+
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        if self.file and not getattr(self.file, "_committed", True):
+            self.checksum = file_checksum(self.file.file)
+        super().save(*args, **kwargs)
 
     def __repr__(self) -> str:
         base_repr = super().__repr__()
         return f"{base_repr}, file={self.file!r})"
 
 
+class File(FileItemBase):
+    pass
+
+
+class Image(FileItemBase):
+    """
+    Изображение. variants - уменьшенные копии для srcset, которые
+    создаются в фоне после загрузки: список словарей с name, format,
+    width и height. None - варианты ещё не созданы.
+    """
+
+    variants = models.JSONField(null=True, blank=True, editable=False)
+
+
 class Video(ItemBase):
     url = models.URLField()
 
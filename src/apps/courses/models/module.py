@@ -1,7 +1,12 @@
+from django.conf import settings
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.utils.functional import cached_property
 
 from src.apps.courses.fields import OrderField
 from src.apps.courses.models.course import Course
+from src.apps.courses.models.indexes import GinIndex
+from src.apps.courses.models.vectors import SearchVector
 
 
 class Module(models.Model):
@@ -12,10 +17,45 @@ class Module(models.Model):
     )
     title = models.CharField(max_length=200)
     description = models.TextField(blank=True)
-    order = OrderField(for_fields=["course"], blank=True)
+    order = OrderField(for_fields=["course"], step=1024, blank=True)
+    search_vector = models.GeneratedField(
+        expression=SearchVector(
+            "title",
+            weight="A",
+            config=settings.SEARCH_CONFIG,
+        )
+        + SearchVector(
+            "description",
+            weight="B",
+            config=settings.SEARCH_CONFIG,
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
 
     class Meta:
         ordering = ["order"]
+        indexes = [
+            models.Index(
+                fields=["course", "order"],
+                name="module_course_order_idx",
+            ),
+            GinIndex(fields=["search_vector"], name="module_search_idx"),
+        ]
+
+    @cached_property
+    def number(self) -> int:
+        """
+        Номер модуля в курсе, начиная с 1. Ключи order разрежены, поэтому
+        для показа не годятся.
+        """
+        return (
+            Module.objects.filter(
+                course_id=self.course_id,
+                order__lt=self.order,
+            ).count()
+            + 1
+        )
 
     def __str__(self) -> str:
         return f"{self.order}. {self.title}"
@@ -1,5 +1,7 @@
 from django.db import models
 
+from src.apps.courses.models.indexes import trigram_index
+
 
 class Subject(models.Model):
     title = models.CharField(max_length=200)
@@ -7,6 +9,7 @@ class Subject(models.Model):
 
     class Meta:
         ordering = ["title"]
+        indexes = [trigram_index("title", "subject_title_trgm_idx")]
 
     def __str__(self) -> str:
         return self.title
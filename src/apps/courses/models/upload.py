@@ -0,0 +1,54 @@
+import uuid
+from pathlib import Path
+
+from django.contrib.auth.models import User
+from django.db import models
+
+from src.apps.courses.uploads import staging_dir
+
+
+class Upload(models.Model):
+    """
+    Возобновляемая загрузка большого файла несколькими запросами.
+
+    Куски дописываются в файл в UPLOAD_STAGING_DIR, offset хранит число
+    принятых байт. Готовая загрузка передаётся в форму контента вместо
+    файла и переносится в хранилище без копирования.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4)
+    owner = models.ForeignKey(
+        User,
+        related_name="uploads",
+        on_delete=models.CASCADE,
+    )
+    model_name = models.CharField(max_length=100)
+    filename = models.CharField(max_length=255)
+    size = models.PositiveBigIntegerField()
+    offset = models.PositiveBigIntegerField(default=0)
+    checksum = models.CharField(max_length=64, blank=True)
+    # Аренда запроса, дописывающего кусок; строка не блокируется, пока
+    # идёт передача.
+    locked_until = models.DateTimeField(null=True, blank=True)
+    created = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self) -> str:
+        return self.filename
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}("
+            f"owner={self.owner!r}, "
+            f"model_name={self.model_name!r}, "
+            f"filename={self.filename!r}, "
+            f"size={self.size!r}, "
+            f"offset={self.offset!r})"
+        )
+
+    @property
+    def path(self) -> Path:
+        return staging_dir() / f"{self.pk}.part"
+
+    @property
+    def complete(self) -> bool:
+        return self.offset == self.size
@@ -0,0 +1,38 @@
+from typing import Any
+
+from django.contrib.postgres import search
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.models import TextField, Value
+from django.db.models.functions import Cast, Coalesce
+from django.db.models.sql.compiler import SQLCompiler
+
+
+class SearchVector(search.SearchVector):
+    """
+    SearchVector, который работает и на SQLite: там tsvector нет, и
+    столбец хранит сам текст полей через пробел, а поиск идёт по
+    подстроке (см. search.py). В PostgreSQL SQL не меняется.
+    """
+
+    def as_sqlite(
+        self,
+        compiler: SQLCompiler,
+        connection: BaseDatabaseWrapper,
+        **extra_context: Any,
+    ) -> tuple[str, tuple[str | int, ...]]:
+        clone = self.copy()
+        clone.set_source_expressions(
+            [
+                Coalesce(
+                    Cast(expression, TextField()),
+                    Value("", output_field=TextField()),
+                )
+                for expression in clone.get_source_expressions()
+            ],
+        )
+        # Пробел в конце отделяет слова соседнего вектора в сумме векторов.
+        return super(search.SearchVector, clone).as_sql(
+            compiler,
+            connection,
+            template="(%(expressions)s || ' ')",
+        )
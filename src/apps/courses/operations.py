@@ -0,0 +1,57 @@
+from django.contrib.postgres import operations
+from django.db import migrations
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.db.migrations.state import ProjectState
+
+
+class AddIndexConcurrently(operations.AddIndexConcurrently):
+    """
+    AddIndexConcurrently, который в других базах, например в SQLite для
+    тестов, добавляет индекс обычным AddIndex.
+    """
+
+    def database_forwards(
+        self,
+        app_label: str,
+        schema_editor: BaseDatabaseSchemaEditor,
+        from_state: ProjectState,
+        to_state: ProjectState,
+    ) -> None:
+        if schema_editor.connection.vendor == "postgresql":
+            super().database_forwards(
+                app_label,
+                schema_editor,
+                from_state,
+                to_state,
+            )
+        else:
+            migrations.AddIndex.database_forwards(
+                self,
+                app_label,
+                schema_editor,
+                from_state,
+                to_state,
+            )
+
+    def database_backwards(
+        self,
+        app_label: str,
+        schema_editor: BaseDatabaseSchemaEditor,
+        from_state: ProjectState,
+        to_state: ProjectState,
+    ) -> None:
+        if schema_editor.connection.vendor == "postgresql":
+            super().database_backwards(
+                app_label,
+                schema_editor,
+                from_state,
+                to_state,
+            )
+        else:
+            migrations.AddIndex.database_backwards(
+                self,
+                app_label,
+                schema_editor,
+                from_state,
+                to_state,
+            )
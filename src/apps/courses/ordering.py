@@ -0,0 +1,24 @@
+from typing import Any
+
+from django.apps import apps
+from django.db import transaction
+
+from src.apps.courses.fields import OrderField
+from src.apps.tasks.queue import task
+
+
+@task()
+def rebalance_order(model: str, field: str, lookup: dict[str, Any]) -> None:
+    """
+    Перенумеровывает группу lookup модели model с шагом поля field.
+    Относительный порядок не меняется, поэтому фрагментный кэш остаётся
+    верным; повтор задачи безопасен.
+    """
+    order_field = apps.get_model(model)._meta.get_field(field)
+    if not isinstance(order_field, OrderField):
+        raise TypeError(f"{model}.{field} is not an OrderField")
+    with transaction.atomic():
+        order_field.lock_group(lookup)
+        order_field.rebalance(
+            order_field.model._default_manager.filter(**lookup).order_by(),
+        )
@@ -0,0 +1,50 @@
+from typing import Any, NamedTuple
+
+from django.db import models
+from django.forms import ModelForm
+from django.forms.models import modelform_factory
+
+FORM_EXCLUDE = ["owner", "order", "created", "updated"]
+
+
+class ContentEntry(NamedTuple):
+    model: type[models.Model]
+    form_class: type[ModelForm]
+
+
+_registry: dict[str, ContentEntry] = {}
+
+
+def register(
+    model: type[models.Model],
+    form_class: type[ModelForm] | None = None,
+) -> type[models.Model]:
+    """
+    Регистрирует модель как тип контента модуля.
+
+    Встроенные типы (Text, Video, Image, File) регистрируются в
+    CoursesConfig.ready. Новый тип, унаследованный от ItemBase,
+    регистрируется вызовом register(Model) из ready() своего приложения;
+    класс формы строится один раз здесь, если не передан явно.
+    """
+    if form_class is None:
+        form_class = modelform_factory(model, exclude=FORM_EXCLUDE)
+    _registry[model._meta.model_name or model.__name__.lower()] = (
+        ContentEntry(model, form_class)
+    )
+    return model
+
+
+def get(model_name: str) -> ContentEntry | None:
+    return _registry.get(model_name)
+
+
+def model_names() -> list[str]:
+    return list(_registry)
+
+
+def content_type_choices() -> dict[str, Any]:
+    """
+    Ограничение для Content.content_type: только зарегистрированные типы.
+    """
+    return {"model__in": model_names()}
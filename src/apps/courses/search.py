@@ -0,0 +1,159 @@
+import operator
+import re
+from functools import reduce
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.postgres.search import (
+    SearchHeadline,
+    SearchQuery,
+    SearchRank,
+)
+from django.db import connection
+from django.db.models import (
+    F,
+    FloatField,
+    OuterRef,
+    Q,
+    QuerySet,
+    Subquery,
+    Value,
+)
+
+from src.apps.courses.models import Content, Course, Module, Text
+
+# Границы найденных слов в SearchHeadline. Управляющие символы не
+# встречаются в тексте, поэтому фрагмент можно экранировать целиком и
+# только потом заменить их на <mark> (см. фильтр highlight).
+HIGHLIGHT_START = "\x02"
+HIGHLIGHT_STOP = "\x03"
+
+# Слово или "фраза" запроса, с минусом - исключение.
+TERM_RE = re.compile(r'(-?)(?:"([^"]*)"|(\S+))')
+
+
+def search_query(text: str) -> SearchQuery:
+    """
+    Запрос в синтаксисе поисковиков: слова, "фразы", or и -исключения.
+    """
+    return SearchQuery(
+        text,
+        search_type="websearch",
+        config=settings.SEARCH_CONFIG,
+    )
+
+
+def full_text() -> bool:
+    """
+    Полнотекстовый поиск есть только в PostgreSQL. В других базах
+    (SQLite для тестов) search_vector хранит текст полей, и запрос
+    ищется в нём подстрокой (см. models/vectors.py).
+    """
+    return connection.vendor == "postgresql"
+
+
+def substring_match(query: SearchQuery) -> Q:
+    """
+    Запрос в синтаксисе websearch как поиск подстрок: каждое слово и
+    "фраза" должны встретиться, -слова - нет, or разделяет альтернативы.
+    Морфологии нет, а регистр SQLite не различает только у латиницы.
+    """
+    # Последнее выражение - текст запроса, перед ним может быть config.
+    text = query.get_source_expressions()[-1].value
+    alternatives = [Q()]
+    for match in TERM_RE.finditer(text):
+        exclude, phrase, word = match.groups()
+        if phrase is None and not exclude and word.lower() == "or":
+            alternatives.append(Q())
+            continue
+        term = Q(search_vector__icontains=word if phrase is None else phrase)
+        alternatives[-1] &= ~term if exclude else term
+    return reduce(operator.or_, alternatives)
+
+
+def matches(query: SearchQuery) -> Q:
+    if full_text():
+        return Q(search_vector=query)
+    return substring_match(query)
+
+
+def rank(query: SearchQuery) -> SearchRank | Value:
+    if full_text():
+        return SearchRank(F("search_vector"), query)
+    return Value(0.0, output_field=FloatField())
+
+
+def headline(field: str, query: SearchQuery) -> SearchHeadline | F:
+    if not full_text():
+        return F(field)
+    return SearchHeadline(
+        field,
+        query,
+        config=settings.SEARCH_CONFIG,
+        start_sel=HIGHLIGHT_START,
+        stop_sel=HIGHLIGHT_STOP,
+        max_fragments=2,
+    )
+
+
+def search_courses(
+    query: SearchQuery,
+    owner_id: int,
+) -> QuerySet[Course]:
+    """
+    Курсы владельца, в названии, описании, модулях или текстах которых
+    есть совпадение, по убыванию релевантности самого курса.
+
+    Каждое условие проверяется по GIN-индексу своего search_vector, а
+    курсы, найденные только по модулям и текстам, идут после найденных
+    по собственному описанию.
+    """
+    in_modules = Module.objects.filter(
+        matches(query),
+        course__owner_id=owner_id,
+    ).values("course_id")
+    in_texts = Content.objects.filter(
+        content_type=ContentType.objects.get_for_model(Text),
+        object_id__in=Text.objects.filter(
+            matches(query),
+            owner_id=owner_id,
+        ).values("pk"),
+    ).values("module__course_id")
+    return (
+        Course.objects.filter(owner_id=owner_id)
+        .filter(
+            matches(query) | Q(pk__in=in_modules) | Q(pk__in=in_texts),
+        )
+        .select_related("subject")
+        .annotate(
+            rank=rank(query),
+            headline=headline("overview", query),
+        )
+        .order_by("-rank", "-created", "id")
+    )
+
+
+def search_texts(
+    query: SearchQuery,
+    owner_id: int,
+) -> QuerySet[Text]:
+    """
+    Тексты владельца с совпадением, по убыванию релевантности, с
+    модулем, в котором они лежат. Тексты вне модулей и в удалённых
+    курсах не выводятся.
+    """
+    module = Content.objects.filter(
+        content_type=ContentType.objects.get_for_model(Text),
+        object_id=OuterRef("pk"),
+        module__course__deleted__isnull=True,
+    ).values("module_id")[:1]
+    return (
+        Text.objects.filter(matches(query), owner_id=owner_id)
+        .annotate(module_id=Subquery(module))
+        .filter(module_id__isnull=False)
+        .annotate(
+            rank=rank(query),
+            headline=headline("content", query),
+        )
+        .order_by("-rank", "-pk")
+    )
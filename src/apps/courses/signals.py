@@ -0,0 +1,85 @@
+from typing import Any
+
+from django.contrib.contenttypes.models import ContentType
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from src.apps.courses import images
+from src.apps.courses.cache import (
+    bump_version,
+    course_version_key,
+    module_version_key,
+)
+from src.apps.courses.models import (
+    Content,
+    File,
+    Image,
+    ItemBase,
+    Module,
+    Text,
+    Video,
+)
+
+
+@receiver(post_save, sender=Module)
+@receiver(post_delete, sender=Module)
+def invalidate_module(sender: Any, instance: Module, **kwargs: Any) -> None:
+    bump_version(course_version_key(instance.course_id))
+    bump_version(module_version_key(instance.pk))
+
+
+@receiver(post_save, sender=Content)
+@receiver(post_delete, sender=Content)
+def invalidate_content(
+    sender: Any,
+    instance: Content,
+    **kwargs: Any,
+) -> None:
+    bump_version(module_version_key(instance.module_id))
+
+
+def invalidate_item(sender: Any, instance: ItemBase, **kwargs: Any) -> None:
+    if kwargs.get("created"):
+        return
+    module_ids = Content.objects.filter(
+        content_type=ContentType.objects.get_for_model(sender),
+        object_id=instance.pk,
+    ).values_list("module_id", flat=True)
+    for module_id in module_ids:
+        bump_version(module_version_key(module_id))
+
+
+for item_model in (Text, File, Image, Video):
+    post_save.connect(invalidate_item, sender=item_model)
+    post_delete.connect(invalidate_item, sender=item_model)
+
+
+@receiver(pre_save, sender=Image)
+def reset_image_variants(
+    sender: Any,
+    instance: Image,
+    **kwargs: Any,
+) -> None:
+    if not instance.file or getattr(instance.file, "_committed", True):
+        return
+    images.release_variants(instance.variants)
+    instance.variants = None
+
+
+@receiver(post_save, sender=Image)
+def schedule_image_variants(
+    sender: Any,
+    instance: Image,
+    **kwargs: Any,
+) -> None:
+    if instance.file and instance.variants is None:
+        images.process_image.enqueue(pk=instance.pk)
+
+
+@receiver(post_delete, sender=Image)
+def release_image_variants(
+    sender: Any,
+    instance: Image,
+    **kwargs: Any,
+) -> None:
+    images.release_variants(instance.variants)
@@ -0,0 +1,96 @@
+import os
+from typing import IO, Any
+
+from django.core.files import File as DjangoFile
+from django.core.files.storage import FileSystemStorage, Storage, storages
+from django.db import transaction
+from django.db.models import F
+
+from src.apps.courses.models.blob import Blob
+from src.apps.courses.uploads import file_checksum
+from src.apps.tasks.queue import task
+
+
+def blob_name(checksum: str, ext: str) -> str:
+    """
+    Путь файла по его sha256. Расширение сохраняется, чтобы веб-сервер
+    отдавал верный Content-Type; подкаталоги по первым байтам суммы не
+    дают одному каталогу разрастись.
+    """
+    return f"blobs/{checksum[:2]}/{checksum[2:4]}/{checksum}{ext[:16].lower()}"
+
+
+def blob_storage() -> Storage:
+    return storages["blobs"]
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    Хранилище, где имя файла - sha256 содержимого.
+
+    save() не пишет файл повторно, если такое содержимое уже хранится, и
+    увеличивает счётчик ссылок Blob; release() уменьшает его и удаляет
+    файл только вместе с последней ссылкой. delete(), который вызывает
+    django_cleanup при удалении или замене файла у модели, ставит
+    release() в фоновую очередь: запрос не ждёт диска, а файлы других
+    элементов не затрагиваются. Строка Blob блокируется на время
+    операции, чтобы параллельные save() и release() одного файла не
+    разошлись со счётчиком.
+
+    Файлы без строки Blob (загруженные до перехода на это хранилище)
+    удаляются как обычно.
+    """
+
+    def save(
+        self,
+        name: str | None,
+        content: IO[Any],
+        max_length: int | None = None,
+    ) -> str:
+        if name is None:
+            name = content.name
+        file = (
+            content
+            if isinstance(content, DjangoFile)
+            else DjangoFile(content, name)
+        )
+        _, ext = os.path.splitext(name or "")
+        name = blob_name(file_checksum(file), ext)
+
+        with transaction.atomic():
+            blob, _ = Blob.objects.select_for_update().get_or_create(
+                name=name,
+                defaults={"size": file.size},
+            )
+            if not self.exists(name):
+                super().save(name, file, max_length)
+            blob.refs = F("refs") + 1
+            blob.save(update_fields=["refs"])
+        return name
+
+    def delete(self, name: str) -> None:
+        """
+        Освобождает ссылку на файл в фоновой задаче. Задача пишется в
+        текущей транзакции, поэтому при её откате ссылка сохраняется.
+        """
+        release_blob.enqueue(name=name)
+
+    def release(self, name: str) -> None:
+        with transaction.atomic():
+            blob = Blob.objects.select_for_update().filter(name=name).first()
+            if blob is not None and blob.refs > 1:
+                blob.refs = F("refs") - 1
+                blob.save(update_fields=["refs"])
+                return
+            if blob is not None:
+                blob.delete()
+            super().delete(name)
+
+
+@task()
+def release_blob(name: str) -> None:
+    storage = blob_storage()
+    if isinstance(storage, ContentAddressedStorage):
+        storage.release(name)
+    else:
+        storage.delete(name)
@@ -1,6 +1,11 @@
 from typing import Any
 
 from django import template
+from django.utils.html import escape
+from django.utils.safestring import SafeString, mark_safe
+
+from src.apps.courses.models import Image
+from src.apps.courses.search import HIGHLIGHT_START, HIGHLIGHT_STOP
 
 register = template.Library()
 
@@ -11,3 +16,51 @@ def model_name(obj: Any) -> str | None:
         return obj._meta.model_name
     except AttributeError:
         return None
+
+
+@register.filter
+def highlight(fragment: str) -> SafeString:
+    """
+    Экранирует фрагмент SearchHeadline и выделяет совпадения в <mark>.
+    """
+    return mark_safe(
+        escape(fragment)
+        .replace(HIGHLIGHT_START, "<mark>")
+        .replace(HIGHLIGHT_STOP, "</mark>"),
+    )
+
+
+@register.simple_tag
+def srcset(image: Image, fmt: str) -> str:
+    """
+    Значение атрибута srcset из вариантов изображения в формате fmt.
+    """
+    return ", ".join(
+        f"{image.file_url(variant['name'])} {variant['width']}w"
+        for variant in image.variants or []
+        if variant["format"] == fmt
+    )
+
+
+@register.inclusion_tag("courses/picture.html")
+def picture(image: Image, sizes: str = "100vw") -> dict[str, Any]:
+    """
+    Элемент <picture> с source и srcset на каждый формат вариантов.
+    Исходный файл остаётся в <img> для браузеров без этих форматов и
+    на время, пока варианты не созданы.
+    """
+    variants = image.variants or []
+    formats = dict.fromkeys(variant["format"] for variant in variants)
+    return {
+        "image": image,
+        "sizes": sizes,
+        "largest": max(
+            variants,
+            key=lambda variant: variant["width"],
+            default=None,
+        ),
+        "sources": [
+            {"type": f"image/{fmt}", "srcset": srcset(image, fmt)}
+            for fmt in formats
+        ],
+    }
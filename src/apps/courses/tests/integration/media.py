@@ -0,0 +1,33 @@
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from django.test import TestCase, override_settings
+
+
+class TempMediaTestCase(TestCase):
+    """
+    Тесты с файлами: каждый тест пишет во временный MEDIA_ROOT, который
+    удаляется после теста.
+    """
+
+    media_root: Path
+
+    def media_settings(self) -> dict[str, Any]:
+        """
+        Дополнительные настройки на время теста; могут зависеть от
+        self.media_root.
+        """
+        return {}
+
+    def setUp(self) -> None:
+        super().setUp()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.media_root = Path(directory.name)
+        settings = override_settings(
+            MEDIA_ROOT=self.media_root,
+            **self.media_settings(),
+        )
+        settings.enable()
+        self.addCleanup(settings.disable)
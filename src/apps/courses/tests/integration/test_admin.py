@@ -0,0 +1,118 @@
+from unittest import skipUnless
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+import src.apps.courses.models as c_models
+from src.apps.courses.paginator import EstimatedCountPaginator
+
+
+class CourseAdminSearchTests(TestCase):
+    """
+    Тесты поиска и подсчёта строк в changelist курсов.
+    """
+
+    admin: User
+    python: c_models.Course
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.admin = User.objects.create_superuser(username="admin")
+        subject = c_models.Subject.objects.create(title="Programming")
+        cls.python = c_models.Course.objects.create(
+            owner=cls.admin,
+            subject=subject,
+            title="Python for data analysis",
+            slug="python",
+            overview="Pandas and NumPy.",
+        )
+        c_models.Course.objects.create(
+            owner=cls.admin,
+            subject=subject,
+            title="Go",
+            slug="go",
+            overview="Goroutines.",
+        )
+
+    @skipUnless(connection.vendor == "postgresql", "только в PostgreSQL")
+    def test_search_uses_trigram_index(self) -> None:
+        """
+        Тест, что icontains по названию и описанию выполняется по
+        триграммным индексам, а не перебором таблицы.
+        """
+        # На маленькой таблице планировщик выбрал бы перебор, поэтому
+        # остаётся только bitmap-сканирование по индексу с условием.
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            cursor.execute("SET LOCAL enable_indexscan = off")
+        plan = c_models.Course.all_objects.filter(
+            title__icontains="data",
+        ).explain()
+        self.assertIn("course_title_trgm_idx", plan)
+        plan = c_models.Course.all_objects.filter(
+            overview__icontains="numpy",
+        ).explain()
+        self.assertIn("course_overview_trgm_idx", plan)
+
+    def test_changelist_search(self) -> None:
+        """
+        Тест, что поиск в админке находит подстроку без учёта регистра и
+        не считает строки всей таблицы.
+        """
+        self.client.force_login(self.admin)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                reverse("admin:courses_course_changelist"),
+                {"q": "DATA anal"},
+            )
+
+        self.assertEqual(
+            list(response.context["cl"].result_list),
+            [self.python],
+        )
+        self.assertEqual(
+            sum("COUNT(*)" in query["sql"] for query in queries),
+            1,
+        )
+
+
+class EstimatedCountPaginatorTests(TestCase):
+    """
+    Тесты EstimatedCountPaginator.
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        c_models.Subject.objects.bulk_create(
+            c_models.Subject(title=f"Subject {index}", slug=f"s-{index}")
+            for index in range(3)
+        )
+
+    def test_small_result_is_counted(self) -> None:
+        """
+        Тест, что выборка меньше порога считается точно.
+        """
+        paginator = EstimatedCountPaginator(c_models.Subject.objects.all(), 2)
+
+        self.assertEqual(paginator.count, 3)
+        self.assertEqual(paginator.num_pages, 2)
+
+    @skipUnless(connection.vendor == "postgresql", "только в PostgreSQL")
+    def test_large_result_is_estimated(self) -> None:
+        """
+        Тест, что выше порога берётся оценка планировщика без COUNT(*).
+        """
+        paginator = EstimatedCountPaginator(c_models.Subject.objects.all(), 2)
+        paginator.estimate_threshold = 0
+
+        with CaptureQueriesContext(connection) as queries:
+            count = paginator.count
+
+        self.assertGreater(count, 0)
+        self.assertFalse(
+            any("COUNT(*)" in query["sql"] for query in queries),
+        )
@@ -0,0 +1,70 @@
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db.models import Count
+from django.test import TestCase
+
+import src.apps.courses.models as c_models
+
+
+class SeedCoursesCommandTests(TestCase):
+    """
+    Тесты команды seed_courses.
+    """
+
+    def test_seed_creates_requested_volume(self) -> None:
+        """
+        Команда создаёт заданное число объектов, контент всех типов и
+        сразу проставляет порядок модулей и контента.
+        """
+        call_command(
+            "seed_courses",
+            users=2,
+            subjects=3,
+            courses=2,
+            modules=3,
+            contents=5,
+            batch_size=3,
+            stdout=StringIO(),
+        )
+
+        self.assertEqual(User.objects.count(), 2)
+        self.assertTrue(
+            User.objects.first().has_perm("courses.change_course"),  # type: ignore
+        )
+        self.assertEqual(c_models.Subject.objects.count(), 3)
+        self.assertEqual(c_models.Course.objects.count(), 4)
+        self.assertEqual(c_models.Module.objects.count(), 12)
+        self.assertEqual(c_models.Content.objects.count(), 60)
+        for model in (
+            c_models.Text,
+            c_models.File,
+            c_models.Image,
+            c_models.Video,
+        ):
+            self.assertTrue(model.objects.exists())
+
+        module = c_models.Module.objects.first()
+        assert module is not None
+        self.assertEqual(
+            list(module.contents.values_list("order", flat=True)),
+            [0, 1024, 2048, 3072, 4096],
+        )
+        self.assertEqual(
+            list(
+                module.course.modules.values_list("order", flat=True),
+            ),
+            [0, 1, 2],
+        )
+        self.assertFalse(
+            c_models.Content.objects.values("module", "order")
+            .annotate(total=Count("id"))
+            .filter(total__gt=1)
+            .exists(),
+        )
+        for content in module.contents.all():
+            self.assertEqual(
+                getattr(content.item, "owner_id", None),
+                module.course.owner_id,
+            )
@@ -0,0 +1,90 @@
+from http import HTTPStatus
+from typing import Any
+
+from django.contrib.auth.models import User
+from django.core.files.base import ContentFile
+
+import src.apps.courses.models as c_models
+from src.apps.courses.tests.integration.media import TempMediaTestCase
+
+
+class TestContentFileView(TempMediaTestCase):
+    owner: User
+    item: c_models.File
+
+    def media_settings(self) -> dict[str, Any]:
+        return {"MEDIA_ACCEL_REDIRECT": True}
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.owner = User.objects.create_user(username="owner")
+        self.item = c_models.File.objects.create(
+            owner=self.owner,
+            title="Slides",
+            file=ContentFile(b"%PDF-1.4", name="deck.pdf"),
+        )
+
+    def test_owner_gets_accel_redirect(self) -> None:
+        """
+        Тест, что владельцу отдаётся X-Accel-Redirect на internal-локацию
+        без тела ответа, с типом и именем файла.
+        """
+        self.client.force_login(self.owner)
+
+        with self.assertNumQueries(3):
+            response = self.client.get(self.item.file_url())
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(
+            response["X-Accel-Redirect"],
+            f"/media/{self.item.file.name}",
+        )
+        self.assertEqual(response.content, b"")
+        self.assertEqual(response["Content-Type"], "application/pdf")
+        self.assertEqual(
+            response["Content-Disposition"],
+            'attachment; filename="Slides.pdf"',
+        )
+        self.assertIn("private", response["Cache-Control"])
+
+    def test_access_is_checked(self) -> None:
+        """
+        Тест, что чужой пользователь и чужое имя файла получают 404, а
+        анонимный пользователь - редирект на вход.
+        """
+        url = self.item.file_url()
+        self.assertEqual(
+            self.client.get(url).status_code,
+            HTTPStatus.FOUND,
+        )
+
+        self.client.force_login(User.objects.create_user(username="other"))
+        self.assertEqual(
+            self.client.get(url).status_code,
+            HTTPStatus.NOT_FOUND,
+        )
+
+        self.client.force_login(self.owner)
+        other = c_models.File.objects.create(
+            owner=self.owner,
+            title="Other",
+            file=ContentFile(b"other", name="other.pdf"),
+        )
+        self.assertEqual(
+            self.client.get(
+                self.item.file_url(str(other.file.name)),
+            ).status_code,
+            HTTPStatus.NOT_FOUND,
+        )
+
+    def test_served_by_django_without_nginx(self) -> None:
+        """
+        Тест, что без MEDIA_ACCEL_REDIRECT файл отдаёт сам Django.
+        """
+        self.client.force_login(self.owner)
+
+        with self.settings(MEDIA_ACCEL_REDIRECT=False):
+            response = self.client.get(self.item.file_url())
+
+        self.assertNotIn("X-Accel-Redirect", response)
+        self.assertEqual(response.getvalue(), b"%PDF-1.4")
@@ -0,0 +1,243 @@
+import os
+import subprocess
+import sys
+from datetime import timedelta
+from http import HTTPStatus
+from io import StringIO
+
+from django.conf import settings
+from django.contrib.auth.models import Permission, User
+from django.core.files.base import ContentFile
+from django.core.management import call_command
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+import src.apps.courses.models as c_models
+from src.apps.courses.tests.integration.media import TempMediaTestCase
+from src.apps.tasks.models import Task
+from src.apps.tasks.worker import Worker
+
+
+@override_settings(COURSE_DELETE_BATCH_SIZE=2)
+class TestCourseDeletion(TempMediaTestCase):
+    owner: User
+    course: c_models.Course
+    module: c_models.Module
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.owner = User.objects.create_user(username="owner")
+        self.owner.user_permissions.add(
+            *Permission.objects.filter(
+                codename__in=[
+                    "add_course",
+                    "change_course",
+                    "delete_course",
+                    "view_course",
+                ],
+            ),
+        )
+        self.course = c_models.Course.objects.create(
+            owner=self.owner,
+            subject=c_models.Subject.objects.create(title="Python"),
+            title="Big course",
+            slug="big-course",
+            overview="Overview.",
+        )
+        for index in range(3):
+            module = c_models.Module.objects.create(
+                course=self.course,
+                title=f"Module {index}",
+            )
+            for item in (
+                c_models.Text.objects.create(
+                    owner=self.owner,
+                    title="Text",
+                    content="Text.",
+                ),
+                c_models.Video.objects.create(
+                    owner=self.owner,
+                    title="Video",
+                    url="https://example.com/video",
+                ),
+                c_models.File.objects.create(
+                    owner=self.owner,
+                    title="Slides",
+                    file=ContentFile(b"slides", name="slides.pdf"),
+                ),
+            ):
+                c_models.Content.objects.create(module=module, item=item)
+        self.module = module
+        self.client.force_login(self.owner)
+
+    def test_delete_marks_course(self) -> None:
+        """
+        Тест, что запрос только помечает курс удалённым и ставит задачу,
+        а курс сразу пропадает из списка и его модули недоступны.
+        """
+        response = self.client.post(
+            reverse("courses:course_delete", args=[self.course.pk]),
+        )
+
+        self.assertEqual(response.status_code, HTTPStatus.FOUND)
+        self.assertFalse(c_models.Course.objects.exists())
+        course = c_models.Course.all_objects.get()
+        self.assertIsNotNone(course.deleted)
+        self.assertEqual(c_models.Content.objects.count(), 9)
+        self.assertTrue(Task.objects.filter(name__endswith="purge_course"))
+        self.assertEqual(
+            self.client.get(
+                reverse("courses:module_content_list", args=[self.module.pk]),
+            ).status_code,
+            HTTPStatus.NOT_FOUND,
+        )
+
+    def test_slug_is_freed(self) -> None:
+        """
+        Тест, что slug удалённого курса можно сразу занять новым курсом,
+        а занятый активным курсом slug отклоняется формой, а не ошибкой
+        базы данных.
+        """
+        data = {
+            "subject": self.course.subject_id,
+            "title": "New course",
+            "slug": self.course.slug,
+            "overview": "Overview.",
+        }
+        url = reverse("courses:course_create")
+
+        response = self.client.post(url, data)
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertTrue(response.context["form"].errors)
+
+        self.client.post(
+            reverse("courses:course_delete", args=[self.course.pk]),
+        )
+        response = self.client.post(url, data)
+
+        self.assertEqual(response.status_code, HTTPStatus.FOUND)
+        self.assertEqual(
+            c_models.Course.all_objects.filter(slug=self.course.slug).count(),
+            2,
+        )
+
+    def test_purge_removes_tree(self) -> None:
+        """
+        Тест, что фоновая задача удаляет модули, контент, элементы всех
+        типов и освобождает их файлы.
+        """
+        self.client.post(
+            reverse("courses:course_delete", args=[self.course.pk]),
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Worker().drain()
+        Worker().drain()
+
+        self.assertFalse(c_models.Course.all_objects.exists())
+        self.assertFalse(c_models.Module.objects.exists())
+        self.assertFalse(c_models.Content.objects.exists())
+        for model in (c_models.Text, c_models.Video, c_models.File):
+            self.assertFalse(model.objects.exists())
+        self.assertFalse(c_models.Blob.objects.exists())
+        self.assertFalse(
+            Task.objects.exclude(status=Task.Status.DONE).exists(),
+        )
+
+
+class CollectOrphansCommandTests(TempMediaTestCase):
+    """
+    Тесты команды collect_orphans.
+    """
+
+    owner: User
+    module: c_models.Module
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.owner = User.objects.create_user(username="owner")
+        course = c_models.Course.objects.create(
+            owner=self.owner,
+            subject=c_models.Subject.objects.create(title="Python"),
+            title="Course",
+            slug="course",
+            overview="Overview.",
+        )
+        self.module = c_models.Module.objects.create(
+            course=course,
+            title="Module",
+        )
+
+    def text(self, title: str, age: timedelta) -> c_models.Text:
+        text = c_models.Text.objects.create(
+            owner=self.owner,
+            title=title,
+            content="Text.",
+        )
+        c_models.Text.objects.filter(pk=text.pk).update(
+            created=timezone.now() - age,
+        )
+        return text
+
+    def test_orphans_are_deleted(self) -> None:
+        """
+        Удаляются только старые элементы без Content, пачками, вместе
+        с файлами; свежие и привязанные к модулю остаются.
+        """
+        old = timedelta(days=1)
+        orphans = [self.text(f"Orphan {index}", old) for index in range(3)]
+        used = self.text("Used", old)
+        c_models.Content.objects.create(module=self.module, item=used)
+        fresh = self.text("Fresh", timedelta())
+        file = c_models.File.objects.create(
+            owner=self.owner,
+            title="Slides",
+            file=ContentFile(b"slides", name="slides.pdf"),
+        )
+        c_models.File.objects.filter(pk=file.pk).update(
+            created=timezone.now() - old,
+        )
+
+        out = StringIO()
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command("collect_orphans", "--batch-size=2", stdout=out)
+        Worker().drain()
+
+        self.assertIn("text: deleted 3", out.getvalue())
+        self.assertIn("file: deleted 1", out.getvalue())
+        self.assertFalse(
+            c_models.Text.objects.filter(pk__in=[o.pk for o in orphans]),
+        )
+        self.assertQuerySetEqual(
+            c_models.Text.objects.order_by("pk"),
+            [used, fresh],
+        )
+        self.assertFalse(c_models.File.objects.exists())
+        self.assertFalse(c_models.Blob.objects.exists())
+
+
+class PurgeTaskRegistrationTests(SimpleTestCase):
+    def test_registered_without_checks(self) -> None:
+        """
+        Тест, что purge_course известна воркеру сразу после
+        django.setup(), без загрузки урлов системными проверками.
+        """
+        code = (
+            "import django; django.setup(); "
+            "from src.apps.tasks import queue; "
+            "print(queue.get('src.apps.courses.deletion.purge_course'))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            check=True,
+            cwd=settings.BASE_DIR.parent,
+            env={
+                **os.environ,
+                "DJANGO_SETTINGS_MODULE": settings.SETTINGS_MODULE,
+            },
+            text=True,
+        )
+
+        self.assertIn("purge_course", result.stdout)
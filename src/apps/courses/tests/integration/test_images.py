@@ -0,0 +1,155 @@
+from io import BytesIO, StringIO
+from typing import Any
+
+from django.contrib.auth.models import User
+from django.core.files.base import ContentFile
+from django.core.management import call_command
+from django.template import Context, Template
+from PIL import Image as PILImage
+
+import src.apps.courses.models as c_models
+from src.apps.courses.tests.integration.media import TempMediaTestCase
+from src.apps.tasks.worker import Worker
+
+
+def png(width: int, height: int) -> bytes:
+    buffer = BytesIO()
+    PILImage.new("RGBA", (width, height), (200, 40, 40, 128)).save(
+        buffer,
+        "PNG",
+    )
+    return buffer.getvalue()
+
+
+class ImageVariantsTestCase(TempMediaTestCase):
+    user: User
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = User.objects.create_user(username="owner")
+
+    def media_settings(self) -> dict[str, Any]:
+        return {
+            "IMAGE_VARIANT_WIDTHS": [16, 64],
+            "IMAGE_VARIANT_FORMATS": ["webp", "unknown"],
+        }
+
+    def create(self, data: bytes, name: str = "logo.png") -> c_models.Image:
+        image = c_models.Image.objects.create(
+            owner=self.user,
+            title="Logo",
+            file=ContentFile(data, name=name),
+        )
+        Worker().drain()
+        image.refresh_from_db()
+        return image
+
+
+class TestImageVariants(ImageVariantsTestCase):
+    def test_variants_are_recorded(self) -> None:
+        """
+        Тест, что после загрузки создаются уменьшенные копии в
+        поддерживаемых форматах и записываются в модель.
+        """
+        image = self.create(png(100, 50))
+
+        assert image.variants is not None
+        self.assertEqual(
+            [
+                (variant["format"], variant["width"], variant["height"])
+                for variant in image.variants
+            ],
+            [("webp", 16, 8), ("webp", 64, 32)],
+        )
+        for variant in image.variants:
+            with PILImage.open(self.media_root / variant["name"]) as file:
+                self.assertEqual(file.format, "WEBP")
+                self.assertEqual(file.width, variant["width"])
+
+    def test_small_image_is_not_upscaled(self) -> None:
+        """
+        Тест, что изображение меньше наибольшей ширины не увеличивается.
+        """
+        image = self.create(png(40, 40))
+
+        assert image.variants is not None
+        self.assertEqual(
+            [variant["width"] for variant in image.variants],
+            [16, 40],
+        )
+
+    def test_not_an_image(self) -> None:
+        """
+        Тест, что для файла, который не является изображением, вариантов
+        нет и повторно он не обрабатывается.
+        """
+        image = self.create(b"not an image", name="logo.png")
+        self.assertEqual(image.variants, [])
+
+    def test_variants_are_released(self) -> None:
+        """
+        Тест, что варианты освобождаются при замене файла и при удалении
+        изображения.
+        """
+        image = self.create(png(100, 50))
+        assert image.variants is not None
+        old_names = {variant["name"] for variant in image.variants}
+
+        with self.captureOnCommitCallbacks(execute=True):
+            image.file = ContentFile(png(80, 80), name="logo.png")
+            image.save()
+        Worker().drain()
+        image.refresh_from_db()
+        self.assertFalse(c_models.Blob.objects.filter(name__in=old_names))
+        assert image.variants is not None
+        self.assertEqual(len(image.variants), 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            image.delete()
+        Worker().drain()
+        self.assertFalse(c_models.Blob.objects.exists())
+
+    def test_picture_tag(self) -> None:
+        """
+        Тест, что тег picture выводит srcset вариантов и исходный файл
+        в img.
+        """
+        image = self.create(png(100, 50))
+        assert image.variants is not None
+
+        html = Template(
+            '{% load course %}{% picture image sizes="50vw" %}',
+        ).render(Context({"image": image}))
+
+        urls = [image.file_url(variant["name"]) for variant in image.variants]
+        self.assertInHTML(
+            f'<source type="image/webp" srcset="{urls[0]} 16w, '
+            f'{urls[1]} 64w" sizes="50vw">',
+            html,
+        )
+        self.assertIn(f'src="{image.file_url()}"', html)
+        self.assertIn('width="64" height="32"', html)
+
+
+class GenerateImageVariantsCommandTests(ImageVariantsTestCase):
+    """
+    Тесты команды generate_image_variants.
+    """
+
+    def test_pending_images_are_processed(self) -> None:
+        """
+        Команда создаёт варианты изображений, которые ещё не обработаны.
+        """
+        image = c_models.Image.objects.create(
+            owner=self.user,
+            title="Logo",
+            file=ContentFile(png(100, 50), name="logo.png"),
+        )
+
+        out = StringIO()
+        call_command("generate_image_variants", stdout=out)
+
+        image.refresh_from_db()
+        self.assertIn("Processed 1 images", out.getvalue())
+        assert image.variants is not None
+        self.assertEqual(len(image.variants), 2)
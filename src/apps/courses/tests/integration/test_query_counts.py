@@ -0,0 +1,388 @@
+import json
+from collections.abc import Callable
+from typing import Any
+
+from django.contrib.auth.models import Permission, User
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+import src.apps.courses.models as c_models
+from src.apps.courses.ordering import rebalance_order
+from src.apps.courses.tests.integration.media import TempMediaTestCase
+
+
+class CoursesQueryCountTests(TempMediaTestCase):
+    """
+    Регрессионные тесты числа запросов для всех урлов courses.
+
+    Каждый тест выполняет запрос на маленьком курсе, затем добавляет
+    модули и контент и повторяет запрос: число запросов не должно
+    зависеть от количества модулей (N) и контента (M).
+    """
+
+    user: User
+    subject: c_models.Subject
+    course: c_models.Course
+    module: c_models.Module
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = User.objects.create_user(
+            username="owner_user",
+            password="password123",
+        )
+        permissions = Permission.objects.filter(
+            codename__in=[
+                "view_course",
+                "add_course",
+                "change_course",
+                "delete_course",
+            ],
+        )
+        cls.user.user_permissions.add(*permissions)
+        cls.subject = c_models.Subject.objects.create(
+            title="Python",
+            slug="python",
+        )
+        cls.course = c_models.Course.objects.create(
+            owner=cls.user,
+            subject=cls.subject,
+            title="Course",
+            slug="course",
+            overview="Course description.",
+        )
+        cls.module = c_models.Module.objects.create(
+            course=cls.course,
+            title="First module",
+        )
+
+    def media_settings(self) -> dict[str, Any]:
+        return {"UPLOAD_STAGING_DIR": self.media_root / "staging"}
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.client.force_login(self.user)
+
+    def grow(self, modules: int, contents: int) -> None:
+        """
+        Добавляет курсу modules модулей и по contents элементов контента
+        каждого типа в каждый модуль, включая первый.
+        """
+        new_modules = [
+            c_models.Module.objects.create(course=self.course, title=f"M{i}")
+            for i in range(modules)
+        ]
+        for module in [self.module, *new_modules]:
+            for i in range(contents):
+                for item in self.create_items(i):
+                    c_models.Content.objects.create(module=module, item=item)
+        c_models.Course.objects.create(
+            owner=self.user,
+            subject=self.subject,
+            title="Other course",
+            slug=f"other-{c_models.Course.objects.count()}",
+            overview="Other course.",
+        )
+
+    def create_items(self, index: int) -> list[c_models.ItemBase]:
+        return [
+            c_models.Text.objects.create(
+                owner=self.user,
+                title=f"text {index}",
+                content="text",
+            ),
+            c_models.File.objects.create(
+                owner=self.user,
+                title=f"file {index}",
+                file="files/file.pdf",
+            ),
+            c_models.Image.objects.create(
+                owner=self.user,
+                title=f"image {index}",
+                file="images/image.png",
+            ),
+            c_models.Video.objects.create(
+                owner=self.user,
+                title=f"video {index}",
+                url="https://example.com/video",
+            ),
+        ]
+
+    def count_queries(
+        self,
+        request: Callable[[], Any],
+        prepare: Callable[[], None] | None = None,
+    ) -> int:
+        if prepare is not None:
+            prepare()
+        cache.clear()
+        ContentType.objects.clear_cache()
+        with CaptureQueriesContext(connection) as queries:
+            response = request()
+        self.assertLess(response.status_code, 400)
+        return len(queries)
+
+    def assert_queries_constant(
+        self,
+        request: Callable[[], Any],
+        prepare: Callable[[], None] | None = None,
+    ) -> None:
+        self.grow(modules=1, contents=1)
+        small = self.count_queries(request, prepare)
+        self.grow(modules=5, contents=3)
+        large = self.count_queries(request, prepare)
+        self.assertEqual(small, large)
+
+    def test_manage_course_list(self) -> None:
+        """
+        Список курсов владельца.
+        """
+        url = reverse("courses:manage_course_list")
+        self.assert_queries_constant(lambda: self.client.get(url))
+
+    def test_course_create(self) -> None:
+        """
+        Форма создания курса.
+        """
+        url = reverse("courses:course_create")
+        self.assert_queries_constant(lambda: self.client.get(url))
+
+    def test_course_edit(self) -> None:
+        """
+        Форма редактирования курса.
+        """
+        url = reverse("courses:course_edit", args=[self.course.pk])
+        self.assert_queries_constant(lambda: self.client.get(url))
+
+    def test_course_delete_confirmation(self) -> None:
+        """
+        Подтверждение удаления курса.
+        """
+        url = reverse("courses:course_delete", args=[self.course.pk])
+        self.assert_queries_constant(lambda: self.client.get(url))
+
+    def test_course_module_update(self) -> None:
+        """
+        Формсет модулей курса.
+        """
+        url = reverse("courses:course_module_update", args=[self.course.pk])
+        self.assert_queries_constant(lambda: self.client.get(url))
+
+    def test_module_content_list(self) -> None:
+        """
+        Список контента модуля.
+        """
+        url = reverse("courses:module_content_list", args=[self.module.pk])
+        self.assert_queries_constant(lambda: self.client.get(url))
+
+    def test_module_content_create(self) -> None:
+        """
+        Форма создания контента.
+        """
+        url = reverse(
+            "courses:module_content_create",
+            args=[self.module.pk, "text"],
+        )
+        self.assert_queries_constant(lambda: self.client.get(url))
+
+    def test_module_content_create_post(self) -> None:
+        """
+        Создание контента.
+        """
+        url = reverse(
+            "courses:module_content_create",
+            args=[self.module.pk, "text"],
+        )
+        self.assert_queries_constant(
+            lambda: self.client.post(url, {"title": "new", "content": "x"}),
+        )
+
+    def test_module_content_update(self) -> None:
+        """
+        Форма редактирования контента.
+        """
+        text = c_models.Text.objects.create(
+            owner=self.user,
+            title="edited",
+            content="text",
+        )
+        c_models.Content.objects.create(module=self.module, item=text)
+        url = reverse(
+            "courses:module_content_update",
+            args=[self.module.pk, "text", text.pk],
+        )
+        self.assert_queries_constant(lambda: self.client.get(url))
+
+    def test_module_content_delete(self) -> None:
+        """
+        Удаление контента.
+        """
+        urls: list[str] = []
+
+        def prepare() -> None:
+            text = c_models.Text.objects.create(
+                owner=self.user,
+                title="deleted",
+                content="text",
+            )
+            content = c_models.Content.objects.create(
+                module=self.module,
+                item=text,
+            )
+            urls.append(
+                reverse("courses:module_content_delete", args=[content.pk]),
+            )
+
+        self.assert_queries_constant(
+            lambda: self.client.post(urls[-1]),
+            prepare,
+        )
+
+    def test_course_module_order(self) -> None:
+        """
+        Изменение порядка модулей курса.
+        """
+        url = reverse("courses:course_module_order", args=[self.course.pk])
+
+        def request() -> Any:
+            ids = list(
+                self.course.modules.order_by("-order").values_list(
+                    "id",
+                    flat=True,
+                ),
+            )
+            return self.client.post(
+                url,
+                json.dumps({"ids": ids}),
+                content_type="application/json",
+            )
+
+        self.assert_queries_constant(request)
+
+    def test_module_content_order(self) -> None:
+        """
+        Изменение порядка контента модуля.
+        """
+        url = reverse("courses:module_content_order", args=[self.module.pk])
+
+        def request() -> Any:
+            ids = list(
+                self.module.contents.order_by("-order").values_list(
+                    "id",
+                    flat=True,
+                ),
+            )
+            return self.client.post(
+                url,
+                json.dumps({"ids": ids}),
+                content_type="application/json",
+            )
+
+        self.assert_queries_constant(request)
+
+    def test_module_content_move(self) -> None:
+        """
+        Перемещение одного элемента контента. Перед каждым замером ключи
+        перенумеровываются, чтобы зазор в начале был одинаковым.
+        """
+        url = reverse("courses:module_content_order", args=[self.module.pk])
+
+        def prepare() -> None:
+            rebalance_order(
+                model="courses.content",
+                field="order",
+                lookup={"module_id": self.module.pk},
+            )
+
+        def request() -> Any:
+            content = self.module.contents.last()
+            assert content is not None
+            return self.client.post(
+                url,
+                json.dumps({"id": content.pk, "position": 0}),
+                content_type="application/json",
+            )
+
+        self.assert_queries_constant(request, prepare)
+
+    def test_content_file(self) -> None:
+        """
+        Отдача файла элемента контента.
+        """
+        item = c_models.File.objects.create(
+            owner=self.user,
+            title="Slides",
+            file=ContentFile(b"%PDF-1.4", name="slides.pdf"),
+        )
+        url = reverse(
+            "courses:content_file",
+            args=["file", item.pk, item.file.name],
+        )
+        self.assert_queries_constant(lambda: self.client.get(url))
+
+    def test_search(self) -> None:
+        """
+        Поиск по курсам и текстам владельца.
+        """
+        url = reverse("courses:search")
+        self.assert_queries_constant(
+            lambda: self.client.get(url, {"q": "text"}),
+        )
+
+    def test_upload_create(self) -> None:
+        """
+        Начало возобновляемой загрузки.
+        """
+        url = reverse("courses:upload_create")
+        self.assert_queries_constant(
+            lambda: self.client.post(
+                url,
+                json.dumps(
+                    {"model": "file", "filename": "video.mp4", "size": 10},
+                ),
+                content_type="application/json",
+            ),
+        )
+
+    def test_upload_put(self) -> None:
+        """
+        Дозапись куска возобновляемой загрузки.
+        """
+        urls: list[str] = []
+
+        def prepare() -> None:
+            upload = c_models.Upload.objects.create(
+                owner=self.user,
+                model_name="file",
+                filename="video.mp4",
+                size=10,
+            )
+            upload.path.touch()
+            urls.append(reverse("courses:upload", args=[upload.pk]))
+
+        self.assert_queries_constant(
+            lambda: self.client.put(
+                urls[-1],
+                b"0123456789",
+                content_type="application/octet-stream",
+                headers={"Upload-Offset": "0"},
+            ),
+            prepare,
+        )
+
+    def test_upload_state(self) -> None:
+        """
+        Состояние возобновляемой загрузки.
+        """
+        upload = c_models.Upload.objects.create(
+            owner=self.user,
+            model_name="file",
+            filename="video.mp4",
+            size=10,
+        )
+        url = reverse("courses:upload", args=[upload.pk])
+        self.assert_queries_constant(lambda: self.client.get(url))
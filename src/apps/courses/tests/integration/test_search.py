@@ -0,0 +1,216 @@
+from http import HTTPStatus
+from unittest import skipIf, skipUnless
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.db.models import Q
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+
+import src.apps.courses.models as c_models
+from src.apps.courses.search import (
+    search_courses,
+    search_query,
+    search_texts,
+    substring_match,
+)
+from src.apps.courses.templatetags.course import highlight
+
+
+class SearchTestCase(TestCase):
+    owner: User
+    subject: c_models.Subject
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.owner = User.objects.create_user(username="owner")
+        cls.subject = c_models.Subject.objects.create(title="Программирование")
+
+    def course(
+        self,
+        title: str,
+        overview: str = "Описание.",
+        owner: User | None = None,
+    ) -> c_models.Course:
+        return c_models.Course.objects.create(
+            owner=owner or self.owner,
+            subject=self.subject,
+            title=title,
+            slug=title.lower().replace(" ", "-"),
+            overview=overview,
+        )
+
+    def text(self, module: c_models.Module, content: str) -> c_models.Text:
+        text = c_models.Text.objects.create(
+            owner=self.owner,
+            title="Лекция",
+            content=content,
+        )
+        c_models.Content.objects.create(module=module, item=text)
+        return text
+
+
+@skipUnless(connection.vendor == "postgresql", "только в PostgreSQL")
+class TestSearch(SearchTestCase):
+    def test_courses_are_ranked(self) -> None:
+        """
+        Тест, что совпадение в названии весит больше, чем в описании, а
+        слова находятся в других формах.
+        """
+        in_overview = self.course("Основы", "Курс про базы данных.")
+        in_title = self.course("Базы данных")
+
+        courses = search_courses(search_query("база"), self.owner.pk)
+
+        self.assertEqual(list(courses), [in_title, in_overview])
+        self.assertEqual(
+            getattr(courses[1], "headline"),
+            "Курс про \x02базы\x03 данных",
+        )
+
+    def test_courses_found_by_modules_and_texts(self) -> None:
+        """
+        Тест, что курс находится по описанию модуля и по тексту в нём, а
+        чужие и удалённые курсы не находятся.
+        """
+        by_module = self.course("Первый")
+        c_models.Module.objects.create(
+            course=by_module,
+            title="Введение",
+            description="Установка интерпретатора.",
+        )
+        by_text = self.course("Второй")
+        module = c_models.Module.objects.create(course=by_text, title="Урок")
+        self.text(module, "Интерпретатор читает код построчно.")
+        deleted = self.course("Третий", "Про интерпретатор.")
+        deleted.deleted = deleted.created
+        deleted.save()
+        self.course(
+            "Чужой",
+            "Про интерпретатор.",
+            owner=User.objects.create_user(username="other"),
+        )
+
+        courses = search_courses(search_query("интерпретаторы"), self.owner.pk)
+
+        self.assertQuerySetEqual(courses, [by_module, by_text], ordered=False)
+
+    def test_vector_follows_updates(self) -> None:
+        """
+        Тест, что search_vector пересчитывается при изменении строки.
+        """
+        course = self.course("Старое название")
+        course.title = "Алгоритмы"
+        course.save()
+
+        self.assertQuerySetEqual(
+            search_courses(search_query("алгоритм"), self.owner.pk),
+            [course],
+        )
+        self.assertFalse(
+            search_courses(search_query("старое"), self.owner.pk).exists(),
+        )
+
+    def test_texts(self) -> None:
+        """
+        Тест, что тексты находятся с модулем и подсветкой, а тексты вне
+        модулей не выводятся.
+        """
+        module = c_models.Module.objects.create(
+            course=self.course("Курс"),
+            title="Модуль",
+        )
+        text = self.text(module, "Кортежи <b>неизменяемы</b> & хешируемы")
+        c_models.Text.objects.create(
+            owner=self.owner,
+            title="Сирота",
+            content="Кортежи.",
+        )
+
+        texts = search_texts(search_query("кортеж"), self.owner.pk)
+
+        [found] = texts
+        self.assertEqual(found, text)
+        self.assertEqual(getattr(found, "module_id"), module.pk)
+        self.assertEqual(
+            highlight(getattr(found, "headline")),
+            "<mark>Кортежи</mark>  неизменяемы  &amp; хешируемы",
+        )
+
+
+class TestSearchView(SearchTestCase):
+    @skipUnless(connection.vendor == "postgresql", "только в PostgreSQL")
+    def test_results_are_rendered(self) -> None:
+        """
+        Тест, что страница поиска выводит курсы и тексты с подсветкой.
+        """
+        course = self.course("Базы данных", "Курс про базы данных.")
+        module = c_models.Module.objects.create(course=course, title="Урок")
+        self.text(module, "Индексы ускоряют запросы.")
+        self.client.force_login(self.owner)
+
+        response = self.client.get(reverse("courses:search"), {"q": "база"})
+        self.assertContains(response, "<mark>базы</mark>", html=False)
+
+        response = self.client.get(reverse("courses:search"), {"q": "индекс"})
+        self.assertContains(response, "<mark>Индексы</mark>", html=False)
+        self.assertContains(
+            response,
+            reverse("courses:module_content_list", args=[module.pk]),
+        )
+
+    def test_login_required(self) -> None:
+        """
+        Тест, что анонимный пользователь перенаправляется на вход.
+        """
+        response = self.client.get(reverse("courses:search"), {"q": "база"})
+        self.assertEqual(response.status_code, HTTPStatus.FOUND)
+
+
+@skipIf(connection.vendor == "postgresql", "поиск подстрок вне PostgreSQL")
+class TestSubstringSearch(SearchTestCase):
+    def test_courses_and_texts(self) -> None:
+        """
+        Тест, что без PostgreSQL курсы и тексты находятся по подстроке в
+        названии, описании, модулях и текстах, а исключённые слова
+        отсеивают результаты.
+        """
+        by_title = self.course("Django basics")
+        by_module = self.course("Second")
+        c_models.Module.objects.create(
+            course=by_module,
+            title="Intro",
+            description="Installing Django.",
+        )
+        by_text = self.course("Third")
+        module = c_models.Module.objects.create(course=by_text, title="Урок")
+        text = self.text(module, "Django templates and Flask.")
+
+        self.assertQuerySetEqual(
+            search_courses(search_query("django"), self.owner.pk),
+            [by_title, by_module, by_text],
+            ordered=False,
+        )
+        self.assertQuerySetEqual(
+            search_courses(search_query("django -flask"), self.owner.pk),
+            [by_title, by_module],
+            ordered=False,
+        )
+        [found] = search_texts(search_query("templates"), self.owner.pk)
+        self.assertEqual(found, text)
+        self.assertEqual(getattr(found, "module_id"), module.pk)
+        self.assertEqual(getattr(found, "headline"), text.content)
+
+
+class TestSubstringMatch(SimpleTestCase):
+    def test_websearch_syntax(self) -> None:
+        """
+        Тест разбора слов, "фраз", -исключений и or.
+        """
+        self.assertEqual(
+            substring_match(search_query('big "data set" -old or go')),
+            Q(search_vector__icontains="big")
+            & Q(search_vector__icontains="data set")
+            & ~Q(search_vector__icontains="old")
+            | Q(search_vector__icontains="go"),
+        )
@@ -0,0 +1,141 @@
+import hashlib
+from io import StringIO
+from pathlib import Path
+
+from django.contrib.auth.models import User
+from django.core.files.base import ContentFile
+from django.core.management import call_command
+
+import src.apps.courses.models as c_models
+from src.apps.courses.storage import blob_name
+from src.apps.courses.tests.integration.media import TempMediaTestCase
+from src.apps.tasks.worker import Worker
+
+
+class BlobStorageTestCase(TempMediaTestCase):
+    user: User
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = User.objects.create_user(username="owner")
+
+    def create(
+        self,
+        data: bytes,
+        name: str = "slides.pdf",
+        model: type[c_models.FileItemBase] = c_models.File,
+    ) -> c_models.FileItemBase:
+        return model._default_manager.create(
+            owner=self.user,
+            title=name,
+            file=ContentFile(data, name=name),
+        )
+
+    def delete(self, item: c_models.FileItemBase) -> None:
+        # django_cleanup удаляет файлы после коммита транзакции, а само
+        # удаление выполняет фоновая задача.
+        with self.captureOnCommitCallbacks(execute=True):
+            item.delete()
+        Worker().drain()
+
+
+class TestContentAddressedStorage(BlobStorageTestCase):
+    def test_same_content_is_stored_once(self) -> None:
+        """
+        Тест, что одинаковые файлы разных элементов хранятся одним
+        файлом с именем по sha256.
+        """
+        data = b"slide deck"
+        checksum = hashlib.sha256(data).hexdigest()
+        first = self.create(data)
+        second = self.create(data, name="copy.PDF", model=c_models.Image)
+
+        self.assertEqual(first.file.name, blob_name(checksum, ".pdf"))
+        self.assertEqual(second.file.name, first.file.name)
+        self.assertEqual(first.checksum, checksum)
+        self.assertEqual(c_models.Blob.objects.get().refs, 2)
+        self.assertEqual(
+            [path for path in self.media_root.rglob("*") if path.is_file()],
+            [Path(first.file.path)],
+        )
+
+    def test_blob_is_deleted_with_last_reference(self) -> None:
+        """
+        Тест, что django_cleanup удаляет файл только вместе с последним
+        ссылающимся на него элементом.
+        """
+        first = self.create(b"logo")
+        second = self.create(b"logo")
+        path = Path(first.file.path)
+
+        self.delete(first)
+        self.assertTrue(path.exists())
+        self.assertEqual(c_models.Blob.objects.get().refs, 1)
+
+        self.delete(second)
+        self.assertFalse(path.exists())
+        self.assertFalse(c_models.Blob.objects.exists())
+
+    def test_replaced_file_releases_reference(self) -> None:
+        """
+        Тест, что замена файла у элемента освобождает ссылку на прежний.
+        """
+        shared = self.create(b"v1")
+        item = self.create(b"v1")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            item.file = ContentFile(b"v2", name="slides.pdf")
+            item.save()
+        Worker().drain()
+
+        self.assertEqual(
+            c_models.Blob.objects.get(name=shared.file.name).refs,
+            1,
+        )
+        self.assertEqual(
+            c_models.Blob.objects.get(name=item.file.name).refs,
+            1,
+        )
+
+
+class DedupeMediaCommandTests(BlobStorageTestCase):
+    """
+    Тесты команды dedupe_media.
+    """
+
+    def test_legacy_files_are_moved(self) -> None:
+        """
+        Файлы, загруженные до контентно-адресуемого хранилища, переносятся
+        в blobs/ с объединением дубликатов, а прежние копии удаляются.
+        """
+        legacy = self.media_root / "files"
+        legacy.mkdir()
+        for name in ("a.pdf", "b.pdf"):
+            (legacy / name).write_bytes(b"same deck")
+            c_models.File.objects.create(
+                owner=self.user,
+                title=name,
+                file=f"files/{name}",
+            )
+        c_models.File.objects.create(
+            owner=self.user,
+            title="lost",
+            file="files/lost.pdf",
+        )
+
+        out = StringIO()
+        call_command("dedupe_media", stdout=out)
+
+        self.assertIn("file: moved 2, missing 1", out.getvalue())
+        self.assertEqual(list(legacy.iterdir()), [])
+        blob = c_models.Blob.objects.get()
+        self.assertEqual(blob.refs, 2)
+        self.assertEqual(
+            set(
+                c_models.File.objects.exclude(title="lost").values_list(
+                    "file",
+                    "checksum",
+                ),
+            ),
+            {(blob.name, hashlib.sha256(b"same deck").hexdigest())},
+        )
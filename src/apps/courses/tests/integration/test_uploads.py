@@ -0,0 +1,274 @@
+import hashlib
+import json
+import os
+import time
+from datetime import timedelta
+from http import HTTPStatus
+from io import StringIO
+from pathlib import Path
+from typing import Any
+
+from django.contrib.auth.models import Permission, User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+
+import src.apps.courses.models as c_models
+from src.apps.courses.tests.integration.media import TempMediaTestCase
+
+
+class UploadTestCase(TempMediaTestCase):
+    user: User
+    module: c_models.Module
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = User.objects.create_user(username="uploader")
+        permissions = Permission.objects.filter(
+            codename__in=["add_course", "change_course", "delete_course"],
+        )
+        cls.user.user_permissions.add(*permissions)
+        course = c_models.Course.objects.create(
+            owner=cls.user,
+            subject=c_models.Subject.objects.create(title="Uploads"),
+            title="Uploads",
+            slug="uploads",
+            overview="Uploads.",
+        )
+        cls.module = c_models.Module.objects.create(
+            course=course,
+            title="Module",
+        )
+
+    def media_settings(self) -> dict[str, Any]:
+        return {
+            "UPLOAD_STAGING_DIR": self.media_root / "staging",
+            "UPLOAD_MAX_SIZES": {"file": 64, "image": 16},
+        }
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.client.force_login(self.user)
+
+    def staged_files(self) -> list[Path]:
+        return list((self.media_root / "staging").glob("*"))
+
+    def create_url(self, model_name: str = "file") -> str:
+        return reverse(
+            "courses:module_content_create",
+            args=[self.module.pk, model_name],
+        )
+
+
+class TestStreamingUpload(UploadTestCase):
+    def test_upload_is_moved_with_checksum(self) -> None:
+        """
+        Тест, что файл сохраняется в хранилище, его sha256 записывается,
+        а во временном каталоге ничего не остаётся.
+        """
+        data = b"%PDF-1.4 slides"
+        response = self.client.post(
+            self.create_url(),
+            {
+                "title": "Slides",
+                "file": SimpleUploadedFile("slides.pdf", data),
+            },
+        )
+
+        self.assertEqual(response.status_code, HTTPStatus.FOUND)
+        item = c_models.File.objects.get()
+        self.assertEqual(item.checksum, hashlib.sha256(data).hexdigest())
+        self.assertTrue(str(item.file.name).endswith(".pdf"))
+        self.assertEqual(
+            Path(item.file.path).read_bytes(),
+            data,
+        )
+        self.assertEqual(self.staged_files(), [])
+
+    def test_per_type_limit(self) -> None:
+        """
+        Тест, что файл больше лимита своего типа отклоняется и не
+        остаётся на диске.
+        """
+        response = self.client.post(
+            self.create_url("image"),
+            {
+                "title": "Logo",
+                "file": SimpleUploadedFile("logo.png", b"x" * 32),
+            },
+        )
+
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.assertFalse(c_models.Image.objects.exists())
+        self.assertEqual(self.staged_files(), [])
+
+
+class TestResumableUpload(UploadTestCase):
+    def start(self, size: int, model_name: str = "file") -> dict:
+        response = self.client.post(
+            reverse("courses:upload_create"),
+            json.dumps(
+                {"model": model_name, "filename": "video.mp4", "size": size},
+            ),
+            content_type="application/json",
+        )
+        return {"status": response.status_code, **response.json()}
+
+    def put(self, upload_id: str, offset: int, data: bytes) -> dict:
+        response = self.client.put(
+            reverse("courses:upload", args=[upload_id]),
+            data,
+            content_type="application/octet-stream",
+            headers={"Upload-Offset": str(offset)},
+        )
+        return {"status": response.status_code, **response.json()}
+
+    def test_resume_and_attach(self) -> None:
+        """
+        Тест загрузки в несколько запросов с возобновлением и
+        прикрепления готовой загрузки к новому контенту.
+        """
+        data = b"0123456789" * 5
+        upload = self.start(len(data))
+        self.assertEqual(upload["status"], HTTPStatus.CREATED)
+
+        first = self.put(upload["id"], 0, data[:20])
+        self.assertEqual(first["offset"], 20)
+        stale = self.put(upload["id"], 0, data[:20])
+        self.assertEqual(stale["status"], HTTPStatus.CONFLICT)
+        self.assertEqual(stale["offset"], 20)
+        state = self.client.get(
+            reverse("courses:upload", args=[upload["id"]]),
+        ).json()
+        self.assertFalse(state["complete"])
+
+        last = self.put(upload["id"], state["offset"], data[20:])
+        self.assertTrue(last["complete"])
+
+        response = self.client.post(
+            self.create_url(),
+            {"title": "Lecture", "upload": upload["id"]},
+        )
+        self.assertEqual(response.status_code, HTTPStatus.FOUND)
+        item = c_models.File.objects.get()
+        self.assertEqual(item.checksum, hashlib.sha256(data).hexdigest())
+        self.assertEqual(
+            Path(item.file.path).read_bytes(),
+            data,
+        )
+        self.assertFalse(c_models.Upload.objects.exists())
+        self.assertEqual(self.staged_files(), [])
+
+    def test_declared_size_limit(self) -> None:
+        """
+        Тест, что загрузка больше лимита типа не начинается.
+        """
+        upload = self.start(17, model_name="image")
+        self.assertEqual(upload["status"], HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+
+    def test_data_beyond_declared_size(self) -> None:
+        """
+        Тест, что данные сверх объявленного размера отклоняются.
+        """
+        upload = self.start(10)
+        response = self.put(upload["id"], 0, b"x" * 11)
+        self.assertEqual(
+            response["status"],
+            HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+        )
+        self.assertEqual(
+            c_models.Upload.objects.get(pk=upload["id"]).offset,
+            0,
+        )
+
+    def test_leased_upload_is_busy(self) -> None:
+        """
+        Тест, что кусок не принимается, пока аренду держит другой
+        запрос, и принимается после её истечения.
+        """
+        upload = self.start(10)
+        c_models.Upload.objects.filter(pk=upload["id"]).update(
+            locked_until=timezone.now() + timedelta(minutes=1),
+        )
+        busy = self.put(upload["id"], 0, b"x" * 10)
+        self.assertEqual(busy["status"], HTTPStatus.CONFLICT)
+
+        c_models.Upload.objects.filter(pk=upload["id"]).update(
+            locked_until=timezone.now() - timedelta(seconds=1),
+        )
+        done = self.put(upload["id"], 0, b"x" * 10)
+        self.assertTrue(done["complete"])
+        self.assertIsNone(
+            c_models.Upload.objects.get(pk=upload["id"]).locked_until,
+        )
+
+    def test_incomplete_upload_cannot_be_attached(self) -> None:
+        """
+        Тест, что незавершённую загрузку нельзя прикрепить к контенту.
+        """
+        upload = self.start(10)
+        response = self.client.post(
+            self.create_url(),
+            {"title": "Lecture", "upload": upload["id"]},
+        )
+        self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
+        self.assertFalse(c_models.File.objects.exists())
+
+    def test_duplicate_upload_is_discarded(self) -> None:
+        """
+        Тест, что загрузка уже хранящегося содержимого не остаётся во
+        временном каталоге.
+        """
+        data = b"same video"
+        self.client.post(
+            self.create_url(),
+            {"title": "First", "file": SimpleUploadedFile("a.mp4", data)},
+        )
+        upload = self.start(len(data))
+        self.put(upload["id"], 0, data)
+
+        self.client.post(
+            self.create_url(),
+            {"title": "Second", "upload": upload["id"]},
+        )
+        self.assertEqual(c_models.Blob.objects.get().refs, 2)
+        self.assertEqual(self.staged_files(), [])
+
+
+class ClearUploadsCommandTests(UploadTestCase):
+    """
+    Тесты команды clear_uploads.
+    """
+
+    def upload(self) -> c_models.Upload:
+        upload = c_models.Upload.objects.create(
+            owner=self.user,
+            model_name="file",
+            filename="video.mp4",
+            size=10,
+        )
+        upload.path.touch()
+        return upload
+
+    def test_expired_uploads_are_deleted(self) -> None:
+        """
+        Удаляются старые загрузки с файлами и старые файлы без строки
+        Upload; свежие загрузки остаются.
+        """
+        fresh = self.upload()
+        expired = self.upload()
+        c_models.Upload.objects.filter(pk=expired.pk).update(
+            created=timezone.now() - timedelta(days=2),
+        )
+        stray = self.media_root / "staging" / "stray.upload.pdf"
+        stray.write_bytes(b"x")
+        old = time.time() - 2 * 24 * 3600
+        os.utime(stray, (old, old))
+
+        out = StringIO()
+        call_command("clear_uploads", stdout=out)
+
+        self.assertIn("Deleted 1 uploads and 1 files", out.getvalue())
+        self.assertQuerySetEqual(c_models.Upload.objects.all(), [fresh])
+        self.assertEqual(self.staged_files(), [fresh.path])
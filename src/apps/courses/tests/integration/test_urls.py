@@ -135,7 +135,10 @@ class ModuleContentUrlsTests(TestCase):
         """
         Тестирование доступности GET запроса к ContentCreateUpdateView
         """
-        url = reverse("courses:module_content_create", args=[1, "video"])
+        url = reverse(
+            "courses:module_content_create",
+            args=[self.module.pk, "video"],
+        )
         resolved = resolve(url)
         self.assertEqual(
             resolved.func.__name__,
@@ -174,7 +177,7 @@ class ModuleContentUrlsTests(TestCase):
         """
         Тестирование доступности GET запроса к ModuleContentListView
         """
-        url = reverse("courses:module_content_list", args=[1])
+        url = reverse("courses:module_content_list", args=[self.module.pk])
         resolved = resolve(url)
         self.assertEqual(
             resolved.func.__name__,
@@ -1,12 +1,19 @@
+import json
 from http import HTTPStatus
 from typing import Any
 
-from django.contrib.auth.models import Permission, User
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import AnonymousUser, Permission, User
 from django.contrib.contenttypes.models import ContentType
-from django.test import TestCase
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.test import AsyncRequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 import src.apps.courses.models as c_models
+from src.apps.courses.views import manage_course, module_content_list, order
 
 
 class TestManageCourseListView(TestCase):
@@ -46,6 +53,87 @@ class TestManageCourseListView(TestCase):
         self.assertEqual(response.status_code, HTTPStatus.OK)
         self.assertIn(self.course, response.context["course_list"])
 
+    def create_courses(self, count: int, modules: int = 2) -> None:
+        for i in range(count):
+            course = c_models.Course.objects.create(
+                owner=self.owner,
+                subject=self.subject,
+                title=f"Extra {i}",
+                slug=f"extra-{i}-{c_models.Course.objects.count()}",
+                overview="Extra course.",
+            )
+            for j in range(modules):
+                c_models.Module.objects.create(course=course, title=f"M{j}")
+
+    def test_annotations(self) -> None:
+        """
+        Тест аннотаций числа модулей и первого модуля курса.
+        """
+        first = c_models.Module.objects.create(course=self.course, title="1")
+        c_models.Module.objects.create(course=self.course, title="2")
+        self.client.force_login(self.owner)
+
+        response = self.client.get(reverse("courses:manage_course_list"))
+
+        course = response.context["course_list"][0]
+        self.assertEqual(course.module_count, 2)
+        self.assertEqual(course.first_module_id, first.pk)
+
+    def test_constant_queries(self) -> None:
+        """
+        Тест, что число запросов не зависит от количества курсов.
+        """
+        url = reverse("courses:manage_course_list")
+        self.client.force_login(self.owner)
+        self.create_courses(2)
+        with CaptureQueriesContext(connection) as small:
+            self.client.get(url)
+
+        self.create_courses(10)
+        with CaptureQueriesContext(connection) as large:
+            self.client.get(url)
+
+        self.assertEqual(len(small), len(large))
+
+    def test_keyset_pagination(self) -> None:
+        """
+        Тест постраничного вывода по курсору.
+        """
+        url = reverse("courses:manage_course_list")
+        self.client.force_login(self.owner)
+        self.create_courses(24, modules=0)
+
+        seen: list[int] = []
+        response = self.client.get(url)
+        while True:
+            seen += [course.pk for course in response.context["course_list"]]
+            cursor = response.context["next_cursor"]
+            if cursor is None:
+                break
+            response = self.client.get(url, {"after": cursor})
+
+        self.assertEqual(len(seen), 25)
+        self.assertEqual(
+            seen,
+            list(
+                c_models.Course.objects.order_by(
+                    "-created",
+                    "id",
+                ).values_list("id", flat=True),
+            ),
+        )
+
+    def test_invalid_cursor(self) -> None:
+        """
+        Тест, что некорректный курсор возвращает 404.
+        """
+        self.client.force_login(self.owner)
+        response = self.client.get(
+            reverse("courses:manage_course_list"),
+            {"after": "garbage"},
+        )
+        self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
+
     def test_get_queryset_anonymous_user(self) -> None:
         """
         Тест, что анонимный пользователь не имеет доступа (требуется вход).
@@ -596,6 +684,97 @@ class TestModuleContentListView(TestCase):
         )
         self.assertEqual(response.context["module"], self.module)
 
+    def setUp(self) -> None:
+        cache.clear()
+
+    def add_contents(self, count: int) -> None:
+        items: list[c_models.ItemBase] = []
+        for i in range(count):
+            items += [
+                c_models.Text.objects.create(
+                    owner=self.user,
+                    title=f"text {i}",
+                    content="text",
+                ),
+                c_models.Video.objects.create(
+                    owner=self.user,
+                    title=f"video {i}",
+                    url="https://example.com/video",
+                ),
+                c_models.File.objects.create(
+                    owner=self.user,
+                    title=f"file {i}",
+                    file="files/file.pdf",
+                ),
+                c_models.Image.objects.create(
+                    owner=self.user,
+                    title=f"image {i}",
+                    file="images/image.png",
+                ),
+            ]
+        for item in items:
+            c_models.Content.objects.create(module=self.module, item=item)
+
+    def test_get_request_constant_queries(self) -> None:
+        """
+        Тестирование, что число запросов не зависит от количества
+        контента в модуле.
+        """
+        self.client.force_login(self.user)
+        url = reverse("courses:module_content_list", args=[self.module.pk])
+        self.add_contents(1)
+        ContentType.objects.clear_cache()
+        cache.clear()
+        with CaptureQueriesContext(connection) as small:
+            self.client.get(url)
+
+        self.add_contents(10)
+        ContentType.objects.clear_cache()
+        cache.clear()
+        with CaptureQueriesContext(connection) as large:
+            response = self.client.get(url)
+
+        self.assertEqual(len(response.context["contents"]), 44)
+        self.assertEqual(len(small), len(large))
+
+    def test_repeat_request_uses_fragment_cache(self) -> None:
+        """
+        Тестирование, что повторный запрос не загружает модули и контент
+        из базы данных.
+        """
+        self.client.force_login(self.user)
+        url = reverse("courses:module_content_list", args=[self.module.pk])
+        self.add_contents(1)
+        self.client.get(url)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+
+        tables = " ".join(query["sql"] for query in queries.captured_queries)
+        self.assertNotIn("courses_content", tables)
+        self.assertNotIn("courses_text", tables)
+        self.assertContains(response, "text 0")
+
+    def test_fragment_cache_invalidated_on_change(self) -> None:
+        """
+        Тестирование сброса фрагментного кэша при изменении контента
+        и модулей.
+        """
+        self.client.force_login(self.user)
+        url = reverse("courses:module_content_list", args=[self.module.pk])
+        self.add_contents(1)
+        self.client.get(url)
+
+        text = c_models.Text.objects.get(title="text 0")
+        text.title = "renamed text"
+        text.save()
+        c_models.Module.objects.create(course=self.course, title="New module")
+
+        response = self.client.get(url)
+
+        self.assertContains(response, "renamed text")
+        self.assertContains(response, "New module")
+
     def test_get_request_unauthorized(self) -> None:
         """
         Тестирование GET запроса без авторизации.
@@ -622,3 +801,352 @@ class TestModuleContentListView(TestCase):
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, HTTPStatus.FORBIDDEN)
+
+
+class TestOrderViews(TestCase):
+    user: User
+    course: c_models.Course
+    module: c_models.Module
+    modules: list[c_models.Module]
+    contents: list[c_models.Content]
+    subject: c_models.Subject
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = User.objects.create_user(
+            username="test_user1",
+            password="password123",
+        )
+        permissions = Permission.objects.filter(
+            codename__in=["delete_course", "change_course", "add_course"],
+        )
+        cls.user.user_permissions.add(*permissions)
+
+        cls.subject = c_models.Subject.objects.create(title="Java")
+        cls.course = c_models.Course.objects.create(
+            owner=cls.user,
+            subject=cls.subject,
+            title="Course",
+            slug="course",
+            overview="Course description.",
+        )
+        cls.modules = [
+            c_models.Module.objects.create(course=cls.course, title=f"M{i}")
+            for i in range(3)
+        ]
+        cls.module = cls.modules[0]
+        cls.contents = []
+        for i in range(3):
+            text = c_models.Text.objects.create(
+                owner=cls.user,
+                title=f"T{i}",
+                content="text",
+            )
+            cls.contents.append(
+                c_models.Content.objects.create(module=cls.module, item=text),
+            )
+
+    def setUp(self) -> None:
+        self.client.force_login(self.user)
+
+    def post_ids(self, url: str, ids: Any) -> Any:
+        return self.client.post(
+            url,
+            json.dumps({"ids": ids}),
+            content_type="application/json",
+        )
+
+    def test_reorder_modules(self) -> None:
+        """
+        Тест изменения порядка модулей курса одним запросом.
+        """
+        url = reverse("courses:course_module_order", args=[self.course.pk])
+        ids = [module.pk for module in reversed(self.modules)]
+
+        response = self.post_ids(url, ids)
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(
+            list(
+                c_models.Module.objects.filter(
+                    course=self.course,
+                ).values_list("id", flat=True),
+            ),
+            ids,
+        )
+
+    def test_reorder_contents_single_update(self) -> None:
+        """
+        Тест, что порядок контента применяется одним UPDATE.
+        """
+        url = reverse("courses:module_content_order", args=[self.module.pk])
+        ids = [self.contents[2].pk, self.contents[0].pk, self.contents[1].pk]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.post_ids(url, ids)
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        updates = [
+            query["sql"]
+            for query in queries.captured_queries
+            if query["sql"].startswith("UPDATE")
+            and "courses_content" in query["sql"]
+        ]
+        self.assertEqual(len(updates), 1)
+        self.assertEqual(
+            list(
+                self.module.contents.values_list("id", flat=True),
+            ),
+            ids,
+        )
+
+    def test_move_content_single_row(self) -> None:
+        """
+        Тест, что перемещение одного контента меняет только его строку.
+        """
+        url = reverse("courses:module_content_order", args=[self.module.pk])
+        moved = self.contents[2]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(
+                url,
+                json.dumps({"id": moved.pk, "position": 1}),
+                content_type="application/json",
+            )
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        updates = [
+            query["sql"]
+            for query in queries.captured_queries
+            if query["sql"].startswith("UPDATE")
+            and "courses_content" in query["sql"]
+        ]
+        self.assertEqual(len(updates), 1)
+        self.assertEqual(
+            list(self.module.contents.values_list("id", flat=True)),
+            [self.contents[0].pk, moved.pk, self.contents[1].pk],
+        )
+
+    def test_move_module_single_row(self) -> None:
+        """
+        Тест, что перемещение модуля в начало меняет только его строку,
+        а номера модулей на странице считаются по позиции.
+        """
+        url = reverse("courses:course_module_order", args=[self.course.pk])
+        moved = self.modules[2]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(
+                url,
+                json.dumps({"id": moved.pk, "position": 0}),
+                content_type="application/json",
+            )
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        updates = [
+            query["sql"]
+            for query in queries.captured_queries
+            if query["sql"].startswith("UPDATE")
+            and "courses_module" in query["sql"]
+        ]
+        self.assertEqual(len(updates), 1)
+        response = self.client.get(
+            reverse("courses:module_content_list", args=[moved.pk]),
+        )
+        self.assertContains(response, "<h2>Module 1: M2</h2>")
+
+    def test_reorder_invalidates_fragments(self) -> None:
+        """
+        Тест, что после переупорядочивания закэшированные фрагменты
+        списка контента и модулей выводятся в новом порядке.
+        """
+        cache.clear()
+        url = reverse("courses:module_content_list", args=[self.module.pk])
+        self.client.get(url)
+        content_ids = [content.pk for content in reversed(self.contents)]
+        module_ids = [module.pk for module in reversed(self.modules)]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.post_ids(
+                reverse("courses:module_content_order", args=[self.module.pk]),
+                content_ids,
+            )
+            self.post_ids(
+                reverse("courses:course_module_order", args=[self.course.pk]),
+                module_ids,
+            )
+        html = self.client.get(url).content.decode()
+
+        sidebar = html[html.index('id="modules"') :]
+        self.assertLess(sidebar.index("M2"), sidebar.index("M0"))
+        contents = html[html.index('id="module-contents"') :]
+        self.assertLess(contents.index("T2"), contents.index("T0"))
+
+    def test_reorder_incomplete_list(self) -> None:
+        """
+        Тест, что неполный список id отклоняется.
+        """
+        url = reverse("courses:module_content_order", args=[self.module.pk])
+
+        response = self.post_ids(url, [self.contents[0].pk])
+
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+
+    def test_reorder_rejects_booleans(self) -> None:
+        """
+        Тест, что true и false не принимаются за id и позиции.
+        """
+        url = reverse("courses:course_module_order", args=[self.course.pk])
+
+        for body in [
+            {"ids": [True, False]},
+            {"id": self.modules[0].pk, "position": True},
+            {"id": True, "position": 0},
+        ]:
+            with self.subTest(body=body):
+                response = self.client.post(
+                    url,
+                    json.dumps(body),
+                    content_type="application/json",
+                )
+                self.assertEqual(
+                    response.status_code,
+                    HTTPStatus.BAD_REQUEST,
+                )
+
+    def test_reorder_invalid_body(self) -> None:
+        """
+        Тест, что некорректное тело запроса отклоняется.
+        """
+        url = reverse("courses:course_module_order", args=[self.course.pk])
+
+        response = self.client.post(
+            url,
+            "not json",
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+
+    def test_model_without_order_field(self) -> None:
+        """
+        Тест, что представление для модели без OrderField настроено
+        неверно.
+        """
+
+        class SubjectOrderView(order.BaseOrderView):
+            model = c_models.Subject
+
+            def get_parent_lookup(self, **kwargs: Any) -> dict[str, Any]:
+                return {}
+
+            def invalidate(self, lookup: dict[str, Any]) -> None:
+                pass
+
+        with self.assertRaises(ImproperlyConfigured):
+            SubjectOrderView().order_field
+
+    def test_reorder_not_owner(self) -> None:
+        """
+        Тест, что чужой курс нельзя переупорядочить.
+        """
+        other_user = User.objects.create_user(username="other_user")
+        other_user.user_permissions.add(
+            *Permission.objects.filter(
+                codename__in=["delete_course", "change_course", "add_course"],
+            ),
+        )
+        self.client.force_login(other_user)
+        url = reverse("courses:course_module_order", args=[self.course.pk])
+
+        response = self.post_ids(url, [m.pk for m in self.modules])
+
+        self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
+
+
+class TestAsyncReadViews(TestCase):
+    """
+    Тесты async-версий представлений чтения, которые используются в
+    режиме ASGI.
+    """
+
+    user: User
+    course: c_models.Course
+    module: c_models.Module
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = User.objects.create_user(username="async_owner")
+        permissions = Permission.objects.filter(
+            codename__in=["add_course", "change_course", "delete_course"],
+        )
+        cls.user.user_permissions.add(*permissions)
+        cls.course = c_models.Course.objects.create(
+            owner=cls.user,
+            subject=c_models.Subject.objects.create(title="Go"),
+            title="Async course",
+            slug="async-course",
+            overview="Async course.",
+        )
+        cls.module = c_models.Module.objects.create(
+            course=cls.course,
+            title="Async module",
+        )
+        text = c_models.Text.objects.create(
+            owner=cls.user,
+            title="Async text",
+            content="text",
+        )
+        c_models.Content.objects.create(module=cls.module, item=text)
+
+    def setUp(self) -> None:
+        self.factory = AsyncRequestFactory()
+        cache.clear()
+
+    def make_request(self, path: str, user: User | AnonymousUser) -> Any:
+        async def auser() -> User | AnonymousUser:
+            return user
+
+        request = self.factory.get(path)
+        setattr(request, "auser", auser)
+        return request
+
+    async def test_module_content_list(self) -> None:
+        """
+        Тест, что async-представление отдаёт контент модуля владельцу.
+        """
+        view: Any = module_content_list.AsyncModuleContentListView.as_view()
+        request = self.make_request("/", self.user)
+
+        response = await view(request, module_id=self.module.pk)
+        await sync_to_async(response.render)()
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertContains(response, "Async text")
+
+    async def test_module_content_list_anonymous(self) -> None:
+        """
+        Тест, что анонимный пользователь перенаправляется на вход.
+        """
+        view: Any = module_content_list.AsyncModuleContentListView.as_view()
+        request = self.make_request("/", AnonymousUser())
+
+        response = await view(request, module_id=self.module.pk)
+
+        self.assertEqual(response.status_code, HTTPStatus.FOUND)
+
+    async def test_manage_course_list(self) -> None:
+        """
+        Тест, что async-список курсов загружает курсы владельца.
+        """
+        view: Any = manage_course.AsyncManageCourseListView.as_view()
+        request = self.make_request("/", self.user)
+
+        response = await view(request)
+        await sync_to_async(response.render)()
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(
+            [course.pk for course in response.context_data["course_list"]],
+            [self.course.pk],
+        )
@@ -1,8 +1,13 @@
+from unittest import skipUnless
+
 from django.apps import apps
 from django.db import connection, models
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
 from src.apps.courses.fields import OrderField
+from src.apps.tasks.models import Task
+from src.apps.tasks.worker import Worker
 
 
 class TestModel(models.Model):
@@ -14,6 +19,15 @@ class TestModel(models.Model):
         app_label = "courses"
 
 
+class SparseTestModel(models.Model):
+    name = models.CharField(max_length=100)
+    order = OrderField(step=10)
+
+    class Meta:
+        app_label = "courses"
+        ordering = ["order"]
+
+
 class OrderFieldTests(TestCase):
     """
     Тесты для OrderField.
@@ -24,24 +38,30 @@ class OrderFieldTests(TestCase):
         """
         Создаем временную модель для тестирования.
         """
-        super().setUpClass()
-
         apps.all_models["courses"]["testmodel"] = TestModel
+        apps.all_models["courses"]["sparsetestmodel"] = SparseTestModel
 
+        # Таблицы создаются до транзакции класса: SQLite не меняет схему
+        # внутри транзакции с включёнными проверками внешних ключей.
         with connection.schema_editor() as schema_editor:
             schema_editor.create_model(TestModel)
+            schema_editor.create_model(SparseTestModel)
+
+        super().setUpClass()
 
     @classmethod
     def tearDownClass(cls) -> None:
         """
         Удаляем временную модель после завершения всех тестов.
         """
+        super().tearDownClass()
+
         with connection.schema_editor() as schema_editor:
             schema_editor.delete_model(TestModel)
+            schema_editor.delete_model(SparseTestModel)
 
         del apps.all_models["courses"]["testmodel"]
-
-        super().tearDownClass()
+        del apps.all_models["courses"]["sparsetestmodel"]
 
     def test_pre_save_without_for_fields(self) -> None:
         """
@@ -98,3 +118,188 @@ class OrderFieldTests(TestCase):
         self.assertIsInstance(obj1.order, int)
 
         self.assertEqual(obj1.order, 0)
+
+    def test_pre_save_allocates_order_inside_insert(self) -> None:
+        """
+        Проверяет, что order вычисляется внутри INSERT без отдельных
+        запросов к соседним объектам.
+        """
+        TestModel(name="Object 1", category="A").save()
+
+        obj = TestModel(name="Object 2", category="A")
+        with CaptureQueriesContext(connection) as queries:
+            obj.save()
+
+        statements = [query["sql"] for query in queries.captured_queries]
+        inserts = [sql for sql in statements if sql.startswith("INSERT")]
+        self.assertEqual(len(inserts), 1)
+        self.assertIn("SELECT", inserts[0])
+        self.assertEqual(
+            [sql for sql in statements if "pg_advisory_xact_lock" in sql],
+            [sql for sql in statements if not sql.startswith("INSERT")],
+        )
+        self.assertEqual(obj.order, 1)
+
+    @skipUnless(connection.vendor == "postgresql", "только в PostgreSQL")
+    def test_pre_save_locks_siblings_in_transaction(self) -> None:
+        """
+        Проверяет, что внутри транзакции берётся блокировка на группу
+        объектов с одинаковыми for_fields.
+        """
+        obj = TestModel(name="Object 1", category="A")
+        with CaptureQueriesContext(connection) as queries:
+            obj.save()
+
+        self.assertTrue(
+            any(
+                "pg_advisory_xact_lock" in query["sql"]
+                for query in queries.captured_queries
+            ),
+        )
+
+    def test_lock_key_fits_int4(self) -> None:
+        """
+        Проверяет, что ключ блокировки помещается в int4 PostgreSQL.
+        """
+        for value in ["courses_module", "[('course_id', 1)]", ""]:
+            key = OrderField._lock_key(value)
+            self.assertGreaterEqual(key, -(2**31))
+            self.assertLess(key, 2**31)
+
+    def create_sparse(self, *names: str) -> list[SparseTestModel]:
+        objects = [SparseTestModel(name=name) for name in names]
+        for obj in objects:
+            obj.save()
+        return objects
+
+    def sparse_names(self) -> list[str]:
+        return list(
+            SparseTestModel._default_manager.values_list("name", flat=True),
+        )
+
+    def test_sparse_append_uses_step(self) -> None:
+        """
+        Проверяет, что при step > 1 новые объекты получают ключи с шагом.
+        """
+        objects = self.create_sparse("a", "b", "c")
+
+        self.assertEqual([obj.order for obj in objects], [10, 20, 30])
+
+    def test_place_between_touches_one_row(self) -> None:
+        """
+        Проверяет, что вставка в середину не меняет соседние строки.
+        """
+        self.create_sparse("a", "b", "c")
+        field = SparseTestModel._meta.get_field("order")
+        assert isinstance(field, OrderField)
+
+        obj = SparseTestModel(name="x")
+        with CaptureQueriesContext(connection) as queries:
+            field.place(obj, 1)
+            obj.save()
+
+        self.assertFalse(
+            any(
+                query["sql"].startswith("UPDATE")
+                for query in queries.captured_queries
+            ),
+        )
+        self.assertEqual(obj.order, 15)
+        self.assertEqual(self.sparse_names(), ["a", "x", "b", "c"])
+
+    def test_place_at_start_and_end(self) -> None:
+        """
+        Проверяет вставку в начало и в конец группы.
+        """
+        self.create_sparse("a", "b")
+        field = SparseTestModel._meta.get_field("order")
+        assert isinstance(field, OrderField)
+
+        first = SparseTestModel(name="first")
+        field.place(first, 0)
+        first.save()
+        last = SparseTestModel(name="last")
+        field.place(last, 100)
+        last.save()
+
+        self.assertEqual(self.sparse_names(), ["first", "a", "b", "last"])
+
+    def test_place_rebalances_when_gap_exhausted(self) -> None:
+        """
+        Проверяет перенумерацию группы, когда между соседями нет места.
+        """
+        a, b = self.create_sparse("a", "b")
+        b.order = 11
+        b.save()
+        field = SparseTestModel._meta.get_field("order")
+        assert isinstance(field, OrderField)
+
+        obj = SparseTestModel(name="x")
+        field.place(obj, 1)
+        obj.save()
+
+        self.assertEqual(self.sparse_names(), ["a", "x", "b"])
+        self.assertEqual(
+            list(
+                SparseTestModel._default_manager.values_list(
+                    "order",
+                    flat=True,
+                ),
+            ),
+            [10, 20, 30],
+        )
+
+    def test_place_schedules_rebalance(self) -> None:
+        """
+        Проверяет, что вставка, почти исчерпавшая зазор, ставит
+        перенумерацию группы в очередь, а не выполняет её в запросе.
+        """
+        a, b = self.create_sparse("a", "b")
+        b.order = 13
+        b.save()
+        field = SparseTestModel._meta.get_field("order")
+        assert isinstance(field, OrderField)
+
+        obj = SparseTestModel(name="x")
+        field.place(obj, 1)
+        obj.save()
+
+        self.assertEqual(
+            list(
+                SparseTestModel._default_manager.values_list(
+                    "order",
+                    flat=True,
+                ),
+            ),
+            [10, 12, 13],
+        )
+        self.assertEqual(
+            Task.objects.get().name,
+            "src.apps.courses.ordering.rebalance_order",
+        )
+
+        Worker().drain()
+
+        self.assertEqual(self.sparse_names(), ["a", "x", "b"])
+        self.assertEqual(
+            list(
+                SparseTestModel._default_manager.values_list(
+                    "order",
+                    flat=True,
+                ),
+            ),
+            [10, 20, 30],
+        )
+
+    def test_place_moves_existing_object(self) -> None:
+        """
+        Проверяет перемещение существующего объекта.
+        """
+        a, b, c = self.create_sparse("a", "b", "c")
+        field = SparseTestModel._meta.get_field("order")
+        assert isinstance(field, OrderField)
+
+        field.place(c, 0)
+        c.save()
+
+        self.assertEqual(self.sparse_names(), ["c", "a", "b"])
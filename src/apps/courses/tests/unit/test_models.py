@@ -7,7 +7,8 @@ import django.shortcuts
 from django.contrib.auth.models import User
 from django.contrib.contenttypes.models import ContentType
 from django.core.files.uploadedfile import SimpleUploadedFile
-from django.test import TestCase
+from django.db import IntegrityError, connection, transaction
+from django.test import TestCase, skipUnlessDBFeature
 from django.utils import timezone
 
 import src.apps.courses.models as c_models
@@ -52,9 +53,10 @@ class TestsSubjectModel(TestCase):
                 title="Duplicate Slug Test",
                 slug=self.data["slug"],
             )
-        self.assertIn(
-            "duplicate key value violates unique constraint",
+        self.assertRegex(
             str(context.exception),
+            "duplicate key value violates unique constraint"
+            "|UNIQUE constraint failed",
         )
 
     def test_ordering(self) -> None:
@@ -145,9 +147,10 @@ class TestsCourseModel(BaseSetUpData):
                 slug=self.course_data["slug"],
                 overview="Another overview",
             )
-        self.assertIn(
-            "duplicate key value violates unique constraint",
+        self.assertRegex(
             str(context.exception),
+            "duplicate key value violates unique constraint"
+            "|UNIQUE constraint failed",
         )
 
     def test_ordering(self) -> None:
@@ -529,6 +532,21 @@ class TestContentModel(TestCase):
             c_models.Content.objects.filter(module_id=module_id).exists(),
         )
 
+    @skipUnlessDBFeature("supports_deferrable_unique_constraints")
+    def test_unique_order_in_module(self) -> None:
+        """
+        Тест на уникальность order в пределах модуля.
+        """
+        with self.assertRaises(IntegrityError):
+            with transaction.atomic():
+                c_models.Content.objects.create(
+                    module=self.module,
+                    content_type=self.text_content_type,
+                    object_id=self.text_model.pk,
+                    order=self.content.order,
+                )
+                connection.check_constraints()
+
     def test_delete_item_cascades(self) -> None:
         """
         Тест на каскадное удаление при удалении связанного объекта.
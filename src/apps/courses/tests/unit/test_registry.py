@@ -0,0 +1,47 @@
+from django.test import TestCase
+
+import src.apps.courses.models as c_models
+from src.apps.courses import registry
+
+
+class ContentRegistryTests(TestCase):
+    def test_builtin_types_registered(self) -> None:
+        """
+        Проверяет, что встроенные типы контента зарегистрированы при
+        запуске приложения.
+        """
+        self.assertEqual(
+            sorted(registry.model_names()),
+            ["file", "image", "text", "video"],
+        )
+        entry = registry.get("text")
+        self.assertIsNotNone(entry)
+        if entry is not None:
+            self.assertIs(entry.model, c_models.Text)
+
+    def test_form_class_built_once(self) -> None:
+        """
+        Проверяет, что класс формы не пересоздаётся между обращениями.
+        """
+        first = registry.get("video")
+        second = registry.get("video")
+        self.assertIsNotNone(first)
+        if first is not None and second is not None:
+            self.assertIs(first.form_class, second.form_class)
+            self.assertNotIn("owner", first.form_class.base_fields)
+            self.assertIn("url", first.form_class.base_fields)
+
+    def test_unknown_type(self) -> None:
+        """
+        Проверяет, что незарегистрированный тип не найден.
+        """
+        self.assertIsNone(registry.get("course"))
+
+    def test_content_type_choices(self) -> None:
+        """
+        Проверяет ограничение выбора content_type по реестру.
+        """
+        self.assertEqual(
+            sorted(registry.content_type_choices()["model__in"]),
+            ["file", "image", "text", "video"],
+        )
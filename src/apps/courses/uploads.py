@@ -0,0 +1,170 @@
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from django.conf import settings
+from django.core.exceptions import RequestDataTooBig
+from django.core.files import File as DjangoFile
+from django.core.files.uploadedfile import TemporaryUploadedFile
+from django.core.files.uploadhandler import FileUploadHandler
+from django.http import HttpRequest
+
+
+class UploadTooLarge(RequestDataTooBig):
+    pass
+
+
+def upload_limit(model_name: str | None) -> int:
+    """
+    Максимальный размер файла для типа контента. Для прочих загрузок
+    (например, из админки) действует наибольший из лимитов.
+    """
+    limits = settings.UPLOAD_MAX_SIZES
+    return limits.get(model_name or "", max(limits.values()))
+
+
+def staging_dir() -> Path:
+    """
+    Каталог для принимаемых файлов. Он лежит внутри MEDIA_ROOT, поэтому
+    FileSystemStorage переносит готовый файл на место переименованием,
+    без повторного копирования байтов.
+    """
+    path = Path(settings.UPLOAD_STAGING_DIR)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def file_checksum(file: DjangoFile) -> str:
+    """
+    sha256 файла. Посчитанная сумма запоминается на объекте, чтобы
+    модель и хранилище не читали файл повторно.
+    """
+    checksum = getattr(file, "checksum", None)
+    if checksum:
+        return checksum
+    digest = hashlib.sha256()
+    for chunk in file.chunks():
+        digest.update(chunk)
+    file.checksum = digest.hexdigest()  # type: ignore[attr-defined]
+    return file.checksum  # type: ignore[attr-defined]
+
+
+class StagedUploadedFile(TemporaryUploadedFile):
+    """
+    Загруженный файл в UPLOAD_STAGING_DIR с посчитанным sha256.
+    """
+
+    checksum = ""
+
+    def __init__(
+        self,
+        name: str,
+        content_type: str | None,
+        size: int,
+        charset: str | None,
+        content_type_extra: dict[str, Any] | None = None,
+    ) -> None:
+        _, ext = os.path.splitext(name)
+        file = tempfile.NamedTemporaryFile(
+            suffix=".upload" + ext,
+            dir=staging_dir(),
+        )
+        super(TemporaryUploadedFile, self).__init__(
+            file,
+            name,
+            content_type,
+            size,
+            charset,
+            content_type_extra,
+        )
+
+    @classmethod
+    def from_path(
+        cls,
+        path: Path,
+        name: str,
+        checksum: str,
+    ) -> "StagedUploadedFile":
+        """
+        Оборачивает уже собранный файл возобновляемой загрузки, чтобы
+        хранилище перенесло его на место так же, как обычную загрузку.
+        """
+        uploaded = cls.__new__(cls)
+        super(TemporaryUploadedFile, uploaded).__init__(
+            open(path, "rb"),
+            name,
+            None,
+            path.stat().st_size,
+            None,
+        )
+        uploaded.checksum = checksum
+        return uploaded
+
+
+class StreamingUploadHandler(FileUploadHandler):
+    """
+    Пишет файлы кусками сразу в UPLOAD_STAGING_DIR и на лету считает
+    sha256.
+
+    Лимит размера берётся из UPLOAD_MAX_SIZES по model_name урла и
+    проверяется до чтения тела по Content-Length и затем на каждом
+    куске, поэтому слишком большой файл не попадает ни в память, ни на
+    диск. Готовый файл хранилище переносит на место переименованием.
+    """
+
+    chunk_size = 2**20
+
+    def __init__(self, request: HttpRequest | None = None) -> None:
+        super().__init__(request)
+        match = getattr(request, "resolver_match", None)
+        self.max_size = upload_limit(
+            match.kwargs.get("model_name") if match else None,
+        )
+
+    def handle_raw_input(
+        self,
+        input_data: Any,
+        META: dict[str, Any],  # noqa: N803
+        content_length: int,
+        boundary: str,
+        encoding: str | None = None,
+    ) -> None:
+        # Помимо файла тело содержит поля формы, которым Django и так
+        # разрешает занимать до DATA_UPLOAD_MAX_MEMORY_SIZE.
+        overhead = settings.DATA_UPLOAD_MAX_MEMORY_SIZE or 0
+        if content_length > self.max_size + overhead:
+            raise UploadTooLarge(
+                f"Upload exceeds the limit of {self.max_size} bytes.",
+            )
+
+    def new_file(self, *args: Any, **kwargs: Any) -> None:
+        super().new_file(*args, **kwargs)
+        self.file = StagedUploadedFile(
+            self.file_name or "",
+            self.content_type,
+            0,
+            self.charset,
+            self.content_type_extra,
+        )
+        self.digest = hashlib.sha256()
+
+    def receive_data_chunk(self, raw_data: bytes, start: int) -> None:
+        if start + len(raw_data) > self.max_size:
+            self.file.close()
+            raise UploadTooLarge(
+                f"Upload exceeds the limit of {self.max_size} bytes.",
+            )
+        self.file.write(raw_data)
+        self.digest.update(raw_data)
+
+    def file_complete(self, file_size: int) -> StagedUploadedFile:
+        self.file.seek(0)
+        self.file.size = file_size
+        self.file.checksum = self.digest.hexdigest()
+        return self.file
+
+    def upload_interrupted(self) -> None:
+        if hasattr(self, "file"):
+            self.file.close()
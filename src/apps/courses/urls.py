@@ -1,18 +1,31 @@
+from django.conf import settings
 from django.urls import path
 
 from src.apps.courses.views import (
     content_create_update,
+    content_file,
     manage_course,
     module_content_list,
+    order,
+    search,
+    upload,
 )
 
 app_name = "courses"
 
+course_list_view: type[manage_course.ManageCourseListView]
+content_list_view: type[module_content_list.ModuleContentListView]
+if settings.ASYNC_VIEWS:
+    course_list_view = manage_course.AsyncManageCourseListView
+    content_list_view = module_content_list.AsyncModuleContentListView
+else:
+    course_list_view = manage_course.ManageCourseListView
+    content_list_view = module_content_list.ModuleContentListView
 
 urlpatterns = [
     path(
         "mine/",
-        manage_course.ManageCourseListView.as_view(),
+        course_list_view.as_view(),
         name="manage_course_list",
     ),
     path(
@@ -35,6 +48,16 @@ urlpatterns = [
         manage_course.CourseModuleUpdateView.as_view(),
         name="course_module_update",
     ),
+    path(
+        "<pk>/module/order/",
+        order.CourseModuleOrderView.as_view(),
+        name="course_module_order",
+    ),
+    path(
+        "module/<int:module_id>/content/order/",
+        order.ModuleContentOrderView.as_view(),
+        name="module_content_order",
+    ),
     path(
         "module/<int:module_id>/content/<model_name>/create/",
         content_create_update.ContentCreateUpdateView.as_view(),
@@ -50,9 +73,29 @@ urlpatterns = [
         content_create_update.ContentDeleteView.as_view(),
         name="module_content_delete",
     ),
+    path(
+        "content/<model_name>/<int:pk>/file/<path:name>",
+        content_file.ContentFileView.as_view(),
+        name="content_file",
+    ),
+    path(
+        "search/",
+        search.SearchView.as_view(),
+        name="search",
+    ),
+    path(
+        "uploads/",
+        upload.UploadCreateView.as_view(),
+        name="upload_create",
+    ),
+    path(
+        "uploads/<uuid:pk>/",
+        upload.UploadView.as_view(),
+        name="upload",
+    ),
     path(
         "module/<int:module_id>/",
-        module_content_list.ModuleContentListView.as_view(),
+        content_list_view.as_view(),
         name="module_content_list",
     ),
 ]
@@ -1,18 +1,22 @@
+import uuid
+from pathlib import Path
 from typing import Any
 
-from django.apps import apps
-from django.db import models
+from django.db import models, transaction
 from django.forms import ModelForm
-from django.forms.models import modelform_factory
-from django.http import HttpRequest, HttpResponseBase
+from django.http import Http404, HttpRequest, HttpResponseBase
 from django.shortcuts import get_object_or_404, redirect
 from django.views.generic import View
 from django.views.generic.base import TemplateResponseMixin
 
+from src.apps.courses import registry
+from src.apps.courses.deletion import delete_contents
 from src.apps.courses.models import (
     Content,
     Module,
+    Upload,
 )
+from src.apps.courses.uploads import StagedUploadedFile
 from src.apps.courses.views.mixins.content_owner import ContentOwnerMixin
 
 
@@ -28,9 +32,8 @@ class ContentCreateUpdateView(
     template_name = "courses/manage/content/form.html"
 
     def get_model(self, model_name: str) -> type[models.Model] | None:
-        if model_name in ["text", "video", "image", "file"]:
-            return apps.get_model(app_label="courses", model_name=model_name)
-        return None
+        entry = registry.get(model_name)
+        return entry.model if entry else None
 
     def get_form(
         self,
@@ -38,11 +41,10 @@ class ContentCreateUpdateView(
         *args: Any,
         **kwargs: Any,
     ) -> ModelForm:
-        form_class = modelform_factory(
-            model,
-            exclude=["owner", "order", "created", "updated"],
-        )
-        return form_class(*args, **kwargs)
+        entry = registry.get(model._meta.model_name or "")
+        if entry is None:
+            raise Http404("Unknown content type")
+        return entry.form_class(*args, **kwargs)
 
     def dispatch(
         self,
@@ -51,7 +53,11 @@ class ContentCreateUpdateView(
         model_name: str,
         pk: int | None = None,
     ) -> HttpResponseBase:
-        self.module = get_object_or_404(Module, id=module_id)
+        self.module = get_object_or_404(
+            Module,
+            id=module_id,
+            course__deleted__isnull=True,
+        )
         self.model = self.get_model(model_name)
         if pk and self.model:
             self.obj = get_object_or_404(self.model, id=pk, owner=request.user)
@@ -79,24 +85,72 @@ class ContentCreateUpdateView(
         if self.model is None or self.module is None:
             return self.render_to_response({"form": None, "object": self.obj})
 
+        files = request.FILES
+        upload = self.get_upload(request, model_name)
+        staged = None
+        if upload is not None:
+            staged = StagedUploadedFile.from_path(
+                upload.path,
+                upload.filename,
+                upload.checksum,
+            )
+            files = files.copy()
+            files["file"] = staged
         form = self.get_form(
             self.model,
             instance=self.obj,
             data=request.POST,
-            files=request.FILES,
+            files=files,
         )
-        if form.is_valid():
-            obj = form.save(commit=False)
-            obj.owner = request.user
-            obj.save()
-            if not pk:
-                Content.objects.create(module=self.module, item=obj)
-            return redirect(
-                "courses:module_content_list",
-                self.module.pk if self.module else 0,
-            )
+        try:
+            if form.is_valid():
+                with transaction.atomic():
+                    obj = form.save(commit=False)
+                    obj.owner = request.user
+                    obj.save()
+                    if not pk:
+                        Content.objects.create(module=self.module, item=obj)
+                    if upload is not None:
+                        upload.delete()
+                if staged is not None:
+                    # Если такой blob уже хранился, загрузка не переносилась
+                    # в хранилище и больше не нужна.
+                    Path(staged.temporary_file_path()).unlink(missing_ok=True)
+                return redirect(
+                    "courses:module_content_list",
+                    self.module.pk if self.module else 0,
+                )
+        finally:
+            if staged is not None:
+                staged.close()
         return self.render_to_response({"form": form, "object": self.obj})
 
+    def get_upload(
+        self,
+        request: HttpRequest,
+        model_name: str,
+    ) -> Upload | None:
+        """
+        Завершённая возобновляемая загрузка, переданная в поле upload
+        вместо файла.
+        """
+        upload_id = request.POST.get("upload")
+        if not upload_id:
+            return None
+        try:
+            uuid.UUID(upload_id)
+        except ValueError:
+            raise Http404("Upload not found")
+        upload = get_object_or_404(
+            Upload,
+            pk=upload_id,
+            owner=request.user,
+            model_name=model_name,
+        )
+        if not upload.complete:
+            raise Http404("Upload is not complete")
+        return upload
+
 
 class ContentDeleteView(ContentOwnerMixin, View):
     def post(
@@ -108,12 +162,11 @@ class ContentDeleteView(ContentOwnerMixin, View):
             Content,
             id=pk,
             module__course__owner=request.user,
+            module__course__deleted__isnull=True,
         )
-        module = content.module
-        if content.item:
-            content.item.delete()
-        content.delete()
+        with transaction.atomic():
+            delete_contents([content.pk])
         return redirect(
             "courses:module_content_list",
-            module.pk,
+            content.module_id,
         )
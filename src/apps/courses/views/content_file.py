@@ -0,0 +1,79 @@
+import mimetypes
+import os
+from urllib.parse import quote
+
+from django.conf import settings
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.http import (
+    FileResponse,
+    Http404,
+    HttpRequest,
+    HttpResponse,
+    HttpResponseBase,
+)
+from django.shortcuts import get_object_or_404
+from django.utils.cache import patch_cache_control
+from django.utils.http import content_disposition_header
+from django.views.generic import View
+
+from src.apps.courses import registry
+from src.apps.courses.models import FileItemBase
+
+
+class ContentFileView(LoginRequiredMixin, View):
+    """
+    Отдаёт файл элемента File/Image или вариант изображения его
+    владельцу.
+
+    Доступ проверяется одним запросом к таблице элемента. Сами байты
+    при MEDIA_ACCEL_REDIRECT отдаёт nginx по заголовку X-Accel-Redirect
+    из internal-локации MEDIA_URL, с поддержкой Range и без участия
+    воркера gunicorn; без nginx (разработка) файл отдаёт Django.
+    """
+
+    def get(
+        self,
+        request: HttpRequest,
+        model_name: str,
+        pk: int,
+        name: str,
+    ) -> HttpResponseBase:
+        entry = registry.get(model_name)
+        if entry is None or not issubclass(entry.model, FileItemBase):
+            raise Http404("Unknown content type")
+        fields = ["title", "file"]
+        if hasattr(entry.model, "variants"):
+            fields.append("variants")
+        item = get_object_or_404(
+            entry.model._default_manager.only(*fields),
+            pk=pk,
+            owner_id=request.user.pk,
+        )
+        variants = getattr(item, "variants", None) or []
+        names = {item.file.name, *(variant["name"] for variant in variants)}
+        if name not in names:
+            raise Http404("File not found")
+
+        response = self.serve(item, name)
+        content_type, _ = mimetypes.guess_type(name)
+        response["Content-Type"] = content_type or "application/octet-stream"
+        if name == item.file.name:
+            _, ext = os.path.splitext(name)
+            is_image = (content_type or "").startswith("image/")
+            response["Content-Disposition"] = str(
+                content_disposition_header(
+                    as_attachment=not is_image,
+                    filename=f"{item.title}{ext}",
+                ),
+            )
+        # Имя файла - хэш содержимого, поэтому по одному адресу всегда
+        # один и тот же файл.
+        patch_cache_control(response, private=True, max_age=86400)
+        return response
+
+    def serve(self, item: FileItemBase, name: str) -> HttpResponseBase:
+        if settings.MEDIA_ACCEL_REDIRECT:
+            response = HttpResponse()
+            response["X-Accel-Redirect"] = settings.MEDIA_URL + quote(name)
+            return response
+        return FileResponse(item.file.storage.open(name))
@@ -1,6 +1,9 @@
+from datetime import datetime
 from typing import Any
 
-from django.db.models import QuerySet
+from django.db import transaction
+from django.db.models import Count, OuterRef, Q, QuerySet, Subquery
+from django.forms import Form
 from django.forms.models import BaseInlineFormSet
 from django.http import Http404, HttpRequest, HttpResponse, HttpResponseBase
 from django.shortcuts import get_object_or_404, redirect
@@ -9,8 +12,9 @@ from django.views.generic.base import TemplateResponseMixin
 from django.views.generic.edit import CreateView, DeleteView, UpdateView
 from django.views.generic.list import ListView
 
+from src.apps.courses.deletion import mark_deleted
 from src.apps.courses.forms import ModuleFormSet
-from src.apps.courses.models import Course
+from src.apps.courses.models import Course, Module
 from src.apps.courses.views.mixins.owners_mixins import (
     OwnerCourseEditMixin,
     OwnerCourseMixin,
@@ -18,16 +22,91 @@ from src.apps.courses.views.mixins.owners_mixins import (
 
 
 class ManageCourseListView(ListView):
+    """
+    Список курсов владельца с keyset-пагинацией по (-created, id).
+
+    Число модулей и id первого модуля аннотируются в том же запросе,
+    поэтому страница стоит постоянное число запросов.
+    """
+
     model = Course
     template_name = "courses/manage/course/list.html"
     permission_required = "courses.view_course"
+    context_object_name = "course_list"
+    page_size = 20
+    cursor_kwarg = "after"
+
+    def get_cursor(self) -> tuple[datetime, int] | None:
+        cursor = self.request.GET.get(self.cursor_kwarg)
+        if not cursor:
+            return None
+        created, _, pk = cursor.rpartition("_")
+        try:
+            return datetime.fromisoformat(created), int(pk)
+        except ValueError:
+            raise Http404("Invalid cursor")
 
     def get_queryset(self) -> QuerySet:
         if self.request.user.is_anonymous:
             raise Http404("Access denied")
 
-        qs = super().get_queryset()
-        return qs.filter(owner=self.request.user)
+        first_module = Module.objects.filter(
+            course=OuterRef("pk"),
+        ).order_by("order").values("id")[:1]
+        qs = (
+            super()
+            .get_queryset()
+            .filter(owner=self.request.user)
+            .select_related("subject")
+            .annotate(
+                module_count=Count("modules"),
+                first_module_id=Subquery(first_module),
+            )
+            .order_by("-created", "id")
+        )
+        cursor = self.get_cursor()
+        if cursor is not None:
+            created, pk = cursor
+            qs = qs.filter(
+                Q(created__lt=created) | Q(created=created, id__gt=pk),
+            )
+        return qs
+
+    def get_context_data(
+        self,
+        courses: list[Course] | None = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        if courses is None:
+            courses = list(self.object_list[: self.page_size + 1])
+        next_cursor = None
+        if len(courses) > self.page_size:
+            courses = courses[: self.page_size]
+            last = courses[-1]
+            next_cursor = f"{last.created.isoformat()}_{last.pk}"
+        context = super().get_context_data(object_list=courses, **kwargs)
+        context["next_cursor"] = next_cursor
+        context["cursor_kwarg"] = self.cursor_kwarg
+        return context
+
+
+class AsyncManageCourseListView(ManageCourseListView):
+    """
+    Async-версия ManageCourseListView для ASGI.
+    """
+
+    async def get(  # type: ignore[override]
+        self, request: HttpRequest, *args: Any, **kwargs: Any,
+    ) -> HttpResponse:
+        request.user = await request.auser()
+        self.object_list = self.get_queryset()
+        courses = [
+            course
+            async for course in self.object_list[: self.page_size + 1]
+        ]
+        return self.render_to_response(
+            self.get_context_data(courses=courses),
+        )
 
 
 class CourseCreateView(OwnerCourseEditMixin, CreateView):
@@ -55,10 +134,19 @@ class CourseUpdateView(OwnerCourseEditMixin, UpdateView):
 
 
 class CourseDeleteView(OwnerCourseMixin, DeleteView):
+    """
+    Удаление курса: курс помечается удалённым, а модули, контент и файлы
+    удаляются в фоновой задаче пачками, поэтому запрос не зависит от
+    размера курса.
+    """
+
     model = Course
     template_name = "courses/manage/course/delete.html"
     permission_required = "courses.delete_course"
-    object = Course
+
+    def form_valid(self, form: Form) -> HttpResponse:
+        mark_deleted(self.object)
+        return redirect(self.get_success_url())
 
 
 class CourseModuleUpdateView(TemplateResponseMixin, View):
@@ -90,7 +178,8 @@ class CourseModuleUpdateView(TemplateResponseMixin, View):
     ) -> HttpResponse:
         formset = self.get_queryset(data=request.POST)
         if formset.is_valid():
-            formset.save()
+            with transaction.atomic():
+                formset.save()
             return redirect("courses:manage_course_list")
         return self.render_to_response({"course": self.course,
                                         "formset": formset})
@@ -1,7 +1,12 @@
+from inspect import isawaitable
+from typing import Any
+
+from asgiref.sync import sync_to_async
 from django.contrib.auth.mixins import (
     LoginRequiredMixin,
     PermissionRequiredMixin,
 )
+from django.http import HttpRequest, HttpResponseBase
 
 
 class ContentOwnerMixin(LoginRequiredMixin, PermissionRequiredMixin):
@@ -15,3 +20,23 @@ class ContentOwnerMixin(LoginRequiredMixin, PermissionRequiredMixin):
         "courses.delete_course",
         "courses.change_course",
     )
+
+
+class AsyncContentOwnerMixin(ContentOwnerMixin):
+    """
+    ContentOwnerMixin для async-представлений: пользователь загружается
+    через request.auser(), а его права кэшируются в потоке заранее,
+    чтобы проверки миксинов не обращались к БД из event loop. При отказе
+    в доступе миксины возвращают ответ сразу, а не корутину.
+    """
+
+    async def dispatch(  # type: ignore[override]
+        self, request: HttpRequest, *args: Any, **kwargs: Any,
+    ) -> HttpResponseBase:
+        request.user = await request.auser()
+        if request.user.is_authenticated:
+            await sync_to_async(request.user.get_all_permissions)()
+        response = super().dispatch(request, *args, **kwargs)
+        if isawaitable(response):
+            return await response
+        return response
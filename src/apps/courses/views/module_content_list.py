@@ -1,10 +1,24 @@
+from typing import Any
+
+from django.contrib.contenttypes.prefetch import GenericPrefetch
+from django.db.models import QuerySet
 from django.http import HttpRequest, HttpResponseBase
-from django.shortcuts import get_object_or_404
+from django.shortcuts import aget_object_or_404, get_object_or_404
 from django.views.generic import View
 from django.views.generic.base import TemplateResponseMixin
 
-from src.apps.courses.models import Module
-from src.apps.courses.views.mixins.content_owner import ContentOwnerMixin
+from src.apps.courses.cache import (
+    FRAGMENT_TIMEOUT,
+    aget_versions,
+    course_version_key,
+    get_versions,
+    module_version_key,
+)
+from src.apps.courses.models import Content, File, Image, Module, Text, Video
+from src.apps.courses.views.mixins.content_owner import (
+    AsyncContentOwnerMixin,
+    ContentOwnerMixin,
+)
 
 
 class ModuleContentListView(
@@ -13,10 +27,72 @@ class ModuleContentListView(
     module: Module
     template_name = "courses/manage/module/content_list.html"
 
+    def get_contents(self, module: Module) -> QuerySet[Content]:
+        """
+        Контент модуля; элементы загружаются одним запросом на каждый тип.
+        Queryset ленивый и выполняется только при промахе фрагментного
+        кэша в шаблоне.
+        """
+        return Content.objects.filter(module=module).prefetch_related(
+            GenericPrefetch(
+                "item",
+                [
+                    Text.objects.all(),
+                    File.objects.all(),
+                    Image.objects.all(),
+                    Video.objects.all(),
+                ],
+            ),
+        )
+
+    def get_context(
+        self,
+        module: Module,
+        versions: dict[str, int],
+    ) -> dict[str, Any]:
+        return {
+            "module": module,
+            "modules": module.course.modules.all(),
+            "contents": self.get_contents(module),
+            "fragment_timeout": FRAGMENT_TIMEOUT,
+            "modules_version": versions[course_version_key(module.course_id)],
+            "contents_version": versions[module_version_key(module.pk)],
+        }
+
     def get(self, request: HttpRequest, module_id: int) -> HttpResponseBase:
         module = get_object_or_404(
-            Module,
+            Module.objects.select_related("course"),
             id=module_id,
             course__owner=request.user,
+            course__deleted__isnull=True,
+        )
+        versions = get_versions(
+            course_version_key(module.course_id),
+            module_version_key(module.pk),
+        )
+        return self.render_to_response(self.get_context(module, versions))
+
+
+class AsyncModuleContentListView(  # type: ignore[misc]
+    AsyncContentOwnerMixin, ModuleContentListView,
+):
+    """
+    Async-версия ModuleContentListView для ASGI. Модуль и версии кэша
+    загружаются без блокировки event loop; ленивые querysets контента
+    выполняются при рендере шаблона, который Django запускает в потоке.
+    """
+
+    async def get(  # type: ignore[override]
+        self, request: HttpRequest, module_id: int,
+    ) -> HttpResponseBase:
+        module = await aget_object_or_404(
+            Module.objects.select_related("course"),
+            id=module_id,
+            course__owner=request.user,
+            course__deleted__isnull=True,
+        )
+        versions = await aget_versions(
+            course_version_key(module.course_id),
+            module_version_key(module.pk),
         )
-        return self.render_to_response({"module": module})
+        return self.render_to_response(self.get_context(module, versions))
@@ -0,0 +1,165 @@
+import json
+from abc import ABC, abstractmethod
+from typing import Any
+
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from django.db import models, transaction
+from django.http import (
+    HttpRequest,
+    HttpResponseBadRequest,
+    HttpResponseBase,
+    JsonResponse,
+)
+from django.shortcuts import get_object_or_404
+from django.views.generic import View
+
+from src.apps.courses.cache import (
+    bump_version,
+    course_version_key,
+    module_version_key,
+)
+from src.apps.courses.fields import OrderField
+from src.apps.courses.models import Content, Course, Module
+from src.apps.courses.views.mixins.content_owner import ContentOwnerMixin
+
+
+class BaseOrderView(ContentOwnerMixin, View, ABC):
+    """
+    Базовое представление для изменения порядка объектов одним запросом.
+
+    Принимает JSON вида {"ids": [3, 1, 2]} с полным списком id дочерних
+    объектов в новом порядке и применяет его одним UPDATE в транзакции,
+    либо {"id": 3, "position": 0} для перемещения одного объекта, при
+    котором меняется только его строка.
+    """
+
+    model: type[models.Model]
+
+    @abstractmethod
+    def get_parent_lookup(self, **kwargs: Any) -> dict[str, Any]:
+        """
+        Значения for_fields поля order для группы из URL; чужая группа
+        должна давать 404.
+        """
+
+    @abstractmethod
+    def invalidate(self, lookup: dict[str, Any]) -> None:
+        """
+        Сбрасывает фрагментный кэш группы. bulk_update не отправляет
+        post_save, поэтому сигналы кэша при переупорядочивании не
+        срабатывают.
+        """
+
+    @property
+    def order_field(self) -> OrderField:
+        try:
+            field = self.model._meta.get_field("order")
+        except FieldDoesNotExist:
+            field = None
+        if not isinstance(field, OrderField):
+            raise ImproperlyConfigured(
+                f"{self.model.__name__}.order must be an OrderField",
+            )
+        return field
+
+    def post(self, request: HttpRequest, **kwargs: Any) -> HttpResponseBase:
+        lookup = self.get_parent_lookup(**kwargs)
+        try:
+            data = json.loads(request.body)
+        except ValueError:
+            return HttpResponseBadRequest("Expected JSON object")
+        if isinstance(data, dict) and is_int_list(data.get("ids")):
+            return self.reorder(lookup, data["ids"])
+        if (
+            isinstance(data, dict)
+            and is_int(data.get("id"))
+            and is_int(data.get("position"))
+            and data["position"] >= 0
+        ):
+            return self.move(lookup, data["id"], data["position"])
+        return HttpResponseBadRequest(
+            "Expected a list of integer ids or an id with a position",
+        )
+
+    def reorder(
+        self,
+        lookup: dict[str, Any],
+        ids: list[int],
+    ) -> HttpResponseBase:
+        field = self.order_field
+        with transaction.atomic():
+            field.lock_group(lookup)
+            objects = {
+                obj.pk: obj
+                for obj in self.model._default_manager.filter(
+                    **lookup,
+                ).only("id", "order")
+            }
+            if len(ids) != len(objects) or set(ids) != set(objects):
+                return HttpResponseBadRequest(
+                    "ids must list every object exactly once",
+                )
+            changed = []
+            for position, pk in enumerate(ids):
+                obj = objects[pk]
+                if obj.order != field.key(position):  # type: ignore
+                    obj.order = field.key(position)  # type: ignore
+                    changed.append(obj)
+            self.model._default_manager.bulk_update(changed, ["order"])
+            transaction.on_commit(lambda: self.invalidate(lookup))
+        return JsonResponse({"saved": "OK"})
+
+    def move(
+        self,
+        lookup: dict[str, Any],
+        pk: int,
+        position: int,
+    ) -> HttpResponseBase:
+        with transaction.atomic():
+            obj = get_object_or_404(self.model, pk=pk, **lookup)
+            # Если задача перенумерации ещё не выполнилась, place может
+            # перенумеровать группу через bulk_update прямо в запросе.
+            self.order_field.place(obj, position)
+            obj.save(update_fields=["order"])
+            transaction.on_commit(lambda: self.invalidate(lookup))
+        return JsonResponse({"saved": "OK"})
+
+
+def is_int(value: Any) -> bool:
+    # bool - подкласс int, но true в JSON не id и не позиция.
+    return type(value) is int
+
+
+def is_int_list(value: Any) -> bool:
+    return isinstance(value, list) and all(is_int(item) for item in value)
+
+
+class CourseModuleOrderView(BaseOrderView):
+    model = Module
+
+    def get_parent_lookup(self, **kwargs: Any) -> dict[str, Any]:
+        course = get_object_or_404(
+            Course,
+            id=kwargs["pk"],
+            owner=self.request.user,
+        )
+        return {"course_id": course.pk}
+
+    def invalidate(self, lookup: dict[str, Any]) -> None:
+        bump_version(course_version_key(lookup["course_id"]))
+
+
+class ModuleContentOrderView(BaseOrderView):
+    model = Content
+
+    def get_parent_lookup(self, **kwargs: Any) -> dict[str, Any]:
+        module = get_object_or_404(
+            Module,
+            id=kwargs["module_id"],
+            course__owner=self.request.user,
+            course__deleted__isnull=True,
+        )
+        return {"module_id": module.pk}
+
+    def invalidate(self, lookup: dict[str, Any]) -> None:
+        bump_version(module_version_key(lookup["module_id"]))
@@ -0,0 +1,33 @@
+from typing import Any
+
+from django.conf import settings
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.http import Http404
+from django.views.generic import TemplateView
+
+from src.apps.courses.search import search_courses, search_query, search_texts
+
+
+class SearchView(LoginRequiredMixin, TemplateView):
+    """
+    Полнотекстовый поиск по курсам, модулям и текстам владельца.
+
+    Выводятся первые SEARCH_PAGE_SIZE результатов каждого вида с
+    подсвеченными фрагментами; ts_headline считается только для них.
+    """
+
+    template_name = "courses/manage/search.html"
+
+    def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
+        context = super().get_context_data(**kwargs)
+        text = self.request.GET.get("q", "").strip()
+        context["q"] = text
+        if text:
+            query = search_query(text)
+            size = settings.SEARCH_PAGE_SIZE
+            owner_id = self.request.user.pk
+            if owner_id is None:
+                raise Http404("Access denied")
+            context["courses"] = search_courses(query, owner_id)[:size]
+            context["texts"] = search_texts(query, owner_id)[:size]
+        return context
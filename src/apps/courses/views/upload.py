@@ -0,0 +1,213 @@
+import hashlib
+import json
+import uuid
+from datetime import timedelta
+from typing import Any, cast
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db import connection, transaction
+from django.db.models import Q
+from django.http import (
+    HttpRequest,
+    HttpResponseBadRequest,
+    HttpResponseBase,
+    JsonResponse,
+)
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from django.views.generic import View
+
+from src.apps.courses import registry
+from src.apps.courses.models import Upload
+from src.apps.courses.uploads import StreamingUploadHandler, upload_limit
+from src.apps.courses.views.mixins.content_owner import ContentOwnerMixin
+
+OFFSET_HEADER = "Upload-Offset"
+
+
+def upload_state(upload: Upload) -> dict[str, Any]:
+    return {
+        "id": str(upload.pk),
+        "offset": upload.offset,
+        "size": upload.size,
+        "complete": upload.complete,
+    }
+
+
+class UploadCreateView(ContentOwnerMixin, View):
+    """
+    Начинает возобновляемую загрузку.
+
+    Принимает JSON {"model": "file", "filename": "slides.pdf",
+    "size": 123} и отвечает id загрузки. Размер проверяется по лимиту
+    типа контента до приёма первого байта.
+    """
+
+    def post(self, request: HttpRequest) -> HttpResponseBase:
+        try:
+            data = json.loads(request.body)
+        except ValueError:
+            return HttpResponseBadRequest("Expected JSON object")
+        if not (
+            isinstance(data, dict)
+            and isinstance(data.get("model"), str)
+            and isinstance(data.get("filename"), str)
+            and data["filename"]
+            and isinstance(data.get("size"), int)
+            and data["size"] > 0
+        ):
+            return HttpResponseBadRequest(
+                "Expected model, filename and a positive size",
+            )
+        entry = registry.get(data["model"])
+        if entry is None or not hasattr(entry.model, "checksum"):
+            return HttpResponseBadRequest("Model does not accept files")
+        limit = upload_limit(data["model"])
+        if data["size"] > limit:
+            return JsonResponse(
+                {"error": f"File exceeds the limit of {limit} bytes"},
+                status=413,
+            )
+
+        upload = Upload.objects.create(
+            owner=cast(User, request.user),
+            model_name=data["model"],
+            filename=data["filename"][:255],
+            size=data["size"],
+        )
+        upload.path.touch()
+        return JsonResponse(upload_state(upload), status=201)
+
+
+class UploadView(ContentOwnerMixin, View):
+    """
+    Состояние и дозапись возобновляемой загрузки.
+
+    GET возвращает число принятых байт. PUT дописывает тело запроса с
+    позиции из заголовка Upload-Offset, которая должна совпадать с уже
+    принятым объёмом; после обрыва клиент запрашивает GET и продолжает с
+    полученного offset. Тело читается потоком и пишется прямо в файл
+    загрузки, а sha256 считается один раз, когда файл собран целиком.
+    """
+
+    def get(self, request: HttpRequest, pk: uuid.UUID) -> HttpResponseBase:
+        upload = get_object_or_404(Upload, pk=pk, owner=request.user)
+        return JsonResponse(upload_state(upload))
+
+    def put(self, request: HttpRequest, pk: uuid.UUID) -> HttpResponseBase:
+        try:
+            offset = int(request.headers.get(OFFSET_HEADER, ""))
+        except ValueError:
+            return HttpResponseBadRequest(f"{OFFSET_HEADER} is required")
+
+        # Кусок принимается без открытой транзакции: запрос берёт
+        # аренду одним UPDATE, пишет файл и фиксирует offset вторым
+        # UPDATE, так что медленный клиент не держит транзакцию и
+        # блокировку строки.
+        upload, claimed = self.claim(pk, request.user.pk, offset)
+        if not claimed or upload.locked_until is None:
+            if offset != upload.offset:
+                return JsonResponse(upload_state(upload), status=409)
+            return JsonResponse({"error": "Upload is in progress"}, status=409)
+        if not connection.in_atomic_block:
+            # Соединение возвращается в пул (или закрывается) на время
+            # передачи и открывается заново для фиксации offset.
+            connection.close()
+
+        try:
+            written = self.append(request, upload)
+            if written is None:
+                return JsonResponse(
+                    {"error": "Data exceeds the declared size"},
+                    status=413,
+                )
+            upload.offset += written
+            if upload.complete:
+                upload.checksum = self.checksum(upload)
+            saved = Upload.objects.filter(
+                pk=pk,
+                offset=offset,
+                locked_until=upload.locked_until,
+            ).update(
+                offset=upload.offset,
+                checksum=upload.checksum,
+                locked_until=None,
+            )
+        finally:
+            Upload.objects.filter(
+                pk=pk,
+                locked_until=upload.locked_until,
+            ).update(locked_until=None)
+        if not saved:
+            return JsonResponse({"error": "Upload lease expired"}, status=409)
+        return JsonResponse(upload_state(upload))
+
+    def claim(
+        self,
+        pk: uuid.UUID,
+        owner_id: int | None,
+        offset: int,
+    ) -> tuple[Upload, bool]:
+        """
+        Берёт аренду загрузки, если offset совпадает и другой запрос её
+        не держит. Срок аренды в locked_until служит её токеном.
+        """
+        now = timezone.now()
+        lease = now + timedelta(seconds=settings.UPLOAD_LEASE_SECONDS)
+        # Короткая транзакция нужна, чтобы прочитать строку с основной
+        # базы сразу после UPDATE.
+        with transaction.atomic():
+            claimed = (
+                Upload.objects.filter(pk=pk, owner_id=owner_id, offset=offset)
+                .filter(Q(locked_until__isnull=True) | Q(locked_until__lt=now))
+                .update(locked_until=lease)
+            )
+            upload = get_object_or_404(Upload, pk=pk, owner_id=owner_id)
+        return upload, bool(claimed)
+
+    def renew(self, upload: Upload) -> bool:
+        """
+        Продлевает аренду, пока она не истекла; False, если её уже
+        забрал другой запрос.
+        """
+        lease = timezone.now() + timedelta(
+            seconds=settings.UPLOAD_LEASE_SECONDS,
+        )
+        renewed = Upload.objects.filter(
+            pk=upload.pk,
+            locked_until=upload.locked_until,
+        ).update(locked_until=lease)
+        if renewed:
+            upload.locked_until = lease
+        return bool(renewed)
+
+    def append(self, request: HttpRequest, upload: Upload) -> int | None:
+        remaining = upload.size - upload.offset
+        written = 0
+        half = timedelta(seconds=settings.UPLOAD_LEASE_SECONDS / 2)
+        with open(upload.path, "r+b") as file:
+            file.seek(upload.offset)
+            while chunk := request.read(StreamingUploadHandler.chunk_size):
+                written += len(chunk)
+                if written > remaining:
+                    file.truncate(upload.offset)
+                    return None
+                if (
+                    upload.locked_until is None
+                    or upload.locked_until - timezone.now() < half
+                ):
+                    if not self.renew(upload):
+                        # Куском уже занимается другой запрос.
+                        return 0
+                file.write(chunk)
+            # Отбрасывает хвост куска, оборванного до обновления offset.
+            file.truncate()
+        return written
+
+    def checksum(self, upload: Upload) -> str:
+        digest = hashlib.sha256()
+        with open(upload.path, "rb") as file:
+            while chunk := file.read(StreamingUploadHandler.chunk_size):
+                digest.update(chunk)
+        return digest.hexdigest()
@@ -1,8 +1,11 @@
 from http import HTTPStatus
+from typing import Any
 
-from django.test import TestCase
+from django.test import AsyncRequestFactory, SimpleTestCase, TestCase
 from django.urls import reverse
 
+from src.apps.homepage.views.homepage import AsyncHomepageView
+
 
 class TestHomepageView(TestCase):
     def test_homepage_get(self) -> None:
@@ -19,3 +22,17 @@ class TestHomepageView(TestCase):
         """
         response = self.client.post(reverse("homepage:homepage"))
         self.assertEqual(response.status_code, HTTPStatus.METHOD_NOT_ALLOWED)
+
+
+class TestAsyncHomepageView(SimpleTestCase):
+    async def test_homepage_get(self) -> None:
+        """
+        Тестирование async-версии главной страницы
+        """
+        view: Any = AsyncHomepageView.as_view()
+        response = await view(AsyncRequestFactory().get("/"))
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(
+            response.template_name,
+            ["homepage/homepage.html"],
+        )
@@ -1,9 +1,12 @@
+from django.conf import settings
 from django.urls import path
 
-from src.apps.homepage.views.homepage import HomepageView
+from src.apps.homepage.views.homepage import AsyncHomepageView, HomepageView
 
 app_name = "homepage"
 
+homepage_view = AsyncHomepageView if settings.ASYNC_VIEWS else HomepageView
+
 urlpatterns = [
-    path("", HomepageView.as_view(), name="homepage"),
+    path("", homepage_view.as_view(), name="homepage"),
 ]
@@ -1,5 +1,19 @@
+from typing import Any
+
+from django.http import HttpRequest, HttpResponse
 from django.views.generic import TemplateView
 
 
 class HomepageView(TemplateView):
     template_name = "homepage/homepage.html"
+
+
+class AsyncHomepageView(HomepageView):
+    """
+    Async-версия HomepageView для ASGI.
+    """
+
+    async def get(  # type: ignore[override]
+        self, request: HttpRequest, *args: Any, **kwargs: Any,
+    ) -> HttpResponse:
+        return self.render_to_response(self.get_context_data(**kwargs))
@@ -0,0 +1,26 @@
+from django.contrib import admin
+
+from src.apps.tasks.models import Task
+
+
+@admin.register(Task)
+class TaskAdmin(admin.ModelAdmin):
+    list_display = [
+        Task.name.field.name,
+        Task.queue.field.name,
+        Task.status.field.name,
+        Task.attempts.field.name,
+        Task.run_at.field.name,
+        Task.finished.field.name,
+    ]
+    list_filter = [
+        Task.status.field.name,
+        Task.queue.field.name,
+    ]
+    search_fields = [Task.name.field.name]
+    readonly_fields = [
+        Task.attempts.field.name,
+        Task.locked_until.field.name,
+        Task.last_error.field.name,
+        Task.finished.field.name,
+    ]
@@ -0,0 +1,49 @@
+import signal
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from src.apps.tasks.worker import Worker
+
+
+class Command(BaseCommand):
+    help = (
+        "Запускает воркер фоновых задач. Воркеров можно запускать "
+        "несколько; SIGTERM и SIGINT дают доделать начатые задачи."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--queue",
+            action="append",
+            help="Очередь из TASK_QUEUES; по умолчанию все.",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=4,
+            help="Число задач, выполняемых процессом одновременно.",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Выполнить готовые задачи и выйти.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        worker = Worker(options["queue"], options["concurrency"])
+        if options["once"]:
+            count = worker.drain()
+            self.stdout.write(f"Executed {count} tasks")
+            return
+
+        def stop(signum: int, frame: Any) -> None:
+            worker.stopping = True
+
+        signal.signal(signal.SIGTERM, stop)
+        signal.signal(signal.SIGINT, stop)
+        self.stdout.write(
+            f"Worker started: queues {', '.join(worker.limits)}, "
+            f"concurrency {worker.concurrency}",
+        )
+        worker.run()
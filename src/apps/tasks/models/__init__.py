@@ -0,0 +1,6 @@
+from src.apps.tasks.models.task import Task
+
+
+__all__ = [
+    "Task",
+]
@@ -0,0 +1,61 @@
+from django.db import models
+from django.utils import timezone
+
+
+class Task(models.Model):
+    """
+    Задача фоновой очереди.
+
+    Воркер run_tasks забирает задачи со статусом PENDING и наступившим
+    run_at. На время выполнения задача RUNNING с арендой до locked_until:
+    если воркер упал, по истечении аренды задачу заберёт другой.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = "pending"
+        RUNNING = "running"
+        DONE = "done"
+        FAILED = "failed"
+
+    name = models.CharField(max_length=200)
+    kwargs = models.JSONField(default=dict)
+    queue = models.CharField(max_length=50, default="default")
+    status = models.CharField(
+        max_length=10,
+        choices=Status.choices,
+        default=Status.PENDING,
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    max_attempts = models.PositiveSmallIntegerField(default=3)
+    run_at = models.DateTimeField(default=timezone.now)
+    locked_until = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+    created = models.DateTimeField(auto_now_add=True)
+    finished = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["queue", "run_at"],
+                condition=models.Q(status="pending"),
+                name="task_pending_idx",
+            ),
+            models.Index(
+                fields=["queue", "locked_until"],
+                condition=models.Q(status="running"),
+                name="task_running_idx",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return self.name
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}("
+            f"name={self.name!r}, "
+            f"kwargs={self.kwargs!r}, "
+            f"queue={self.queue!r}, "
+            f"status={self.status!r}, "
+            f"attempts={self.attempts!r})"
+        )
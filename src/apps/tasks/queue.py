@@ -0,0 +1,93 @@
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from typing import Any
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils import timezone
+
+from src.apps.tasks.models import Task
+
+
+class TaskDefinition:
+    """
+    Функция, зарегистрированная как фоновая задача.
+
+    Вызов выполняет её сразу, enqueue() ставит в очередь. Аргументы
+    передаются только по имени и должны сериализоваться в JSON.
+    """
+
+    def __init__(
+        self,
+        func: Callable[..., Any],
+        queue: str,
+        max_attempts: int,
+        retry_delay: float,
+    ) -> None:
+        self.func = func
+        self.name = f"{func.__module__}.{func.__qualname__}"
+        self.queue = queue
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.func(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(name={self.name!r})"
+
+    def enqueue(
+        self,
+        *,
+        run_at: datetime | None = None,
+        **kwargs: Any,
+    ) -> Task:
+        """
+        Ставит задачу в очередь. Строка пишется в текущей транзакции,
+        поэтому воркер увидит задачу только после её коммита, а при
+        откате задача не появится вовсе.
+        """
+        return Task.objects.create(
+            name=self.name,
+            kwargs=kwargs,
+            queue=self.queue,
+            max_attempts=self.max_attempts,
+            run_at=run_at or timezone.now(),
+        )
+
+    def retry_at(self, attempts: int) -> datetime:
+        """
+        Время следующей попытки: задержка удваивается с каждой попыткой.
+        """
+        delay = self.retry_delay * 2 ** (attempts - 1)
+        return timezone.now() + timedelta(seconds=delay)
+
+
+_registry: dict[str, TaskDefinition] = {}
+
+
+def task(
+    *,
+    queue: str = "default",
+    max_attempts: int = 3,
+    retry_delay: float = 10,
+) -> Callable[[Callable[..., Any]], TaskDefinition]:
+    """
+    Регистрирует функцию как задачу очереди queue из TASK_QUEUES.
+
+    Модули с задачами должны импортироваться при запуске (например, из
+    AppConfig.ready), чтобы воркер знал их по имени.
+    """
+    if queue not in settings.TASK_QUEUES:
+        raise ImproperlyConfigured(f"Queue {queue!r} is not in TASK_QUEUES")
+
+    def decorator(func: Callable[..., Any]) -> TaskDefinition:
+        definition = TaskDefinition(func, queue, max_attempts, retry_delay)
+        _registry[definition.name] = definition
+        return definition
+
+    return decorator
+
+
+def get(name: str) -> TaskDefinition | None:
+    return _registry.get(name)
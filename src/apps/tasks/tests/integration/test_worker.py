@@ -0,0 +1,193 @@
+import time
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.db import transaction
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from src.apps.tasks.models import Task
+from src.apps.tasks.queue import task
+from src.apps.tasks.worker import Worker
+
+calls: list[int] = []
+slept: list[float] = []
+
+
+@task(max_attempts=2)
+def record(value: int) -> None:
+    calls.append(value)
+
+
+@task()
+def sleep(seconds: float) -> None:
+    time.sleep(seconds)
+    slept.append(seconds)
+
+
+@task(max_attempts=2, retry_delay=60)
+def fail() -> None:
+    raise RuntimeError("boom")
+
+
+class TestWorker(TestCase):
+    def setUp(self) -> None:
+        calls.clear()
+        slept.clear()
+
+    def test_enqueue_follows_transaction(self) -> None:
+        """
+        Тест, что задача из откаченной транзакции не ставится в очередь.
+        """
+        try:
+            with transaction.atomic():
+                record.enqueue(value=1)
+                raise RuntimeError
+        except RuntimeError:
+            pass
+
+        self.assertFalse(Task.objects.exists())
+
+    def test_drain(self) -> None:
+        """
+        Тест, что воркер выполняет готовые задачи и не трогает отложенные.
+        """
+        record.enqueue(value=1)
+        record.enqueue(value=2)
+        later = record.enqueue(
+            value=3,
+            run_at=timezone.now() + timedelta(hours=1),
+        )
+
+        self.assertEqual(Worker().drain(), 2)
+
+        self.assertEqual(calls, [1, 2])
+        self.assertEqual(
+            Task.objects.filter(status=Task.Status.DONE).count(),
+            2,
+        )
+        later.refresh_from_db()
+        self.assertEqual(later.status, Task.Status.PENDING)
+
+    def test_retries(self) -> None:
+        """
+        Тест, что упавшая задача откладывается и повторяется, а после
+        max_attempts помечается FAILED.
+        """
+        item = fail.enqueue()
+
+        with self.assertLogs("src.apps.tasks.worker", "ERROR"):
+            Worker().drain()
+        item.refresh_from_db()
+        self.assertEqual(item.status, Task.Status.PENDING)
+        self.assertEqual(item.attempts, 1)
+        self.assertIn("RuntimeError: boom", item.last_error)
+        self.assertGreater(item.run_at, timezone.now() + timedelta(seconds=50))
+
+        Task.objects.filter(pk=item.pk).update(run_at=timezone.now())
+        with self.assertLogs("src.apps.tasks.worker", "ERROR"):
+            Worker().drain()
+        item.refresh_from_db()
+        self.assertEqual(item.status, Task.Status.FAILED)
+        self.assertEqual(item.attempts, 2)
+
+    def test_unknown_task(self) -> None:
+        """
+        Тест, что задача с незарегистрированным именем сразу FAILED.
+        """
+        item = Task.objects.create(name="missing.task")
+
+        with self.assertLogs("src.apps.tasks.worker", "ERROR"):
+            Worker().drain()
+        item.refresh_from_db()
+
+        self.assertEqual(item.status, Task.Status.FAILED)
+        self.assertIn("not registered", item.last_error)
+
+    @override_settings(TASK_QUEUES={"default": 2, "images": 1})
+    def test_queue_concurrency_limit(self) -> None:
+        """
+        Тест, что воркеры вместе не выполняют больше задач очереди, чем
+        её лимит, а задачу с истёкшей арендой забирает другой воркер.
+        """
+        for value in range(3):
+            record.enqueue(value=value)
+
+        first = Worker(concurrency=10).claim(10)
+        second = Worker(concurrency=10).claim(10)
+        self.assertEqual(len(first), 2)
+        self.assertEqual(second, [])
+
+        Task.objects.filter(pk=first[0].pk).update(
+            locked_until=timezone.now() - timedelta(seconds=1),
+        )
+        third = Worker(concurrency=10).claim(10)
+        self.assertEqual([item.pk for item in third], [first[0].pk])
+        self.assertEqual(third[0].attempts, 2)
+
+    def test_expired_last_attempt_fails(self) -> None:
+        """
+        Тест, что задача с истёкшей арендой на последней попытке (воркер
+        упал во время выполнения) помечается FAILED, а не повторяется.
+        """
+        item = record.enqueue(value=1)
+        Task.objects.filter(pk=item.pk).update(
+            status=Task.Status.RUNNING,
+            attempts=2,
+            locked_until=timezone.now() - timedelta(seconds=1),
+        )
+
+        self.assertEqual(Worker().drain(), 0)
+        item.refresh_from_db()
+
+        self.assertEqual(item.status, Task.Status.FAILED)
+        self.assertEqual(item.attempts, 2)
+        self.assertIsNone(item.locked_until)
+        self.assertEqual(calls, [])
+
+    def test_renew(self) -> None:
+        """
+        Тест, что продление аренды сдвигает locked_until только своей
+        попытки задачи.
+        """
+        item = record.enqueue(value=1)
+        (claimed,) = Worker().claim(1)
+        Task.objects.filter(pk=item.pk).update(locked_until=timezone.now())
+
+        self.assertTrue(Worker().renew(claimed))
+        item.refresh_from_db()
+        assert item.locked_until is not None
+        self.assertGreater(
+            item.locked_until,
+            timezone.now() + timedelta(seconds=250),
+        )
+
+        claimed.attempts += 1
+        self.assertFalse(Worker().renew(claimed))
+
+    @override_settings(TASK_LEASE_SECONDS=0.03)
+    def test_heartbeat_during_execution(self) -> None:
+        """
+        Тест, что аренда продлевается, пока задача выполняется.
+        """
+        sleep.enqueue(seconds=0.1)
+
+        with mock.patch.object(Worker, "renew", return_value=True) as renew:
+            Worker().drain()
+
+        self.assertEqual(slept, [0.1])
+        self.assertGreaterEqual(renew.call_count, 2)
+
+    def test_command_once(self) -> None:
+        """
+        Тест, что run_tasks --once выполняет очередь и завершается.
+        """
+        record.enqueue(value=5)
+        out = StringIO()
+
+        call_command("run_tasks", "--once", stdout=out)
+
+        self.assertEqual(calls, [5])
+        self.assertIn("Executed 1 tasks", out.getvalue())
@@ -0,0 +1,44 @@
+from datetime import timedelta
+
+from django.core.exceptions import ImproperlyConfigured
+from django.test import SimpleTestCase
+from django.utils import timezone
+
+from src.apps.tasks import queue
+
+
+def noop() -> None:
+    pass
+
+
+class TestTaskDecorator(SimpleTestCase):
+    def test_registers_by_module_path(self) -> None:
+        """
+        Тест, что задача регистрируется по полному имени функции и
+        вызывается как обычная функция.
+        """
+        definition = queue.task(queue="default")(noop)
+
+        self.assertEqual(definition.name, f"{__name__}.noop")
+        self.assertIs(queue.get(definition.name), definition)
+        self.assertIsNone(definition())
+
+    def test_unknown_queue(self) -> None:
+        """
+        Тест, что очередь должна быть объявлена в TASK_QUEUES.
+        """
+        with self.assertRaises(ImproperlyConfigured):
+            queue.task(queue="missing")
+
+    def test_retry_delay_doubles(self) -> None:
+        """
+        Тест, что задержка перед повтором удваивается с каждой попыткой.
+        """
+        definition = queue.task(retry_delay=10)(noop)
+
+        delay = definition.retry_at(3) - timezone.now()
+        self.assertAlmostEqual(
+            delay.total_seconds(),
+            timedelta(seconds=40).total_seconds(),
+            delta=1,
+        )
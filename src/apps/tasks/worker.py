@@ -0,0 +1,256 @@
+import logging
+import threading
+import time
+import traceback
+from collections.abc import Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from contextlib import contextmanager
+from datetime import timedelta
+from typing import Any
+
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from src.apps.tasks import queue as task_queue
+from src.apps.tasks.models import Task
+
+logger = logging.getLogger(__name__)
+
+
+def lock_queue(queue: str) -> None:
+    """
+    Сериализует выборку задач одной очереди между воркерами до конца
+    транзакции, чтобы лимит параллельных задач не превысили два воркера,
+    одновременно посчитавшие свободные места.
+    """
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT pg_advisory_xact_lock(hashtext(%s))",
+                [f"tasks:{queue}"],
+            )
+
+
+class Worker:
+    """
+    Воркер очереди задач в таблице Task, без внешнего брокера.
+
+    В одном процессе выполняется до concurrency задач в потоках, а
+    лимиты TASK_QUEUES ограничивают число одновременно выполняемых задач
+    очереди во всех воркерах вместе. Задачи выбираются через
+    SELECT ... FOR UPDATE SKIP LOCKED, поэтому воркеров может быть
+    сколько угодно. Упавшая задача повторяется с растущей задержкой,
+    пока не исчерпает max_attempts; это относится и к задаче, на которой
+    упал сам воркер и чья аренда истекла.
+    """
+
+    def __init__(
+        self,
+        queues: list[str] | None = None,
+        concurrency: int = 1,
+    ) -> None:
+        self.limits = {
+            name: limit
+            for name, limit in settings.TASK_QUEUES.items()
+            if not queues or name in queues
+        }
+        self.concurrency = concurrency
+        self.stopping = False
+
+    def claim(self, limit: int) -> list[Task]:
+        """
+        Забирает до limit готовых к выполнению задач с учётом лимитов
+        очередей, включая задачи с истёкшей арендой.
+        """
+        claimed: list[Task] = []
+        for name, queue_limit in self.limits.items():
+            if len(claimed) >= limit:
+                break
+            with transaction.atomic():
+                lock_queue(name)
+                now = timezone.now()
+                # Задача, чья последняя попытка уронила воркер (OOM,
+                # SIGKILL), больше не повторяется.
+                Task.objects.filter(
+                    queue=name,
+                    status=Task.Status.RUNNING,
+                    locked_until__lte=now,
+                    attempts__gte=F("max_attempts"),
+                ).update(
+                    status=Task.Status.FAILED,
+                    locked_until=None,
+                    finished=now,
+                    last_error="Lease expired on the last attempt",
+                )
+                running = Task.objects.filter(
+                    queue=name,
+                    status=Task.Status.RUNNING,
+                    locked_until__gt=now,
+                ).count()
+                free = min(queue_limit - running, limit - len(claimed))
+                if free <= 0:
+                    continue
+                tasks = list(
+                    Task.objects.select_for_update(skip_locked=True)
+                    .filter(
+                        Q(status=Task.Status.PENDING, run_at__lte=now)
+                        | Q(status=Task.Status.RUNNING, locked_until__lte=now),
+                        queue=name,
+                    )
+                    .order_by("run_at", "id")[:free],
+                )
+                lease = now + timedelta(seconds=settings.TASK_LEASE_SECONDS)
+                for task in tasks:
+                    task.status = Task.Status.RUNNING
+                    task.attempts += 1
+                    task.locked_until = lease
+                Task.objects.bulk_update(
+                    tasks,
+                    ["status", "attempts", "locked_until"],
+                )
+            claimed.extend(tasks)
+        return claimed
+
+    def renew(self, task: Task) -> bool:
+        """
+        Продлевает аренду задачи; False, если её уже забрал другой воркер.
+        """
+        lease = timezone.now() + timedelta(
+            seconds=settings.TASK_LEASE_SECONDS,
+        )
+        return bool(
+            Task.objects.filter(
+                pk=task.pk,
+                status=Task.Status.RUNNING,
+                attempts=task.attempts,
+            ).update(locked_until=lease),
+        )
+
+    @contextmanager
+    def heartbeat(self, task: Task) -> Iterator[None]:
+        """
+        Пока выполняется задача, продлевает её аренду из отдельного потока
+        каждую треть TASK_LEASE_SECONDS, чтобы долгую задачу не забрал и
+        не запустил параллельно другой воркер.
+        """
+        stop = threading.Event()
+
+        def beat() -> None:
+            try:
+                while not stop.wait(settings.TASK_LEASE_SECONDS / 3):
+                    try:
+                        if not self.renew(task):
+                            return
+                    except Exception:
+                        logger.exception(
+                            "Failed to renew lease of task %s",
+                            task.pk,
+                        )
+            finally:
+                connection.close()
+
+        thread = threading.Thread(
+            target=beat,
+            name=f"task-heartbeat-{task.pk}",
+            daemon=True,
+        )
+        thread.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            thread.join()
+
+    def execute(self, task: Task) -> None:
+        definition = task_queue.get(task.name)
+        try:
+            if definition is None:
+                raise LookupError(f"Task {task.name} is not registered")
+            with self.heartbeat(task):
+                definition(**task.kwargs)
+        except Exception:
+            logger.exception("Task %s (%s) failed", task.pk, task.name)
+            changes: dict[str, Any] = {"last_error": traceback.format_exc()}
+            if definition is not None and task.attempts < task.max_attempts:
+                changes["status"] = Task.Status.PENDING
+                changes["run_at"] = definition.retry_at(task.attempts)
+            else:
+                changes["status"] = Task.Status.FAILED
+                changes["finished"] = timezone.now()
+        else:
+            changes = {
+                "status": Task.Status.DONE,
+                "finished": timezone.now(),
+            }
+        # Задачу с истёкшей арендой мог забрать другой воркер - тогда
+        # результат записывает он.
+        Task.objects.filter(
+            pk=task.pk,
+            status=Task.Status.RUNNING,
+            attempts=task.attempts,
+        ).update(locked_until=None, **changes)
+
+    def execute_in_thread(self, task: Task) -> None:
+        close_old_connections()
+        try:
+            self.execute(task)
+        finally:
+            close_old_connections()
+
+    def drain(self) -> int:
+        """
+        Выполняет готовые задачи в текущем потоке, пока они есть, и
+        возвращает их число.
+        """
+        count = 0
+        while not self.stopping and (tasks := self.claim(self.concurrency)):
+            for task in tasks:
+                self.execute(task)
+            count += len(tasks)
+        return count
+
+    def purge(self) -> None:
+        Task.objects.filter(
+            status=Task.Status.DONE,
+            finished__lt=timezone.now()
+            - timedelta(seconds=settings.TASK_KEEP_DONE_SECONDS),
+        ).delete()
+
+    def run(self) -> None:
+        """
+        Выполняет задачи в пуле из concurrency потоков до установки
+        stopping; начатые задачи при остановке доделываются.
+        """
+        running: set[Future[None]] = set()
+        purged = float("-inf")
+        with ThreadPoolExecutor(
+            max_workers=self.concurrency,
+            thread_name_prefix="task",
+        ) as executor:
+            while not self.stopping:
+                if time.monotonic() - purged > 3600:
+                    self.purge()
+                    purged = time.monotonic()
+                close_old_connections()
+                tasks = self.claim(self.concurrency - len(running))
+                running.update(
+                    executor.submit(self.execute_in_thread, task)
+                    for task in tasks
+                )
+                if tasks:
+                    continue
+                if running:
+                    _, running = wait(
+                        running,
+                        timeout=settings.TASK_POLL_SECONDS,
+                        return_when=FIRST_COMPLETED,
+                    )
+                else:
+                    time.sleep(settings.TASK_POLL_SECONDS)
@@ -0,0 +1,103 @@
+from collections.abc import Callable
+from contextvars import ContextVar, Token
+from typing import Any
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections, models
+from django.http import HttpRequest, HttpResponse
+
+PRIMARY = "default"
+REPLICA = "replica"
+PIN_COOKIE = "db_primary_pin"
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS", "TRACE")
+
+_pinned: ContextVar[bool] = ContextVar("db_pinned", default=False)
+_wrote: ContextVar[bool] = ContextVar("db_wrote", default=False)
+
+
+class PrimaryReplicaRouter:
+    """
+    Роутер чтения с реплики.
+
+    Чтение идёт на реплику, запись и миграции - на основную БД. Запрос
+    закрепляется за основной БД, если он небезопасный (POST и т.п.), если
+    в нём уже была запись, если идёт транзакция, или если клиент недавно
+    писал (кука PIN_COOKIE от PrimaryPinningMiddleware), чтобы сразу
+    после записи не читать отстающую реплику.
+    """
+
+    def db_for_read(self, model: type[models.Model], **hints: Any) -> str:
+        if _pinned.get() or connections[PRIMARY].in_atomic_block:
+            return PRIMARY
+        return REPLICA
+
+    def db_for_write(self, model: type[models.Model], **hints: Any) -> str:
+        _pinned.set(True)
+        _wrote.set(True)
+        return PRIMARY
+
+    def allow_relation(self, obj1: Any, obj2: Any, **hints: Any) -> bool:
+        return True
+
+    def allow_migrate(self, db: str, app_label: str, **hints: Any) -> bool:
+        return db == PRIMARY
+
+
+class PrimaryPinningMiddleware:
+    """
+    Закрепляет запрос за основной БД для PrimaryReplicaRouter и ставит
+    клиенту короткоживущую куку после записи.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable) -> None:
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> Any:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        tokens = self.pin(request)
+        try:
+            return self.set_cookie(self.get_response(request))
+        finally:
+            self.reset(tokens)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        tokens = self.pin(request)
+        try:
+            return self.set_cookie(await self.get_response(request))
+        finally:
+            self.reset(tokens)
+
+    @staticmethod
+    def pin(request: HttpRequest) -> tuple[Token[bool], Token[bool]]:
+        return (
+            _pinned.set(
+                request.method not in SAFE_METHODS
+                or PIN_COOKIE in request.COOKIES,
+            ),
+            _wrote.set(False),
+        )
+
+    @staticmethod
+    def reset(tokens: tuple[Token[bool], Token[bool]]) -> None:
+        pinned_token, wrote_token = tokens
+        _pinned.reset(pinned_token)
+        _wrote.reset(wrote_token)
+
+    @staticmethod
+    def set_cookie(response: HttpResponse) -> HttpResponse:
+        if _wrote.get():
+            response.set_cookie(
+                PIN_COOKIE,
+                "1",
+                max_age=settings.DATABASE_REPLICA_PIN_SECONDS,
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
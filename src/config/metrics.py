@@ -0,0 +1,267 @@
+import atexit
+import json
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from django.conf import settings
+from django.http import (
+    HttpRequest,
+    HttpResponse,
+    HttpResponseForbidden,
+)
+from django.utils.crypto import constant_time_compare
+
+if TYPE_CHECKING:
+    from src.config.performance import RequestMetrics
+
+DURATION_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    float("inf"),
+)
+
+FAMILIES = {
+    "educa_request_duration_seconds": (
+        "histogram",
+        "Время обработки запроса по имени урла.",
+    ),
+    "educa_db_queries_total": ("counter", "Число SQL-запросов."),
+    "educa_db_duration_seconds_total": (
+        "counter",
+        "Суммарное время SQL-запросов.",
+    ),
+    "educa_cache_hits_total": ("counter", "Попадания в кэш."),
+    "educa_cache_misses_total": ("counter", "Промахи кэша."),
+    "educa_cache_hit_ratio": (
+        "gauge",
+        "Доля попаданий в кэш по всем запросам.",
+    ),
+    "educa_upload_bytes_total": (
+        "counter",
+        "Объём загрузок в байтах: multipart-формы и чанки PUT.",
+    ),
+}
+
+Labels = tuple[tuple[str, str], ...]
+
+
+class MetricsStore:
+    """
+    Счётчики метрик, общие для всех воркеров gunicorn.
+
+    Каждый процесс копит приращения в памяти и раз в flush_interval
+    секунд прибавляет их к SQLite-файлу одной транзакцией, поэтому
+    воркеры не блокируют друг друга на каждом запросе. Эндпоинт /metrics
+    сбрасывает свои приращения и читает суммы из файла.
+    """
+
+    def __init__(self, path: Path, flush_interval: float) -> None:
+        self.path = path
+        self.flush_interval = flush_interval
+        self._pending: defaultdict[tuple[str, Labels], float] = defaultdict(
+            float,
+        )
+        self._lock = threading.Lock()
+        self._flushed_at = time.monotonic()
+        atexit.register(self.flush)
+
+    def inc(self, name: str, labels: Labels, value: float = 1) -> None:
+        with self._lock:
+            self._pending[name, labels] += value
+            due = time.monotonic() - self._flushed_at >= self.flush_interval
+        if due:
+            self.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            pending, self._pending = self._pending, defaultdict(float)
+            self._flushed_at = time.monotonic()
+        if not pending:
+            return
+        with self.connect() as connection:
+            connection.executemany(
+                "INSERT INTO metrics (name, labels, value) VALUES (?, ?, ?) "
+                "ON CONFLICT (name, labels) "
+                "DO UPDATE SET value = value + excluded.value",
+                [
+                    (name, json.dumps(labels), value)
+                    for (name, labels), value in pending.items()
+                ],
+            )
+        connection.close()
+
+    def collect(self) -> list[tuple[str, Labels, float]]:
+        self.flush()
+        with self.connect() as connection:
+            rows = connection.execute(
+                "SELECT name, labels, value FROM metrics",
+            ).fetchall()
+        connection.close()
+        return [
+            (name, tuple(tuple(pair) for pair in json.loads(labels)), value)
+            for name, labels, value in rows
+        ]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pending.clear()
+        with self.connect() as connection:
+            connection.execute("DELETE FROM metrics")
+        connection.close()
+
+    def connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=5)
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute("PRAGMA synchronous = OFF")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS metrics ("
+            "name TEXT NOT NULL, labels TEXT NOT NULL, "
+            "value REAL NOT NULL, PRIMARY KEY (name, labels))",
+        )
+        return connection
+
+
+_store: MetricsStore | None = None
+
+
+def get_store() -> MetricsStore:
+    global _store
+    path = Path(settings.METRICS_PATH)
+    if _store is None or _store.path != path:
+        _store = MetricsStore(path, settings.METRICS_FLUSH_SECONDS)
+    return _store
+
+
+def observe_request(
+    request: HttpRequest,
+    metrics: "RequestMetrics",
+    duration: float,
+) -> None:
+    match = request.resolver_match
+    labels: Labels = (("view", match.view_name if match else "unresolved"),)
+    store = get_store()
+    for bucket in DURATION_BUCKETS:
+        store.inc(
+            "educa_request_duration_seconds_bucket",
+            (*labels, ("le", format_value(bucket))),
+            duration <= bucket,
+        )
+    store.inc("educa_request_duration_seconds_sum", labels, duration)
+    store.inc("educa_request_duration_seconds_count", labels)
+    store.inc("educa_db_queries_total", labels, len(metrics.queries))
+    store.inc("educa_db_duration_seconds_total", labels, metrics.db_time)
+    store.inc("educa_cache_hits_total", labels, metrics.cache_hits)
+    store.inc("educa_cache_misses_total", labels, metrics.cache_misses)
+    if is_upload(request):
+        store.inc(
+            "educa_upload_bytes_total",
+            labels,
+            int(request.META.get("CONTENT_LENGTH") or 0),
+        )
+
+
+def is_upload(request: HttpRequest) -> bool:
+    """
+    Запрос несёт загружаемый файл: multipart-форма или очередной чанк
+    возобновляемой загрузки, который приходит в теле PUT.
+    """
+    if request.content_type == "multipart/form-data":
+        return True
+    match = request.resolver_match
+    return (
+        request.method == "PUT"
+        and match is not None
+        and match.view_name == "courses:upload"
+    )
+
+
+def format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+def escape(value: str) -> str:
+    return (
+        value.replace("\\", r"\\")
+        .replace('"', r'\"')
+        .replace("\n", r"\n")
+    )
+
+
+def format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{key}="{escape(value)}"' for key, value in labels)
+    return f"{{{pairs}}}"
+
+
+def family_of(name: str) -> str:
+    for suffix in ("_bucket", "_sum", "_count"):
+        family = name.removesuffix(suffix)
+        if family != name and FAMILIES.get(family, ("",))[0] == "histogram":
+            return family
+    return name
+
+
+def render(samples: list[tuple[str, Labels, float]]) -> str:
+    """
+    Формирует текстовый формат экспозиции Prometheus.
+    """
+    totals: defaultdict[str, float] = defaultdict(float)
+    for name, _, value in samples:
+        totals[name] += value
+    hits = totals["educa_cache_hits_total"]
+    lookups = hits + totals["educa_cache_misses_total"]
+    if lookups:
+        samples = [*samples, ("educa_cache_hit_ratio", (), hits / lookups)]
+
+    def sort_key(sample: tuple[str, Labels, float]) -> Any:
+        name, labels, _ = sample
+        le = dict(labels).get("le")
+        return (
+            family_of(name),
+            [pair for pair in labels if pair[0] != "le"],
+            name,
+            float(le) if le is not None else 0,
+        )
+
+    lines: list[str] = []
+    family = None
+    for name, labels, value in sorted(samples, key=sort_key):
+        if family_of(name) != family:
+            family = family_of(name)
+            kind, description = FAMILIES.get(family, ("untyped", ""))
+            lines += [
+                f"# HELP {family} {description}",
+                f"# TYPE {family} {kind}",
+            ]
+        lines.append(f"{name}{format_labels(labels)} {format_value(value)}")
+    return "\n".join(lines) + "\n"
+
+
+def metrics_view(request: HttpRequest) -> HttpResponse:
+    token = settings.METRICS_TOKEN
+    if token and not constant_time_compare(
+        request.headers.get("Authorization", ""),
+        f"Bearer {token}",
+    ):
+        return HttpResponseForbidden()
+    return HttpResponse(
+        render(get_store().collect()),
+        content_type="text/plain; version=0.0.4; charset=utf-8",
+    )
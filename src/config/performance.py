@@ -0,0 +1,241 @@
+import json
+import logging
+import time
+from collections.abc import Callable
+from contextlib import ExitStack
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from asgiref.sync import (
+    iscoroutinefunction,
+    markcoroutinefunction,
+    sync_to_async,
+)
+from django.conf import settings
+from django.db import connections
+from django.http import HttpRequest, HttpResponse
+from django.template.response import SimpleTemplateResponse
+from django.utils.module_loading import import_string
+
+from src.config.metrics import observe_request
+
+logger = logging.getLogger(__name__)
+
+_missing = object()
+
+
+@dataclass
+class RequestMetrics:
+    """
+    Счётчики одного запроса, которые собирает PerformanceMiddleware.
+    """
+
+    queries: list[tuple[float, str]] = field(default_factory=list)
+    db_time: float = 0.0
+    template_time: float = 0.0
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+    def top_queries(self, limit: int) -> list[dict[str, Any]]:
+        return [
+            {"ms": round(duration * 1000, 2), "sql": sql}
+            for duration, sql in sorted(self.queries, reverse=True)[:limit]
+        ]
+
+
+_metrics: ContextVar[RequestMetrics | None] = ContextVar(
+    "performance_metrics",
+    default=None,
+)
+
+
+class InstrumentedCache:
+    """
+    Обёртка над бэкендом кэша, считающая попадания и промахи текущего
+    запроса. Настоящий бэкенд задаётся ключом INSTRUMENTED_BACKEND в
+    CACHES, остальные методы проксируются ему без изменений.
+    """
+
+    def __init__(self, location: str, params: dict[str, Any]) -> None:
+        backend = import_string(params.pop("INSTRUMENTED_BACKEND"))
+        self._backend = backend(location, params)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._backend, name)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._backend
+
+    def get(self, key: str, default: Any = None, **kwargs: Any) -> Any:
+        value = self._backend.get(key, _missing, **kwargs)
+        self._count(hits=int(value is not _missing), total=1)
+        return default if value is _missing else value
+
+    def get_many(self, keys: Any, **kwargs: Any) -> dict[str, Any]:
+        keys = list(keys)
+        values = self._backend.get_many(keys, **kwargs)
+        self._count(hits=len(values), total=len(keys))
+        return values
+
+    async def aget(self, key: str, default: Any = None, **kwargs: Any) -> Any:
+        return await sync_to_async(self.get)(key, default, **kwargs)
+
+    async def aget_many(self, keys: Any, **kwargs: Any) -> dict[str, Any]:
+        return await sync_to_async(self.get_many)(keys, **kwargs)
+
+    def _count(self, hits: int, total: int) -> None:
+        metrics = _metrics.get()
+        if metrics is not None:
+            metrics.cache_hits += hits
+            metrics.cache_misses += total - hits
+
+
+class PerformanceMiddleware:
+    """
+    Замеряет время запроса, число и время SQL-запросов, время рендера
+    шаблонов и попадания в кэш.
+
+    Результат отдаётся в заголовке Server-Timing и пишется одной
+    JSON-строкой в лог. Запросы дольше PERFORMANCE_SLOW_REQUEST_MS
+    логируются с уровнем WARNING вместе с самыми долгими SQL-запросами.
+    При METRICS_ENABLED замеры также копятся для эндпоинта /metrics.
+    Подключается только при DJANGO_PERFORMANCE_ENABLED или
+    DJANGO_METRICS_ENABLED, поэтому в выключенном состоянии ничего не
+    стоит.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable) -> None:
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> Any:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        metrics = RequestMetrics()
+        token = _metrics.set(metrics)
+        stack = self.wrap_connections()
+        start = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            stack.close()
+            _metrics.reset(token)
+        return self.finish(request, response, metrics, start)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        # ORM в async-режиме работает в потоке sync_to_async со своими
+        # объектами соединений, поэтому обёртки ставятся в этом потоке.
+        metrics = RequestMetrics()
+        token = _metrics.set(metrics)
+        stack = await sync_to_async(self.wrap_connections)()
+        start = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(stack.close)()
+            _metrics.reset(token)
+        return self.finish(request, response, metrics, start)
+
+    def wrap_connections(self) -> ExitStack:
+        stack = ExitStack()
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(self.record_query))
+        return stack
+
+    def finish(
+        self,
+        request: HttpRequest,
+        response: HttpResponse,
+        metrics: RequestMetrics,
+        start: float,
+    ) -> HttpResponse:
+        duration = time.perf_counter() - start
+        if settings.METRICS_ENABLED:
+            observe_request(request, metrics, duration)
+        if settings.PERFORMANCE_ENABLED:
+            timing = self.server_timing(metrics, duration)
+            if response.has_header("Server-Timing"):
+                timing = f"{response['Server-Timing']}, {timing}"
+            response["Server-Timing"] = timing
+            self.log(request, response, metrics, duration)
+        return response
+
+    def process_template_response(
+        self,
+        request: HttpRequest,
+        response: SimpleTemplateResponse,
+    ) -> SimpleTemplateResponse:
+        metrics = _metrics.get()
+        if metrics is None:
+            return response
+        start = time.perf_counter()
+
+        def rendered(response: SimpleTemplateResponse) -> None:
+            metrics.template_time += time.perf_counter() - start
+
+        response.add_post_render_callback(rendered)
+        return response
+
+    @staticmethod
+    def record_query(
+        execute: Callable,
+        sql: str,
+        params: Any,
+        many: bool,
+        context: dict[str, Any],
+    ) -> Any:
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            metrics = _metrics.get()
+            if metrics is not None:
+                duration = time.perf_counter() - start
+                metrics.db_time += duration
+                metrics.queries.append((duration, sql))
+
+    @staticmethod
+    def server_timing(metrics: RequestMetrics, duration: float) -> str:
+        return ", ".join(
+            [
+                f'db;dur={metrics.db_time * 1000:.1f};'
+                f'desc="{len(metrics.queries)} queries"',
+                f"tpl;dur={metrics.template_time * 1000:.1f}",
+                f'cache;desc="{metrics.cache_hits} hits, '
+                f'{metrics.cache_misses} misses"',
+                f"total;dur={duration * 1000:.1f}",
+            ],
+        )
+
+    @staticmethod
+    def log(
+        request: HttpRequest,
+        response: HttpResponse,
+        metrics: RequestMetrics,
+        duration: float,
+    ) -> None:
+        match = request.resolver_match
+        record: dict[str, Any] = {
+            "method": request.method,
+            "path": request.path,
+            "view": match.view_name if match else None,
+            "status": response.status_code,
+            "duration_ms": round(duration * 1000, 2),
+            "db_queries": len(metrics.queries),
+            "db_ms": round(metrics.db_time * 1000, 2),
+            "template_ms": round(metrics.template_time * 1000, 2),
+            "cache_hits": metrics.cache_hits,
+            "cache_misses": metrics.cache_misses,
+        }
+        if record["duration_ms"] < settings.PERFORMANCE_SLOW_REQUEST_MS:
+            logger.info(json.dumps(record), extra={"performance": record})
+            return
+        record["top_queries"] = metrics.top_queries(
+            settings.PERFORMANCE_TOP_QUERIES,
+        )
+        logger.warning(json.dumps(record), extra={"performance": record})
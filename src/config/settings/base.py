@@ -1,7 +1,10 @@
+import importlib.util
 import os
 from pathlib import Path
+from typing import Any
 
 import dotenv
+from django.core.exceptions import ImproperlyConfigured
 
 dotenv.load_dotenv()
 
@@ -20,6 +23,10 @@ def load_bool(key: str, default: bool) -> bool:
     )
 
 
+def load_int(key: str, default: int) -> int:
+    return int(os.getenv(key, str(default)))
+
+
 def load_list(key: str, default: str | list) -> list:
     return os.getenv(
         key,
@@ -33,6 +40,7 @@ INSTALLED_APPS = [
     "src.apps.courses.apps.CoursesConfig",
     "src.apps.accounts.apps.AccountsConfig",
     "src.apps.homepage.apps.HomepageConfig",
+    "src.apps.tasks.apps.TasksConfig",
     "jazzmin",
     "django.contrib.admin",
     "django.contrib.auth",
@@ -40,6 +48,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "django_cleanup.apps.CleanupConfig",
 ]
 MIDDLEWARE = [
@@ -71,8 +80,14 @@ TEMPLATES = [
 
 ROOT_URLCONF = "src.config.urls"
 WSGI_APPLICATION = "src.config.wsgi.application"
+ASGI_APPLICATION = "src.config.asgi.application"
+
+# wsgi - синхронные воркеры gunicorn, asgi - воркеры uvicorn и
+# async-версии представлений чтения.
+SERVER_MODE = os.getenv("DJANGO_SERVER_MODE", "wsgi")
+ASYNC_VIEWS = SERVER_MODE == "asgi"
 
-DATABASES = {
+DATABASES: dict[str, dict[str, Any]] = {
     "default": {
         "ENGINE": "django.db.backends.postgresql",
         "NAME": os.getenv("POSTGRES_DB"),
@@ -80,9 +95,120 @@ DATABASES = {
         "PASSWORD": os.getenv("POSTGRES_PASSWORD"),
         "HOST": os.getenv("POSTGRES_HOST", "database"),
         "PORT": os.getenv("POSTGRES_PORT", "5432"),
+        # Под ASGI каждый запрос выполняет ORM в своём потоке, и
+        # постоянные соединения копились бы по одному на поток.
+        "CONN_MAX_AGE": load_int(
+            "DJANGO_DB_CONN_MAX_AGE",
+            0 if SERVER_MODE == "asgi" else 60,
+        ),
+        "CONN_HEALTH_CHECKS": load_bool("DJANGO_DB_CONN_HEALTH_CHECKS", True),
     },
 }
 
+# SQLite нужен, чтобы гонять тесты без сервера PostgreSQL: поиск тогда
+# ищет подстроку, а индексы PostgreSQL в миграциях пропускаются.
+DB_ENGINE = os.getenv("DJANGO_DB_ENGINE", "postgresql")
+if DB_ENGINE == "sqlite":
+    DATABASES["default"] = {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": os.getenv(
+            "DJANGO_DB_SQLITE_PATH",
+            str(BASE_DIR.parent / "db.sqlite3"),
+        ),
+    }
+elif DB_ENGINE != "postgresql":
+    raise ImproperlyConfigured(
+        f"DJANGO_DB_ENGINE={DB_ENGINE!r} is not one of postgresql, sqlite",
+    )
+
+if DB_ENGINE == "postgresql" and load_bool("DJANGO_DB_POOL", False):
+    # Пул psycopg 3 живёт внутри процесса, поэтому размер задаётся на
+    # один воркер gunicorn. Пул несовместим с CONN_MAX_AGE > 0.
+    # Django сообщает об отсутствии psycopg 3 лишь при первом запросе к
+    # БД, поэтому драйвер проверяется сразу при загрузке настроек.
+    pool_modules = ("psycopg", "psycopg_pool")
+    if not all(importlib.util.find_spec(name) for name in pool_modules):
+        raise ImproperlyConfigured(
+            "DJANGO_DB_POOL requires psycopg 3 with the pool extra: "
+            "poetry install --with pool",
+        )
+    DATABASES["default"]["CONN_MAX_AGE"] = 0
+    DATABASES["default"]["OPTIONS"] = {
+        "pool": {
+            "min_size": load_int("DJANGO_DB_POOL_MIN_SIZE", 1),
+            "max_size": load_int("DJANGO_DB_POOL_MAX_SIZE", 2),
+            "timeout": load_int("DJANGO_DB_POOL_TIMEOUT", 10),
+        },
+    }
+
+DATABASE_REPLICA_PIN_SECONDS = load_int("DJANGO_DB_REPLICA_PIN_SECONDS", 5)
+if DB_ENGINE == "postgresql" and os.getenv("POSTGRES_REPLICA_HOST"):
+    DATABASES["replica"] = {
+        **DATABASES["default"],
+        "OPTIONS": dict(DATABASES["default"].get("OPTIONS", {})),
+        "HOST": os.getenv("POSTGRES_REPLICA_HOST"),
+        "PORT": os.getenv(
+            "POSTGRES_REPLICA_PORT",
+            DATABASES["default"]["PORT"],
+        ),
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_ROUTERS = ["src.config.db_router.PrimaryReplicaRouter"]
+    MIDDLEWARE.insert(1, "src.config.db_router.PrimaryPinningMiddleware")
+
+CACHE_BACKENDS = {
+    "locmem": "django.core.cache.backends.locmem.LocMemCache",
+    "file": "django.core.cache.backends.filebased.FileBasedCache",
+    "redis": "django.core.cache.backends.redis.RedisCache",
+    "dummy": "django.core.cache.backends.dummy.DummyCache",
+}
+CACHE_BACKEND = os.getenv("DJANGO_CACHE_BACKEND", "locmem")
+if CACHE_BACKEND not in CACHE_BACKENDS:
+    raise ImproperlyConfigured(
+        f"DJANGO_CACHE_BACKEND={CACHE_BACKEND!r} is not one of "
+        f"{', '.join(CACHE_BACKENDS)}",
+    )
+CACHE_LOCATIONS = {
+    "locmem": "educa",
+    "file": str(BASE_DIR.parent / "cache"),
+    "redis": "redis://redis:6379/0",
+    "dummy": "",
+}
+CACHES = {
+    "default": {
+        "BACKEND": CACHE_BACKENDS[CACHE_BACKEND],
+        "LOCATION": (
+            os.getenv("DJANGO_CACHE_LOCATION")
+            or CACHE_LOCATIONS[CACHE_BACKEND]
+        ),
+        "TIMEOUT": load_int("DJANGO_CACHE_TIMEOUT", 300),
+        "KEY_PREFIX": os.getenv("DJANGO_CACHE_KEY_PREFIX", "educa"),
+        "VERSION": load_int("DJANGO_CACHE_VERSION", 1),
+    },
+}
+if CACHE_BACKEND in ("locmem", "file"):
+    # По умолчанию Django хранит 300 записей и чистит кэш почти на
+    # каждой записи, а фрагментов по одному на модуль намного больше.
+    CACHES["default"]["OPTIONS"] = {
+        "MAX_ENTRIES": load_int("DJANGO_CACHE_MAX_ENTRIES", 10000),
+    }
+
+PERFORMANCE_ENABLED = load_bool("DJANGO_PERFORMANCE_ENABLED", False)
+PERFORMANCE_SLOW_REQUEST_MS = load_int("DJANGO_PERFORMANCE_SLOW_MS", 500)
+PERFORMANCE_TOP_QUERIES = load_int("DJANGO_PERFORMANCE_TOP_QUERIES", 5)
+METRICS_ENABLED = load_bool("DJANGO_METRICS_ENABLED", False)
+METRICS_PATH = os.getenv(
+    "DJANGO_METRICS_PATH",
+    str(BASE_DIR.parent / "metrics" / "metrics.sqlite3"),
+)
+METRICS_FLUSH_SECONDS = load_int("DJANGO_METRICS_FLUSH_SECONDS", 1)
+METRICS_TOKEN = os.getenv("DJANGO_METRICS_TOKEN", "")
+if PERFORMANCE_ENABLED or METRICS_ENABLED:
+    MIDDLEWARE.insert(0, "src.config.performance.PerformanceMiddleware")
+    for cache_settings in CACHES.values():
+        cache_settings["INSTRUMENTED_BACKEND"] = cache_settings["BACKEND"]
+        cache_settings["BACKEND"] = "src.config.performance.InstrumentedCache"
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         "NAME": (
@@ -118,6 +244,50 @@ STATICFILES_DIRS = [BASE_DIR / "static"]
 
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
+MEDIA_ACCEL_REDIRECT = load_bool("DJANGO_MEDIA_ACCEL_REDIRECT", False)
+
+STORAGES = {
+    "default": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+    },
+    "staticfiles": {
+        "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage",
+    },
+    "blobs": {
+        "BACKEND": "src.apps.courses.storage.ContentAddressedStorage",
+    },
+}
+
+FILE_UPLOAD_HANDLERS = ["src.apps.courses.uploads.StreamingUploadHandler"]
+UPLOAD_STAGING_DIR = MEDIA_ROOT / "staging"
+UPLOAD_MAX_SIZES = {
+    "file": load_int("DJANGO_UPLOAD_MAX_FILE_MB", 200) * 2**20,
+    "image": load_int("DJANGO_UPLOAD_MAX_IMAGE_MB", 10) * 2**20,
+}
+# Аренда загрузки на время приёма куска; продлевается, пока данные идут.
+UPLOAD_LEASE_SECONDS = 60
+UPLOAD_EXPIRE_HOURS = load_int("DJANGO_UPLOAD_EXPIRE_HOURS", 24)
+
+IMAGE_VARIANT_WIDTHS = [160, 480, 960, 1600]
+IMAGE_VARIANT_FORMATS = load_list("DJANGO_IMAGE_VARIANT_FORMATS", "avif,webp")
+IMAGE_VARIANT_QUALITY = load_int("DJANGO_IMAGE_VARIANT_QUALITY", 75)
+
+# Лимит одновременно выполняемых задач каждой очереди во всех воркерах.
+TASK_QUEUES = {
+    "default": load_int("DJANGO_TASKS_DEFAULT_CONCURRENCY", 4),
+    "images": load_int("DJANGO_TASKS_IMAGES_CONCURRENCY", 2),
+}
+TASK_LEASE_SECONDS = load_int("DJANGO_TASKS_LEASE_SECONDS", 300)
+TASK_POLL_SECONDS = 1
+TASK_KEEP_DONE_SECONDS = 7 * 24 * 3600
+
+COURSE_DELETE_BATCH_SIZE = load_int("DJANGO_COURSE_DELETE_BATCH_SIZE", 500)
+
+# Конфигурация полнотекстового поиска PostgreSQL. Она входит в
+# выражения хранимых столбцов search_vector, поэтому после изменения
+# нужна миграция; russian разбирает и латиницу английским стеммером.
+SEARCH_CONFIG = "russian"
+SEARCH_PAGE_SIZE = 20
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
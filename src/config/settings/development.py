@@ -55,5 +55,10 @@ LOGGING = {
             "level": "DEBUG",
             "propagate": True,
         },
+        "src.config.performance": {
+            "handlers": ["console"],
+            "level": "INFO",
+            "propagate": False,
+        },
     },
 }
@@ -6,6 +6,8 @@ dotenv.load_dotenv()
 
 DEBUG = False
 
+MEDIA_ACCEL_REDIRECT = load_bool("DJANGO_MEDIA_ACCEL_REDIRECT", True)
+
 SECURE_SSL_REDIRECT = True
 CSRF_COOKIE_SECURE = True
 SESSION_COOKIE_SECURE = True
@@ -43,6 +45,10 @@ LOGGING = {
             "format": "{levelname} {asctime} {module} {message}",
             "style": "{",
         },
+        "message": {
+            "format": "{message}",
+            "style": "{",
+        },
     },
     "handlers": {
         "file": {
@@ -56,6 +62,11 @@ LOGGING = {
             "class": "logging.StreamHandler",
             "formatter": "verbose",
         },
+        "performance": {
+            "level": "INFO",
+            "class": "logging.StreamHandler",
+            "formatter": "message",
+        },
     },
     "loggers": {
         "django": {
@@ -63,5 +74,10 @@ LOGGING = {
             "level": "ERROR",
             "propagate": True,
         },
+        "src.config.performance": {
+            "handlers": ["performance"],
+            "level": "INFO",
+            "propagate": False,
+        },
     },
 }
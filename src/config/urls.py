@@ -1,15 +1,19 @@
 from django.conf import settings
 from django.conf.urls.static import static
 from django.contrib import admin
-from django.urls import include, path
+from django.urls import URLPattern, URLResolver, include, path
 
-urlpatterns = [
+from src.config.metrics import metrics_view
+
+urlpatterns: list[URLPattern | URLResolver] = [
     path("", include("src.apps.homepage.urls")),
     path("courses/", include("src.apps.courses.urls")),
     path("accounts/", include("src.apps.accounts.urls")),
     path("admin/", admin.site.urls),
 ]
 
+if settings.METRICS_ENABLED:
+    urlpatterns += [path("metrics", metrics_view, name="metrics")]
 
 if settings.DEBUG:
     urlpatterns += static(  # type: ignore
@@ -0,0 +1,111 @@
+from unittest import mock
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import User
+from django.http import HttpRequest, HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from src.config import db_router
+
+
+@override_settings(DATABASE_REPLICA_PIN_SECONDS=5)
+class PrimaryReplicaRouterTests(SimpleTestCase):
+    router: db_router.PrimaryReplicaRouter
+    factory: RequestFactory
+
+    def setUp(self) -> None:
+        self.router = db_router.PrimaryReplicaRouter()
+        self.factory = RequestFactory()
+
+    def run_request(
+        self,
+        request: HttpRequest,
+        write: bool = False,
+    ) -> tuple[HttpResponse, str]:
+        databases: list[str] = []
+
+        def view(request: HttpRequest) -> HttpResponse:
+            if write:
+                self.router.db_for_write(User)
+            databases.append(self.router.db_for_read(User))
+            return HttpResponse()
+
+        middleware = db_router.PrimaryPinningMiddleware(view)
+        return middleware(request), databases[0]
+
+    def test_safe_read_uses_replica(self) -> None:
+        """
+        Тест, что чтение в GET запросе идёт на реплику.
+        """
+        response, database = self.run_request(self.factory.get("/"))
+        self.assertEqual(database, db_router.REPLICA)
+        self.assertNotIn(db_router.PIN_COOKIE, response.cookies)
+
+    def test_unsafe_request_uses_primary(self) -> None:
+        """
+        Тест, что чтение в POST запросе идёт на основную БД.
+        """
+        response, database = self.run_request(self.factory.post("/"))
+        self.assertEqual(database, db_router.PRIMARY)
+
+    def test_write_pins_request_and_client(self) -> None:
+        """
+        Тест, что после записи запрос и следующие запросы клиента
+        читают с основной БД.
+        """
+        response, database = self.run_request(
+            self.factory.get("/"),
+            write=True,
+        )
+        self.assertEqual(database, db_router.PRIMARY)
+        self.assertEqual(
+            response.cookies[db_router.PIN_COOKIE]["max-age"],
+            5,
+        )
+
+    def test_pin_cookie_uses_primary(self) -> None:
+        """
+        Тест, что клиент с кукой закрепления читает с основной БД.
+        """
+        request = self.factory.get("/")
+        request.COOKIES[db_router.PIN_COOKIE] = "1"
+        response, database = self.run_request(request)
+        self.assertEqual(database, db_router.PRIMARY)
+
+    def test_transaction_uses_primary(self) -> None:
+        """
+        Тест, что внутри транзакции чтение идёт на основную БД.
+        """
+        connection = db_router.connections[db_router.PRIMARY]
+        with mock.patch.object(connection, "in_atomic_block", True):
+            response, database = self.run_request(self.factory.get("/"))
+        self.assertEqual(database, db_router.PRIMARY)
+
+    def test_pin_does_not_leak_between_requests(self) -> None:
+        """
+        Тест, что закрепление сбрасывается после запроса.
+        """
+        self.run_request(self.factory.post("/"), write=True)
+        response, database = self.run_request(self.factory.get("/"))
+        self.assertEqual(database, db_router.REPLICA)
+
+    async def test_async_write_in_thread_pins_client(self) -> None:
+        """
+        Тест, что запись ORM из потока sync_to_async в async-запросе
+        закрепляет клиента за основной БД.
+        """
+
+        async def view(request: HttpRequest) -> HttpResponse:
+            await sync_to_async(self.router.db_for_write)(User)
+            return HttpResponse()
+
+        middleware = db_router.PrimaryPinningMiddleware(view)
+        response = await middleware(self.factory.get("/"))
+        self.assertIn(db_router.PIN_COOKIE, response.cookies)
+
+    def test_migrations_only_on_primary(self) -> None:
+        """
+        Тест, что миграции применяются только к основной БД.
+        """
+        self.assertTrue(self.router.allow_migrate("default", "courses"))
+        self.assertFalse(self.router.allow_migrate("replica", "courses"))
@@ -0,0 +1,186 @@
+import tempfile
+import uuid
+from pathlib import Path
+
+from django.http import HttpRequest, HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from django.urls import resolve
+
+from src.config import metrics, performance
+
+
+class MetricsStoreTests(SimpleTestCase):
+    path: Path
+
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name) / "metrics.sqlite3"
+
+    def test_stores_are_summed(self) -> None:
+        """
+        Тест, что приращения разных процессов складываются в общем файле.
+        """
+        first = metrics.MetricsStore(self.path, flush_interval=60)
+        second = metrics.MetricsStore(self.path, flush_interval=60)
+        labels = (("view", "homepage:homepage"),)
+        first.inc("educa_db_queries_total", labels, 2)
+        second.inc("educa_db_queries_total", labels, 3)
+        second.flush()
+
+        self.assertEqual(
+            first.collect(),
+            [("educa_db_queries_total", labels, 5.0)],
+        )
+
+    def test_flush_interval(self) -> None:
+        """
+        Тест, что приращения сбрасываются в файл не чаще flush_interval.
+        """
+        store = metrics.MetricsStore(self.path, flush_interval=60)
+        reader = metrics.MetricsStore(self.path, flush_interval=60)
+        store.inc("educa_db_queries_total", (), 1)
+        self.assertEqual(reader.collect(), [])
+
+        store.flush_interval = 0
+        store.inc("educa_db_queries_total", (), 1)
+        self.assertEqual(
+            reader.collect(),
+            [("educa_db_queries_total", (), 2.0)],
+        )
+
+
+class RenderTests(SimpleTestCase):
+    def test_render_histogram_and_ratio(self) -> None:
+        """
+        Тест текстового формата: бакеты по возрастанию le, HELP/TYPE на
+        семейство и доля попаданий в кэш.
+        """
+        labels = (("view", "courses:manage_course_list"),)
+        text = metrics.render(
+            [
+                (
+                    "educa_request_duration_seconds_bucket",
+                    (*labels, ("le", "+Inf")),
+                    2,
+                ),
+                (
+                    "educa_request_duration_seconds_bucket",
+                    (*labels, ("le", "0.1")),
+                    1,
+                ),
+                ("educa_request_duration_seconds_count", labels, 2),
+                ("educa_request_duration_seconds_sum", labels, 0.35),
+                ("educa_cache_hits_total", labels, 3),
+                ("educa_cache_misses_total", labels, 1),
+            ],
+        )
+        lines = text.splitlines()
+        view = 'view="courses:manage_course_list"'
+
+        self.assertIn("# TYPE educa_request_duration_seconds histogram", lines)
+        self.assertLess(
+            lines.index(
+                f'educa_request_duration_seconds_bucket{{{view},le="0.1"}} 1',
+            ),
+            lines.index(
+                f'educa_request_duration_seconds_bucket{{{view},le="+Inf"}} 2',
+            ),
+        )
+        self.assertIn(
+            f"educa_request_duration_seconds_sum{{{view}}} 0.35",
+            lines,
+        )
+        self.assertIn("educa_cache_hit_ratio 0.75", lines)
+
+    def test_escape_labels(self) -> None:
+        """
+        Тест экранирования значений меток.
+        """
+        self.assertEqual(
+            metrics.format_labels((("view", 'a"b\\c'),)),
+            '{view="a\\"b\\\\c"}',
+        )
+
+
+class MetricsViewTests(SimpleTestCase):
+    factory: RequestFactory
+
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        settings = override_settings(
+            METRICS_ENABLED=True,
+            PERFORMANCE_ENABLED=False,
+            METRICS_PATH=str(Path(directory.name) / "metrics.sqlite3"),
+            METRICS_TOKEN="",
+        )
+        settings.enable()
+        self.addCleanup(settings.disable)
+        self.factory = RequestFactory()
+
+    def test_middleware_observes_request(self) -> None:
+        """
+        Тест, что middleware записывает запрос в гистограмму по имени урла
+        и считает байты multipart-загрузки.
+        """
+
+        def view(request: HttpRequest) -> HttpResponse:
+            return HttpResponse()
+
+        request = self.factory.post("/", {"title": "x"})
+        request.resolver_match = resolve("/")
+        performance.PerformanceMiddleware(view)(request)
+
+        text = metrics.metrics_view(self.factory.get("/metrics")).content
+        body = text.decode()
+        view_label = 'view="homepage:homepage"'
+        self.assertIn(
+            f'educa_request_duration_seconds_bucket{{{view_label},le="+Inf"}}'
+            " 1",
+            body,
+        )
+        self.assertIn(
+            f"educa_request_duration_seconds_count{{{view_label}}} 1",
+            body,
+        )
+        self.assertIn(f"educa_upload_bytes_total{{{view_label}}}", body)
+
+    def test_middleware_counts_upload_chunks(self) -> None:
+        """
+        Тест, что чанки возобновляемой загрузки в теле PUT учитываются
+        в объёме загрузок.
+        """
+
+        def view(request: HttpRequest) -> HttpResponse:
+            return HttpResponse(status=204)
+
+        path = f"/courses/uploads/{uuid.uuid4()}/"
+        request = self.factory.put(
+            path,
+            b"x" * 1024,
+            content_type="application/octet-stream",
+        )
+        request.resolver_match = resolve(path)
+        performance.PerformanceMiddleware(view)(request)
+
+        body = metrics.metrics_view(self.factory.get("/metrics")).content
+        self.assertIn(
+            b'educa_upload_bytes_total{view="courses:upload"} 1024',
+            body,
+        )
+
+    def test_token(self) -> None:
+        """
+        Тест, что при заданном токене эндпоинт требует Authorization.
+        """
+        with self.settings(METRICS_TOKEN="secret"):
+            forbidden = metrics.metrics_view(self.factory.get("/metrics"))
+            allowed = metrics.metrics_view(
+                self.factory.get(
+                    "/metrics",
+                    HTTP_AUTHORIZATION="Bearer secret",
+                ),
+            )
+        self.assertEqual(forbidden.status_code, 403)
+        self.assertEqual(allowed.status_code, 200)
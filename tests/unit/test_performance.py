@@ -0,0 +1,119 @@
+import json
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.http import HttpRequest, HttpResponse
+from django.template import engines
+from django.template.response import TemplateResponse
+from django.test import RequestFactory, TestCase, override_settings
+
+from src.config import performance
+
+CACHES = {
+    "default": {
+        "BACKEND": "src.config.performance.InstrumentedCache",
+        "INSTRUMENTED_BACKEND": (
+            "django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": "performance-tests",
+    },
+}
+
+
+@override_settings(
+    CACHES=CACHES,
+    METRICS_ENABLED=False,
+    PERFORMANCE_ENABLED=True,
+    PERFORMANCE_SLOW_REQUEST_MS=10_000,
+    PERFORMANCE_TOP_QUERIES=1,
+)
+class PerformanceMiddlewareTests(TestCase):
+    factory: RequestFactory
+
+    def setUp(self) -> None:
+        self.factory = RequestFactory()
+        cache.clear()
+
+    def view(self, request: HttpRequest) -> HttpResponse:
+        list(User.objects.all())
+        list(User.objects.filter(is_staff=True))
+        cache.set("present", 1)
+        cache.get("present")
+        cache.get("absent")
+        cache.get_many(["present", "absent"])
+        template = engines["django"].from_string("{{ value }}")
+        return TemplateResponse(request, template, {"value": "ok"})
+
+    def run_request(self) -> HttpResponse:
+        middleware = performance.PerformanceMiddleware(self.view)
+        request = self.factory.get("/")
+        response = middleware(request)
+        response = middleware.process_template_response(request, response)
+        return response.render()
+
+    def test_server_timing_header(self) -> None:
+        """
+        Тест, что заголовок Server-Timing содержит число SQL-запросов и
+        попадания в кэш.
+        """
+        with self.assertLogs("src.config.performance", "INFO"):
+            response = self.run_request()
+        timing = response["Server-Timing"]
+        self.assertIn('desc="2 queries"', timing)
+        self.assertIn('desc="2 hits, 2 misses"', timing)
+        self.assertIn("total;dur=", timing)
+
+    def test_log_line(self) -> None:
+        """
+        Тест, что запрос логируется одной JSON-строкой уровня INFO.
+        """
+        with self.assertLogs("src.config.performance", "INFO") as logs:
+            self.run_request()
+        [record] = logs.records
+        data = json.loads(record.getMessage())
+        self.assertEqual(record.levelname, "INFO")
+        self.assertEqual(data["db_queries"], 2)
+        self.assertEqual(data["cache_hits"], 2)
+        self.assertEqual(data["cache_misses"], 2)
+        self.assertEqual(data["status"], 200)
+        self.assertNotIn("top_queries", data)
+
+    @override_settings(PERFORMANCE_SLOW_REQUEST_MS=0)
+    def test_slow_request_logs_top_queries(self) -> None:
+        """
+        Тест, что медленный запрос логируется как WARNING с самыми
+        долгими SQL-запросами.
+        """
+        with self.assertLogs("src.config.performance", "INFO") as logs:
+            self.run_request()
+        [record] = logs.records
+        data = json.loads(record.getMessage())
+        self.assertEqual(record.levelname, "WARNING")
+        self.assertEqual(len(data["top_queries"]), 1)
+        self.assertIn("auth_user", data["top_queries"][0]["sql"])
+
+    def test_cache_outside_request(self) -> None:
+        """
+        Тест, что обёртка кэша работает и вне замеряемого запроса.
+        """
+        cache.set("key", "value")
+        self.assertEqual(cache.get("key"), "value")
+        self.assertEqual(cache.get("missing", "default"), "default")
+        self.assertIn("key", cache)
+
+    async def test_async_request(self) -> None:
+        """
+        Тест, что в async-режиме учитываются запросы ORM и кэша,
+        выполняемые в потоках sync_to_async.
+        """
+
+        async def view(request: HttpRequest) -> HttpResponse:
+            await User.objects.acount()
+            await cache.aget("absent")
+            return HttpResponse()
+
+        middleware = performance.PerformanceMiddleware(view)
+        with self.assertLogs("src.config.performance", "INFO"):
+            response = await middleware(self.factory.get("/"))
+        self.assertIn('desc="1 queries"', response["Server-Timing"])
+        self.assertIn('desc="0 hits, 1 misses"', response["Server-Timing"])